@@ -1,431 +1,292 @@
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import streamlit as st
 import pandas as pd
-from pulp import LpProblem, LpMinimize, LpMaximize, LpVariable, lpSum, LpStatus, value
 from io import StringIO
 
+from background import SolveJob
+from catalog import CATALOG, berry_csv, recipes, EXAMPLE_RECIPES
+from cache import SolveCache
+from curated import CuratedRecipes
+from engine import DonutEngine
+from farming import FarmAdvisor
+from incremental import IncrementalSolver
+from planner import ProductionPlanner
+from pool import SolverPool
+from recipe_index import RecipeIndex
+from translations import TRANSLATIONS
+import timing
+
 # ---------------------------------------------------------------------
 # 1. SETUP & TRANSLATIONS
 # ---------------------------------------------------------------------
 
 st.set_page_config(page_title="Z-A Donut Calculator", page_icon="🍩", layout="centered") 
 
-# Translation Dictionary
-TRANSLATIONS = {
-    "English 🇺🇸": {
-        "title": "🍩 Pokémon Legends: Z-A Donut Calculator",
-        "intro": """When you don't have many rare berries in your satchel, it can be difficult or annoying to check if you are able to create the donuts to battle the Legendary Pokémon. \nThis guide helps you figure out if it is possible to create each donut based on your inventory. \nIt also suggests an economical (using fewer rare berries) and a luxurious (using rare berries, giving full power) recipe.""",
-        "hope": "Hope this helps!",
-        "instructions_header": "Instructions:",
-        "step1": "1. Enter your **Inventory** in the table below (Look for the **✏️** column).",
-        "step2": "2. Select the **Donut** you want to craft.",
-        "step3": "3. Click **Calculate**.",
-        "select_label": "Select Target Donut:",
-        "examples_label": "💡 View Standard Recipes (Examples)",
-        "examples_col_name": "Recipe Name",
-        "examples_col_ing": "Ingredients",
-        "inventory_header": "Your Inventory",
-        "toggle_stats": "Show Berry Stats",
-        "toggle_help": "Check this to see detailed flavor values.",
-        "calc_button": "Calculate Recipes",
-        "eco_title": "Economy Recipe",
-        "eco_desc": "*Uses common berries (top of list).*",
-        "lux_title": "Luxury Recipe",
-        "lux_desc": "*Uses rare berries (bottom of list).*",
-        "stats_expand": "Show Required Flavor Stats",
-        "error_msg": "Not possible with current inventory.",
-        "slots": "Slots",
-        "cal": "Calories",
-        "boost": "Lv. Boost",
-        # Column Headers
-        "col_name": "Berry Name",
-        "col_inv": "✏️ Inventory",
-        "col_inv_help": "Enter the amount you have in your bag.",
-        "col_sweet": "🔒 Sweet",
-        "col_spicy": "🔒 Spicy",
-        "col_sour": "🔒 Sour",
-        "col_bitter": "🔒 Bitter",
-        "col_fresh": "🔒 Fresh",
-        "col_boost": "🔒 Lv. Boost",
-        "col_cal": "🔒 Cal"
-    },
-    "Deutsch 🇩🇪": {
-        "title": "🍩 Pokémon Legenden: Z-A Donut Rechner",
-        "intro": """Wenn man nicht viele seltene Beeren im Beutel hat, kann es nervig sein herauszufinden, ob man die Donuts für den Kampf gegen die Legendären Pokémon herstellen kann. \nDieser Guide hilft dir zu prüfen, ob ein Rezept mit deinem Inventar möglich ist. \nEr schlägt außerdem ein sparsames (wenige seltene Beeren) und ein luxuriöses (maximale Power) Rezept vor.""",
-        "hope": "Hoffentlich hilft das!",
-        "instructions_header": "Anleitung:",
-        "step1": "1. Trage dein **Inventar** unten in die Tabelle ein (Spalte mit **✏️**).",
-        "step2": "2. Wähle den **Donut**, den du backen möchtest.",
-        "step3": "3. Klicke auf **Berechnen**.",
-        "select_label": "Wähle den Ziel-Donut:",
-        "examples_label": "💡 Standard-Rezepte anzeigen (Beispiele)",
-        "examples_col_name": "Rezept-Name",
-        "examples_col_ing": "Zutaten",
-        "inventory_header": "Dein Inventar",
-        "toggle_stats": "Beeren-Werte anzeigen",
-        "toggle_help": "Anklicken, um Details zu Geschmack und Kalorien zu sehen.",
-        "calc_button": "Rezepte berechnen",
-        "eco_title": "Sparsammes Rezept",
-        "eco_desc": "*Nutzt häufige Beeren (oben in der Liste).* und spart Slots.",
-        "lux_title": "Luxus Rezept",
-        "lux_desc": "*Nutzt seltene Beeren (unten in der Liste) und füllt Slots auf.*",
-        "stats_expand": "Benötigte Geschmackswerte anzeigen",
-        "error_msg": "Mit dem aktuellen Inventar nicht machbar.",
-        "slots": "Plätze",
-        "cal": "Kalorien",
-        "boost": "Lv. Bonus",
-        "col_name": "Beere",
-        "col_inv": "✏️ Anzahl",
-        "col_inv_help": "Trage hier ein, wie viele du im Beutel hast.",
-        "col_sweet": "🔒 Süß",
-        "col_spicy": "🔒 Scharf",
-        "col_sour": "🔒 Sauer",
-        "col_bitter": "🔒 Bitter",
-        "col_fresh": "🔒 Frisch",
-        "col_boost": "🔒 Lv. Bonus",
-        "col_cal": "🔒 Kal"
-    },
-    "Français 🇫🇷": {
-        "title": "🍩 Calculateur de Beignets Pokémon Z-A",
-        "intro": "Il est parfois difficile de savoir si l'on peut cuisiner les beignets pour les Pokémon Légendaires. Ce guide vous aide à vérifier la faisabilité selon votre inventaire.",
-        "hope": "J'espère que cela aidera !",
-        "instructions_header": "Instructions :",
-        "step1": "1. Entrez votre **Inventaire** dans le tableau (Colonne **✏️**).",
-        "step2": "2. Sélectionnez le **Beignet**.",
-        "step3": "3. Cliquez sur **Calculer**.",
-        "select_label": "Choisir le Beignet :",
-        "examples_label": "💡 Voir Recettes Standards",
-        "examples_col_name": "Nom",
-        "examples_col_ing": "Ingrédients",
-        "inventory_header": "Votre Inventaire",
-        "toggle_stats": "Afficher les stats",
-        "toggle_help": "Voir les détails des saveurs.",
-        "calc_button": "Calculer les Recettes",
-        "eco_title": "Recette Économique",
-        "eco_desc": "*Utilise des baies communes.*",
-        "lux_title": "Recette Luxe",
-        "lux_desc": "*Utilise des baies rares.*",
-        "stats_expand": "Voir les stats requises",
-        "error_msg": "Impossible avec l'inventaire actuel.",
-        "slots": "Slots",
-        "cal": "Calories",
-        "boost": "Boost Niv.",
-        "col_name": "Baie",
-        "col_inv": "✏️ Qté",
-        "col_inv_help": "Quantité dans votre sac.",
-        "col_sweet": "🔒 Sucré",
-        "col_spicy": "🔒 Épicé",
-        "col_sour": "🔒 Acide",
-        "col_bitter": "🔒 Amer",
-        "col_fresh": "🔒 Frais",
-        "col_boost": "🔒 Boost",
-        "col_cal": "🔒 Cal"
-    },
-    "Italiano 🇮🇹": {
-        "title": "🍩 Calcolatore Ciambelle Pokémon Z-A",
-        "intro": "Controlla se hai abbastanza bacche per cucinare le ciambelle per i Pokémon Leggendari.",
-        "hope": "Spero sia d'aiuto!",
-        "instructions_header": "Istruzioni:",
-        "step1": "1. Inserisci il tuo **Inventario** nella tabella (Colonna **✏️**).",
-        "step2": "2. Seleziona la **Ciambella**.",
-        "step3": "3. Clicca su **Calcola**.",
-        "select_label": "Seleziona Ciambella:",
-        "examples_label": "💡 Vedi Ricette Standard",
-        "examples_col_name": "Nome",
-        "examples_col_ing": "Ingredienti",
-        "inventory_header": "Il tuo Inventario",
-        "toggle_stats": "Mostra statistiche",
-        "toggle_help": "Vedi i dettagli dei sapori.",
-        "calc_button": "Calcola Ricette",
-        "eco_title": "Ricetta Economica",
-        "eco_desc": "*Usa bacche comuni.*",
-        "lux_title": "Ricetta Lusso",
-        "lux_desc": "*Usa bacche rare.*",
-        "stats_expand": "Vedi statistiche richieste",
-        "error_msg": "Impossibile con l'inventario attuale.",
-        "slots": "Slot",
-        "cal": "Calorie",
-        "boost": "Liv. Boost",
-        "col_name": "Bacca",
-        "col_inv": "✏️ Qtà",
-        "col_inv_help": "Quantità nella borsa.",
-        "col_sweet": "🔒 Dolce",
-        "col_spicy": "🔒 Pepato",
-        "col_sour": "🔒 Aspro",
-        "col_bitter": "🔒 Amaro",
-        "col_fresh": "🔒 Fresco",
-        "col_boost": "🔒 Lv. Boost",
-        "col_cal": "🔒 Cal"
-    },
-    "Español 🇪🇸": {
-        "title": "🍩 Calculadora de Donas Pokémon Z-A",
-        "intro": "Comprueba si tienes suficientes bayas para cocinar las donas para los Pokémon Legendarios.",
-        "hope": "¡Espero que ayude!",
-        "instructions_header": "Instrucciones:",
-        "step1": "1. Introduce tu **Inventario** en la tabla (Columna **✏️**).",
-        "step2": "2. Selecciona la **Dona**.",
-        "step3": "3. Haz clic en **Calcular**.",
-        "select_label": "Seleccionar Dona:",
-        "examples_label": "💡 Ver Recetas Estándar",
-        "examples_col_name": "Nombre",
-        "examples_col_ing": "Ingredientes",
-        "inventory_header": "Tu Inventario",
-        "toggle_stats": "Mostrar estadísticas",
-        "toggle_help": "Ver detalles de sabor.",
-        "calc_button": "Calcular Recetas",
-        "eco_title": "Receta Económica",
-        "eco_desc": "*Usa bayas comunes.*",
-        "lux_title": "Receta de Lujo",
-        "lux_desc": "*Usa bayas raras.*",
-        "stats_expand": "Ver estadísticas requeridas",
-        "error_msg": "Imposible con el inventario actual.",
-        "slots": "Espacios",
-        "cal": "Calorías",
-        "boost": "Niv. Boost",
-        "col_name": "Baya",
-        "col_inv": "✏️ Cant.",
-        "col_inv_help": "Cantidad en tu bolsa.",
-        "col_sweet": "🔒 Dulce",
-        "col_spicy": "🔒 Picante",
-        "col_sour": "🔒 Ácido",
-        "col_bitter": "🔒 Amargo",
-        "col_fresh": "🔒 Fresco",
-        "col_boost": "🔒 Niv.+",
-        "col_cal": "🔒 Cal"
-    },
-    "Korean 🇰🇷": {
-        "title": "🍩 포켓몬 레전드 Z-A 도넛 계산기",
-        "intro": "전설의 포켓몬을 위한 도넛을 만들 재료가 충분한지 확인하세요.",
-        "hope": "도움이 되길 바랍니다!",
-        "instructions_header": "사용법:",
-        "step1": "1. 아래 표에 **가방(인벤토리)** 수량을 입력하세요 (**✏️** 열).",
-        "step2": "2. 만들고 싶은 **도넛**을 선택하세요.",
-        "step3": "3. **계산하기** 버튼을 누르세요.",
-        "select_label": "도넛 선택:",
-        "examples_label": "💡 추천 레시피 보기 (예시)",
-        "examples_col_name": "레시피 이름",
-        "examples_col_ing": "재료",
-        "inventory_header": "보유 열매",
-        "toggle_stats": "상세 스탯 표시",
-        "toggle_help": "맛과 칼로리 정보를 확인합니다.",
-        "calc_button": "레시피 계산",
-        "eco_title": "경제적인 레시피",
-        "eco_desc": "*흔한 열매 위주 사용.*",
-        "lux_title": "고급 레시피",
-        "lux_desc": "*희귀 열매 위주 사용.*",
-        "stats_expand": "필요 조건 보기",
-        "error_msg": "현재 재료로는 만들 수 없습니다.",
-        "slots": "슬롯",
-        "cal": "칼로리",
-        "boost": "레벨 부스트",
-        "col_name": "열매 이름",
-        "col_inv": "✏️ 수량",
-        "col_inv_help": "가방에 있는 수량을 입력하세요.",
-        "col_sweet": "🔒 단맛",
-        "col_spicy": "🔒 매운맛",
-        "col_sour": "🔒 신맛",
-        "col_bitter": "🔒 쓴맛",
-        "col_fresh": "🔒 떫은맛",
-        "col_boost": "🔒 Lv.+",
-        "col_cal": "🔒 Cal"
-    },
-    "Japanese 🇯🇵": {
-        "title": "🍩 ポケモンレジェンズZ-A ドーナツ計算機",
-        "intro": "伝説のポケモン用のドーナツを作るためのきのみが足りているか確認しましょう。",
-        "hope": "お役に立てば幸いです！",
-        "instructions_header": "使い方:",
-        "step1": "1. 下の表に**持ち物**の数を入力してください (**✏️** の列)。",
-        "step2": "2. 作りたい**ドーナツ**を選んでください。",
-        "step3": "3. **計算する**をクリックしてください。",
-        "select_label": "ドーナツを選択:",
-        "examples_label": "💡 標準レシピを表示 (例)",
-        "examples_col_name": "レシピ名",
-        "examples_col_ing": "材料",
-        "inventory_header": "バッグの中身",
-        "toggle_stats": "ステータスを表示",
-        "toggle_help": "味やカロリーの詳細を表示します。",
-        "calc_button": "レシピを計算",
-        "eco_title": "節約レシピ",
-        "eco_desc": "*手に入りやすいきのみを使用。*",
-        "lux_title": "豪華レシピ",
-        "lux_desc": "*レアなきのみを使用。*",
-        "stats_expand": "必要ステータスを見る",
-        "error_msg": "現在の持ち物では作れません。",
-        "slots": "スロット",
-        "cal": "カロリー",
-        "boost": "Lv.ブースト",
-        "col_name": "きのみ",
-        "col_inv": "✏️ 所持数",
-        "col_inv_help": "バッグに入っている数を入力。",
-        "col_sweet": "🔒 甘さ",
-        "col_spicy": "🔒 辛さ",
-        "col_sour": "🔒 酸っぱさ",
-        "col_bitter": "🔒 苦さ",
-        "col_fresh": "🔒 渋さ",
-        "col_boost": "🔒 Lv.UP",
-        "col_cal": "🔒 Cal"
-    },
-    "Mandarin 🇨🇳": {
-        "title": "🍩 宝可梦传说 Z-A 甜甜圈计算器",
-        "intro": "检查你是否有足够的树果来制作传说宝可梦的甜甜圈。",
-        "hope": "希望能帮到你！",
-        "instructions_header": "使用说明：",
-        "step1": "1. 在下表中输入你的**库存**数量（**✏️** 列）。",
-        "step2": "2. 选择你要制作的**甜甜圈**。",
-        "step3": "3. 点击**计算**。",
-        "select_label": "选择甜甜圈：",
-        "examples_label": "💡 查看标准配方 (示例)",
-        "examples_col_name": "配方名称",
-        "examples_col_ing": "配料",
-        "inventory_header": "你的库存",
-        "toggle_stats": "显示详细数值",
-        "toggle_help": "查看口味和卡路里详情。",
-        "calc_button": "计算配方",
-        "eco_title": "经济配方",
-        "eco_desc": "*使用常见树果。*",
-        "lux_title": "豪华配方",
-        "lux_desc": "*使用稀有树果。*",
-        "stats_expand": "查看所需数值",
-        "error_msg": "当前库存无法制作。",
-        "slots": "槽位",
-        "cal": "卡路里",
-        "boost": "等级提升",
-        "col_name": "树果名称",
-        "col_inv": "✏️ 数量",
-        "col_inv_help": "输入背包中的数量。",
-        "col_sweet": "🔒 甜",
-        "col_spicy": "🔒 辣",
-        "col_sour": "🔒 酸",
-        "col_bitter": "🔒 苦",
-        "col_fresh": "🔒 涩",
-        "col_boost": "🔒 Lv.+",
-        "col_cal": "🔒 Cal"
-    }
-}
-
-# The Data
-berry_csv = """
-Name,Sweet,Spicy,Sour,Bitter,Fresh,Lv_Boost,Cal
-Hyper Cheri,0,40,0,0,5,5,80
-Hyper Chesto,0,0,0,0,40,3,100
-Hyper Pecha,40,0,0,0,0,2,100
-Hyper Rawst,0,0,0,40,0,3,110
-Hyper Aspear,0,0,40,0,0,4,90
-Hyper Oran,10,20,15,15,0,6,90
-Hyper Persim,0,15,15,10,20,4,110
-Hyper Lum,20,15,10,0,15,3,110
-Hyper Sitrus,15,10,0,20,15,4,120
-Hyper Pomeg,30,35,0,0,5,7,140
-Hyper Kelpsy,5,0,0,30,35,5,160
-Hyper Qualot,35,0,30,5,0,4,160
-Hyper Hondew,0,5,35,0,30,6,150
-Hyper Grepa,0,60,25,0,5,8,140
-Hyper Tamato,5,25,0,0,40,6,180
-Hyper Occa,60,0,0,5,25,5,180
-Hyper Passho,25,0,5,60,0,6,200
-Hyper Wacan,0,5,60,25,0,7,160
-Hyper Rindo,15,55,0,5,25,9,210
-Hyper Yache,25,0,5,15,55,7,250
-Hyper Chople,55,5,15,25,0,6,250
-Hyper Kebia,0,15,25,55,5,7,270
-Hyper Shuca,5,25,55,0,15,8,230
-Hyper Coba,10,95,0,10,5,10,240
-Hyper Payapa,5,0,10,10,95,8,300
-Hyper Tanga,95,10,10,5,0,7,300
-Hyper Charti,0,10,5,95,10,8,330
-Hyper Kasib,10,5,95,0,10,9,270
-Hyper Haban,85,0,0,0,65,8,370
-Hyper Colbur,0,0,65,0,85,9,370
-Hyper Babiri,0,0,65,85,0,9,400
-Hyper Chilan,0,85,0,65,0,9,370
-Hyper Roseli,0,65,85,0,0,10,340
-"""
-
-recipes = {
-    "Darkrai (Bad Dream Cruller)":    {"Sweet":310, "Spicy":100, "Sour":310, "Bitter":40,  "Fresh":40},
-    "Groudon (Omega Old-Fashioned)":  {"Sweet":260, "Spicy":160, "Sour":160, "Bitter":20,  "Fresh":260},
-    "Kyogre (Alpha Old-Fashioned)":   {"Sweet":50,  "Spicy":50,  "Sour":210, "Bitter":180, "Fresh":370},
-    "Rayquaza (Delta Old-Fashioned)": {"Sweet":120, "Spicy":40,  "Sour":340, "Bitter":40,  "Fresh":390},
-    "Zeraora (Plasma-Glazed)":        {"Sweet":40,  "Spicy":200, "Sour":400, "Bitter":280, "Fresh":40}
-}
-
-# --- EXAMPLE RECIPES DATA (4 Examples per Donut) ---
-# Constraint 1: "Rainbow Variety" - Max 1 berry per type (approx).
-# Constraint 2: "Balanced Pair" - Max 2 berries per type.
-# Constraint 3/4: "Bulk/Specialized" - Unrestricted.
-EXAMPLE_RECIPES = {
-    "Darkrai (Bad Dream Cruller)": [
-        {"Name": "Rainbow Dream (Variety)", "Ingredients": "1x Tanga, 1x Kasib, 1x Colbur, 1x Payapa, 1x Roseli, 1x Haban, 1x Yache, 1x Chople"},
-        {"Name": "Balanced Nightmare", "Ingredients": "2x Hyper Tanga, 2x Hyper Kasib, 2x Hyper Roseli, 1x Hyper Colbur"},
-        {"Name": "Sour Punch (Bulk)", "Ingredients": "4x Hyper Payapa, 2x Hyper Colbur"},
-        {"Name": "Sweet Darkness (Bulk)", "Ingredients": "3x Hyper Tanga, 3x Hyper Kasib, 1x Hyper Coba"}
-    ],
-    "Groudon (Omega Old-Fashioned)": [
-        {"Name": "Earthy Rainbow (Variety)", "Ingredients": "1x Tanga, 1x Grepa, 1x Pomeg, 1x Occa, 1x Hondew, 1x Qualot, 1x Tamato"},
-        {"Name": "Magma Duo (Balanced)", "Ingredients": "2x Hyper Tanga, 2x Hyper Grepa, 2x Hyper Tamato, 1x Hyper Pomeg"},
-        {"Name": "Heat Wave (Bulk)", "Ingredients": "4x Hyper Chilan, 3x Hyper Cheri"},
-        {"Name": "Volcanic Ash", "Ingredients": "3x Hyper Tanga, 3x Hyper Occa, 2x Hyper Shuca"}
-    ],
-    "Kyogre (Alpha Old-Fashioned)": [
-        {"Name": "Ocean Palette (Variety)", "Ingredients": "1x Kelpsy, 1x Hondew, 1x Chesto, 1x Rawst, 1x Passho, 1x Aspear, 1x Sitrus"},
-        {"Name": "Tidal Pairs (Balanced)", "Ingredients": "2x Hyper Kelpsy, 2x Hyper Chesto, 2x Hyper Passho, 1x Hyper Rawst"},
-        {"Name": "Deep Blue (Bulk)", "Ingredients": "3x Hyper Kelpsy, 3x Hyper Hondew"},
-        {"Name": "Storm Surge", "Ingredients": "4x Hyper Passho, 4x Hyper Chesto"}
-    ],
-    "Rayquaza (Delta Old-Fashioned)": [
-        {"Name": "Sky Spectrum (Variety)", "Ingredients": "1x Yache, 1x Coba, 1x Wacan, 1x Haban, 1x Roseli, 1x Babiri, 1x Charti"},
-        {"Name": "Ozone Layer (Balanced)", "Ingredients": "2x Hyper Yache, 2x Hyper Wacan, 2x Hyper Haban, 1x Hyper Coba"},
-        {"Name": "Dragon Ascent (Bulk)", "Ingredients": "3x Hyper Yache, 3x Hyper Coba, 2x Hyper Roseli"},
-        {"Name": "Air Lock", "Ingredients": "4x Hyper Haban, 4x Hyper Wacan"}
-    ],
-    "Zeraora (Plasma-Glazed)": [
-        {"Name": "Spark Mix (Variety)", "Ingredients": "1x Shuca, 1x Chople, 1x Cheri, 1x Wacan, 1x Occa, 1x Grepa, 1x Rindo"},
-        {"Name": "Voltage Pairs (Balanced)", "Ingredients": "2x Hyper Shuca, 2x Hyper Chople, 2x Hyper Grepa, 1x Hyper Occa"},
-        {"Name": "Plasma Fist (Bulk)", "Ingredients": "3x Hyper Shuca, 3x Hyper Chople"},
-        {"Name": "Thunderclap", "Ingredients": "4x Hyper Cheri, 2x Hyper Wacan, 2x Hyper Grepa"}
-    ]
-}
-
-# Load Data
-df = pd.read_csv(StringIO(berry_csv))
-if "Inventory" not in df.columns:
-    df["Inventory"] = 0
+# Per-phase timing: ?debug=1 shows the performance panel at the bottom,
+# DONUT_PERF_LOG=1 logs every rerun as a JSON line. Otherwise it's a no-op.
+debug_mode = st.query_params.get("debug") == "1"
+perf_log = os.environ.get("DONUT_PERF_LOG") == "1"
+timer = timing.PhaseTimer(enabled=debug_mode or perf_log, label="rerun")
+timing.activate(timer)
+if perf_log:
+    timing.enable_logging()
+
+# Limits for the single-donut solve: DONUT_TIME_LIMIT seconds (0 for none) and
+# DONUT_GAP, a relative optimality gap (0.02 accepts a recipe within 2%).
+solve_time_limit = float(os.environ.get("DONUT_TIME_LIMIT", 10)) or None
+solve_gap = float(os.environ.get("DONUT_GAP", 0))
+# The production plan and schedule get the same time limit per solve, and an
+# integer model over at most PLAN_COLUMNS patterns (see planner.py).
+PLAN_COLUMNS = 1000
 
 # ---------------------------------------------------------------------
 # 2. FUNCTIONS
 # ---------------------------------------------------------------------
 
-def solve_donut(data, target_stats, mode="min"):
-    sense = LpMinimize if mode == "min" else LpMaximize
-    prob = LpProblem("DonutOpt", sense)
-    
-    berry_vars = {}
-    for i, row in data.iterrows():
-        name = row['Name']
-        berry_vars[name] = LpVariable(f"count_{name}", lowBound=0, upBound=row['Inventory'], cat='Integer')
-
-    objective_terms = []
-    for i, row in data.iterrows():
-        objective_terms.append((i + 1) * berry_vars[row['Name']])
-    
-    prob += lpSum(objective_terms)
-
-    for stat in ["Sweet", "Spicy", "Sour", "Bitter", "Fresh"]:
-        prob += lpSum([data.loc[i, stat] * berry_vars[data.loc[i, 'Name']] for i in data.index]) >= target_stats[stat]
-        
-    prob += lpSum(berry_vars.values()) <= 8
-    
-    prob.solve()
-    
-    if LpStatus[prob.status] == "Optimal":
-        results = []
-        for i, row in data.iterrows():
-            name = row['Name']
-            val = value(berry_vars[name])
-            if val > 0:
-                results.append({"Berry": name, "Count": int(val), "Cal": row['Cal'], "Lv_Boost": row['Lv_Boost']})
-        return results
-    else:
-        return None
+@st.cache_resource
+def get_engine():
+    # One engine per process, built from the compiled catalog and shared read-only.
+    engine = DonutEngine.from_catalog(CATALOG, backend=os.environ.get("DONUT_SOLVER", "auto"))
+    engine.recipe_index = RecipeIndex.load(engine)
+    # Results are shared across all sessions; set DONUT_CACHE_PATH to keep them across
+    # restarts (at most DONUT_CACHE_DISK_SIZE of them).
+    engine.cache = SolveCache(
+        maxsize=int(os.environ.get("DONUT_CACHE_SIZE", 4096)),
+        path=os.environ.get("DONUT_CACHE_PATH"),
+        fingerprint=engine.fingerprint,
+        disk_maxsize=int(os.environ.get("DONUT_CACHE_DISK_SIZE", 100_000)),
+    )
+    return engine
+
+@st.cache_resource
+def get_pool():
+    # Shared by all sessions. DONUT_POOL=process spreads pure-Python solves over every core.
+    workers = os.environ.get("DONUT_WORKERS")
+    return SolverPool(get_engine(), workers=int(workers) if workers else None, kind=os.environ.get("DONUT_POOL", "thread"))
+
+@st.cache_resource
+def get_solve_executor():
+    # Background threads for SolveJobs, shared by all sessions.
+    workers = os.environ.get("DONUT_JOB_THREADS")
+    return ThreadPoolExecutor(max_workers=int(workers) if workers else None, thread_name_prefix="donut-job")
+
+@st.cache_resource
+def get_curated():
+    # EXAMPLE_RECIPES parsed and checked once; invalid examples are logged here.
+    return CuratedRecipes(get_engine())
+
+@st.cache_resource
+def get_planner():
+    return ProductionPlanner(get_engine())
+
+@st.cache_resource
+def get_farm_advisor():
+    return FarmAdvisor(get_engine())
+
+# Static tables are built once per process and shared by every session, so a
+# rerun doesn't re-parse the CSV or rebuild column configs. Treat them as
+# read-only: the session's berry counts live in st.session_state["inventory"].
+@st.cache_resource
+def get_berry_table():
+    table = pd.read_csv(StringIO(berry_csv))
+    table.insert(1, "Inventory", 0)
+    return table
+
+@st.cache_resource
+def get_column_config(lang):
+    labels = TRANSLATIONS[lang]
+    return {
+        "Name": st.column_config.TextColumn(labels["col_name"], disabled=True, width="medium"),
+        "Inventory": st.column_config.NumberColumn(
+            labels["col_inv"], 
+            help=labels["col_inv_help"],
+            min_value=0, step=1, required=True, width="small"
+        ),
+        "Sweet": st.column_config.NumberColumn(labels["col_sweet"], disabled=True, width="small"),
+        "Spicy": st.column_config.NumberColumn(labels["col_spicy"], disabled=True, width="small"),
+        "Sour": st.column_config.NumberColumn(labels["col_sour"], disabled=True, width="small"),
+        "Bitter": st.column_config.NumberColumn(labels["col_bitter"], disabled=True, width="small"),
+        "Fresh": st.column_config.NumberColumn(labels["col_fresh"], disabled=True, width="small"),
+        "Lv_Boost": st.column_config.NumberColumn(labels["col_boost"], disabled=True, width="small"),
+        "Cal": st.column_config.NumberColumn(labels["col_cal"], disabled=True, width="small"),
+    }
+
+@st.cache_resource
+def get_example_table(donut, lang):
+    labels = TRANSLATIONS[lang]
+    table = pd.DataFrame(EXAMPLE_RECIPES[donut])
+    table["Valid"] = ["⚠️" if recipe.problems else "✅" for recipe in get_curated().recipes[donut]]
+    return table.rename(columns={
+        "Name": labels["examples_col_name"],
+        "Ingredients": labels["examples_col_ing"],
+        "Valid": labels["examples_col_ok"],
+    })
+
+def index_covers(donuts):
+    # The farm advisor and planner work off the recipe index only (see
+    # recipe_index.minimal_recipes); without it they are switched off.
+    index = get_engine().recipe_index
+    return index is not None and all(index.covers(donut) for donut in donuts)
+
+def get_session_solver():
+    # Per session: remembers this user's last optimum per donut and mode, so
+    # recalculating after a small edit usually skips the solver entirely.
+    if "solver" not in st.session_state:
+        st.session_state["solver"] = IncrementalSolver(get_engine())
+    return st.session_state["solver"]
+
+def apply_inventory_edits():
+    # edited_rows holds every edit since the editor was created ({row: {column: value}}),
+    # so re-applying all of it to the int array is idempotent.
+    inventory = st.session_state["inventory"]
+    for row, changes in st.session_state["inventory_editor"]["edited_rows"].items():
+        if "Inventory" in changes:
+            inventory[int(row)] = max(int(changes["Inventory"] or 0), 0)
+
+def recipe_summary(engine, counts):
+    if counts is None:
+        return "❌"
+    return ", ".join(f"{int(counts[i])}x {engine.names[i]}" for i in counts.nonzero()[0])
+
+def display_all(results, engine, labels_dict):
+    # One row per donut: feasibility plus both recipes.
+    rows = []
+    for donut, by_mode in results.items():
+        rows.append({
+            labels_dict["all_col_donut"]: donut,
+            labels_dict["all_col_possible"]: "✅" if by_mode["min"] is not None else "❌",
+            labels_dict["eco_title"]: recipe_summary(engine, by_mode["min"]),
+            labels_dict["lux_title"]: recipe_summary(engine, by_mode["max"]),
+        })
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+def display_plan(plan, engine, labels_dict):
+    if not plan["batches"]:
+        st.error(labels_dict["plan_none"])
+        return
+    rows = [{
+        labels_dict["all_col_donut"]: batch["donut"],
+        labels_dict["plan_times"]: batch["times"],
+        labels_dict["eco_title"]: recipe_summary(engine, batch["counts"]),
+    } for batch in plan["batches"]]
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+    st.markdown(f"**{labels_dict['plan_total']}:** {sum(plan['made'].values())}")
+    if not plan["proven"]:
+        st.caption(labels_dict["plan_unproven"])
+
+def display_schedule(schedule, engine, labels_dict):
+    rows = [{
+        labels_dict["sched_day"]: day,
+        labels_dict["all_col_donut"]: batch["donut"],
+        labels_dict["plan_times"]: batch["times"],
+        labels_dict["eco_title"]: recipe_summary(engine, batch["counts"]),
+    } for day, batches in enumerate(schedule["days"], start=1) for batch in batches]
+    if not rows:
+        st.error(labels_dict["sched_none"])
+        return
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+    st.markdown(f"**{labels_dict['plan_total']}:** {sum(schedule['made'].values())}")
+    if not schedule["proven"]:
+        st.caption(labels_dict["plan_unproven"])
+
+def display_alternatives(found, engine, labels_dict):
+    if not found:
+        st.error(labels_dict["alt_none"])
+        return
+    rows = [{
+        labels_dict["alt_rank"]: rank,
+        labels_dict["alt_recipe"]: recipe_summary(engine, counts),
+        labels_dict["slots"]: int(counts.sum()),
+        labels_dict["cal"]: int(counts @ engine.cal),
+        labels_dict["boost"]: int(counts @ engine.boost),
+    } for rank, counts in enumerate(found, start=1)]
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+def display_pareto(front, engine, labels_dict):
+    if not front:
+        st.error(labels_dict["error_msg"])
+        return
+    table = pd.DataFrame([{
+        labels_dict["alt_rank"]: rank,
+        labels_dict["pareto_rarity"]: int(counts @ engine.weights),
+        labels_dict["boost"]: int(counts @ engine.boost),
+        labels_dict["cal"]: int(counts @ engine.cal),
+        labels_dict["alt_recipe"]: recipe_summary(engine, counts),
+    } for rank, counts in enumerate(front, start=1)])
+    st.caption(labels_dict["pareto_help"])
+    st.scatter_chart(table, x=labels_dict["pareto_rarity"], y=labels_dict["boost"], color=labels_dict["cal"])
+    st.dataframe(table, hide_index=True, use_container_width=True)
+    pick = st.selectbox(labels_dict["pareto_pick"], range(1, len(front) + 1), format_func=lambda r: f"#{r}")
+    display_recipe(engine.recipe(front[pick - 1]), f"#{pick}", "", labels_dict, "🔷")
+
+def display_shortfall(shortfalls, labels_dict):
+    # Why a donut can't be made: each flavor the inventory can't reach, and by how much.
+    st.markdown(f"**{labels_dict['short_header']}**")
+    if not shortfalls:
+        st.caption(labels_dict["short_joint"])
+        return
+    names = {"Total": labels_dict["short_total"]}
+    st.dataframe(pd.DataFrame([{
+        labels_dict["short_flavor"]: names.get(s.flavor) or labels_dict[f"col_{s.flavor.lower()}"].replace("🔒", "").strip(),
+        labels_dict["short_needed"]: s.needed,
+        labels_dict["short_best"]: s.reachable,
+        labels_dict["short_missing"]: s.needed - s.reachable,
+    } for s in shortfalls]), hide_index=True, use_container_width=True)
+
+def display_farm_plan(plan, engine, labels_dict):
+    if plan.cost is None:
+        st.error(labels_dict["farm_impossible"])
+        return
+    if plan.cost == 0:
+        st.success(labels_dict["farm_ready"])
+        return
+    st.markdown(f"**{labels_dict['farm_collect']}:** {recipe_summary(engine, plan.extra)}")
+    st.caption(f"{labels_dict['farm_then']}: {recipe_summary(engine, plan.recipe)}")
+
+def display_farm_all(plans, engine, labels_dict):
+    def collect(plan):
+        if plan.cost is None:
+            return f"❌ {labels_dict['farm_impossible']}"
+        return "✅" if plan.cost == 0 else recipe_summary(engine, plan.extra)
+    rows = [{
+        labels_dict["all_col_donut"]: donut,
+        labels_dict["farm_collect"]: collect(plan),
+    } for donut, plan in plans.items()]
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
+
+def display_marginal_values(values, labels_dict):
+    def gain(value):
+        if value.extra == 0:
+            return labels_dict["farm_no_effect"]
+        return labels_dict["farm_unlocks"] if value.gain is None else f"-{value.gain}"
+    st.markdown(f"**{labels_dict['farm_rank']}**")
+    st.dataframe(pd.DataFrame([{
+        labels_dict["col_name"]: value.berry,
+        labels_dict["farm_extra"]: f"+{value.extra}" if value.extra else "",
+        labels_dict["farm_after"]: value.objective,
+        labels_dict["farm_gain"]: gain(value),
+    } for value in values]), hide_index=True, use_container_width=True)
+
+def display_perf_panel(timer, history):
+    with st.expander("🛠️ Performance (debug)"):
+        record = timer.as_dict()
+        st.markdown(f"**This rerun:** {record['total_ms']:.1f} ms")
+        st.dataframe(
+            pd.DataFrame([{"Phase": name, "ms": ms} for name, ms in record["phases_ms"].items()]),
+            hide_index=True, use_container_width=True,
+        )
+        if record["solves"]:
+            st.dataframe(pd.DataFrame(record["solves"]), hide_index=True, use_container_width=True)
+        st.markdown(f"**Session (last {len(history)} reruns)**")
+        st.dataframe(pd.DataFrame(timing.summarize(history)).T, use_container_width=True)
+        if get_engine().cache is not None:
+            st.json(get_engine().cache.stats())
+        st.json(get_session_solver().stats())
 
 def display_recipe(results, title, desc, labels_dict, color_emoji):
     if results:
@@ -447,6 +308,46 @@ def display_recipe(results, title, desc, labels_dict, color_emoji):
     else:
         st.error(f"### {color_emoji} {title}\n{labels_dict['error_msg']}")
 
+def job_progress_text(job, t):
+    parts = [t["solve_progress"].format(elapsed=job.elapsed())]
+    for mode, title in (("min", t["eco_title"]), ("max", t["lux_title"])):
+        state = "✓" if job.finished(mode) else t["solve_nodes"].format(nodes=job.progress[mode][0])
+        parts.append(f"{title}: {state}")
+    return "  |  ".join(parts)
+
+def wait_for_job(job, t):
+    # Polls the background solve until it is done, with a progress bar and a
+    # Cancel button. Clicking Cancel reruns the script, which lands back here
+    # with the button set.
+    if job.poll():
+        return
+    cancel_slot = st.empty()
+    if cancel_slot.button(t["solve_cancel"], key="solve_cancel"):
+        job.cancel(grace=0.5)
+        cancel_slot.empty()
+        return
+    bar = st.progress(0.0, text=job_progress_text(job, t))
+    while not job.poll():
+        time.sleep(0.1)
+        fraction = min(job.elapsed() / job.time_limit, 1.0) if job.time_limit else 0.0
+        bar.progress(fraction, text=job_progress_text(job, t))
+    bar.empty()
+    cancel_slot.empty()
+
+def display_outcome(outcome, engine, title, desc, t, color_emoji, gap):
+    # display_recipe, plus a label when the recipe isn't proven optimal.
+    if outcome.status in ("Time limit", "Cancelled"):
+        if outcome.counts is None:
+            message = t["solve_timeout"] if outcome.status == "Time limit" else t["solve_cancelled"]
+            st.warning(f"### {color_emoji} {title}\n{message}")
+        else:
+            display_recipe(engine.recipe(outcome.counts), f"{title} ({t['solve_incumbent']})", desc, t, color_emoji)
+            st.caption(f"⚠️ {t['solve_incumbent_desc']}")
+        return
+    display_recipe(None if outcome.counts is None else engine.recipe(outcome.counts), title, desc, t, color_emoji)
+    if gap and outcome.counts is not None:
+        st.caption(t["solve_gap"].format(gap=gap))
+
 # ---------------------------------------------------------------------
 # 3. UI LAYOUT
 # ---------------------------------------------------------------------
@@ -470,14 +371,12 @@ st.markdown("---")
 # --- INPUT SECTION ---
 
 target_donut_name = st.selectbox(t["select_label"], list(recipes.keys()))
+evaluate_all = st.checkbox(t["all_toggle"], value=False, help=t["all_help"])
 
 # --- NEW: EXAMPLE RECIPES EXPANDER ---
 if target_donut_name in EXAMPLE_RECIPES:
     with st.expander(t["examples_label"]):
-        example_df = pd.DataFrame(EXAMPLE_RECIPES[target_donut_name])
-        # Rename columns for the language
-        example_df = example_df.rename(columns={"Name": t["examples_col_name"], "Ingredients": t["examples_col_ing"]})
-        st.table(example_df)
+        st.table(get_example_table(target_donut_name, selected_lang))
 
 st.subheader(t["inventory_header"])
 
@@ -489,57 +388,181 @@ cols_to_show = ["Name", "Inventory"]
 if show_stats:
     cols_to_show += ["Sweet", "Spicy", "Sour", "Bitter", "Fresh", "Lv_Boost", "Cal"]
 
-# Filter the dataframe for display
-df_display = df[cols_to_show]
-
-# Configuration for the table columns (Mapping English Data -> Translated Labels)
-column_cfg = {
-    "Name": st.column_config.TextColumn(t["col_name"], disabled=True, width="medium"),
-    "Inventory": st.column_config.NumberColumn(
-        t["col_inv"], 
-        help=t["col_inv_help"],
-        min_value=0, step=1, required=True, width="small"
-    ),
-    "Sweet": st.column_config.NumberColumn(t["col_sweet"], disabled=True, width="small"),
-    "Spicy": st.column_config.NumberColumn(t["col_spicy"], disabled=True, width="small"),
-    "Sour": st.column_config.NumberColumn(t["col_sour"], disabled=True, width="small"),
-    "Bitter": st.column_config.NumberColumn(t["col_bitter"], disabled=True, width="small"),
-    "Fresh": st.column_config.NumberColumn(t["col_fresh"], disabled=True, width="small"),
-    "Lv_Boost": st.column_config.NumberColumn(t["col_boost"], disabled=True, width="small"),
-    "Cal": st.column_config.NumberColumn(t["col_cal"], disabled=True, width="small"),
-}
-
-# The Data Editor
-edited_df = st.data_editor(
-    df_display,
-    column_config=column_cfg,
-    hide_index=True,
-    use_container_width=True,
-    num_rows="fixed", 
-    height=600 if show_stats else 400
-)
-
-# SYNC LOGIC
-df.set_index("Name", inplace=True)
-df_display_indexed = edited_df.set_index("Name")
-df.update(df_display_indexed[["Inventory"]])
-df.reset_index(inplace=True)
+berry_table = get_berry_table()
+if "inventory" not in st.session_state:
+    st.session_state["inventory"] = np.zeros(len(berry_table), dtype=np.int64)
+inventory = st.session_state["inventory"]
+
+# The Data Editor. Edits land in the session's inventory array through the
+# callback; the returned frame isn't needed.
+with timer.phase("editor"):
+    st.data_editor(
+        berry_table.assign(Inventory=inventory),
+        column_order=cols_to_show,
+        column_config=get_column_config(selected_lang),
+        hide_index=True,
+        use_container_width=True,
+        num_rows="fixed", 
+        height=600 if show_stats else 400,
+        key="inventory_editor",
+        on_change=apply_inventory_edits,
+    )
 
 st.markdown("---")
 
-if st.button(t["calc_button"], type="primary", use_container_width=True):
-    target_stats = recipes[target_donut_name]
-    
-    economy_res = solve_donut(df, target_stats, mode="min")
-    luxury_res = solve_donut(df, target_stats, mode="max")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        display_recipe(economy_res, t["eco_title"], t["eco_desc"], t, "🟢")
-        
-    with col2:
-        display_recipe(luxury_res, t["lux_title"], t["lux_desc"], t, "🟣")
+calc_clicked = st.button(t["calc_button"], type="primary", use_container_width=True)
+engine = get_engine()
+
+if calc_clicked and evaluate_all:
+    # All 5 x 2 solves run concurrently on the shared pool.
+    with timer.phase("solve_all"):
+        all_results = get_pool().solve_all(inventory)
+    with timer.phase("display"):
+        display_all(all_results, engine, t)
+
+# The single-donut solve runs as a background SolveJob kept in the session,
+# so its result survives unrelated reruns. Changing the donut or the bag (or
+# switching to all donuts) makes it stale: it is cancelled and dropped.
+job = st.session_state.get("solve_job")
+if job is not None and (evaluate_all or job.donut != target_donut_name or not np.array_equal(job.inventory, inventory)):
+    job.cancel()
+    job = st.session_state["solve_job"] = None
+if calc_clicked and not evaluate_all:
+    if job is not None:
+        job.cancel()
+    job = st.session_state["solve_job"] = SolveJob(
+        get_solve_executor(), get_session_solver(), target_donut_name, inventory,
+        time_limit=solve_time_limit, gap=solve_gap, abandon_after=10.0,
+    )
+
+if job is not None:
+    # Curated recipes the bag covers are a dominance check away; they go
+    # out to the browser before the optimizer is waited on.
+    for match in get_curated().matches(target_donut_name, inventory):
+        display_recipe(engine.recipe(match.counts), f"{t['curated_title']}: {match.name}", t["curated_desc"], t, "⭐")
+
+    with timer.phase("solve"):
+        wait_for_job(job, t)
+
+    with timer.phase("display"):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            display_outcome(job.outcome("min"), engine, t["eco_title"], t["eco_desc"], t, "🟢", job.gap)
+
+        with col2:
+            display_outcome(job.outcome("max"), engine, t["lux_title"], t["lux_desc"], t, "🟣", job.gap)
+
+        if job.outcome("min").status == "Infeasible":
+            display_shortfall(engine.screen(target_donut_name, inventory), t)
 
     with st.expander(t["stats_expand"]):
-        st.write(target_stats)
+        st.write(recipes[target_donut_name])
+
+# --- ALTERNATIVE RECIPES ---
+with st.expander(t["alt_header"]):
+    alt_mode = st.radio(t["alt_mode"], ["min", "max"], format_func=lambda m: t["eco_title"] if m == "min" else t["lux_title"], horizontal=True)
+    alt_k = st.slider(t["alt_k"], min_value=1, max_value=50, value=10)
+    alt_exclude = st.multiselect(t["alt_exclude"], berry_table["Name"].tolist())
+    alt_limited = st.multiselect(t["alt_limit"], berry_table["Name"].tolist())
+    alt_limit_n = st.number_input(t["alt_limit_n"], min_value=0, max_value=8, value=1, step=1)
+    if st.button(t["alt_button"], use_container_width=True):
+        with timer.phase("alternatives"):
+            found = get_engine().solve_top_k(
+                target_donut_name, inventory, mode=alt_mode, k=alt_k,
+                exclude=alt_exclude, at_most={name: alt_limit_n for name in alt_limited},
+            )
+        with timer.phase("display"):
+            display_alternatives(found, get_engine(), t)
+
+# --- PARETO TRADE-OFFS ---
+with st.expander(t["pareto_header"]):
+    # Kept in the session so picking a recipe (a rerun) doesn't recompute the front.
+    pareto_key = (target_donut_name, inventory.tobytes())
+    if st.button(t["pareto_button"], use_container_width=True):
+        st.session_state["pareto"] = (pareto_key, get_engine().solve_pareto(target_donut_name, inventory))
+    if st.session_state.get("pareto", (None,))[0] == pareto_key:
+        with timer.phase("display"):
+            display_pareto(st.session_state["pareto"][1], get_engine(), t)
+
+# --- WHAT TO FARM NEXT ---
+with st.expander(t["farm_header"]):
+    farm_all = st.checkbox(t["farm_all"], value=False)
+    farm_indexed = index_covers(engine.donuts if farm_all else [target_donut_name])
+    if not farm_indexed:
+        st.caption(t["index_missing"])
+    if st.button(t["farm_button"], use_container_width=True, disabled=not farm_indexed):
+        advisor = get_farm_advisor()
+        with timer.phase("farm"):
+            if farm_all:
+                farm_plans = advisor.next_berries_all(inventory)
+            else:
+                farm_plan = advisor.next_berries(target_donut_name, inventory)
+                marginal = advisor.marginal_values(target_donut_name, inventory)
+        with timer.phase("display"):
+            if farm_all:
+                display_farm_all(farm_plans, get_engine(), t)
+            else:
+                display_farm_plan(farm_plan, get_engine(), t)
+                if farm_plan.cost is not None:
+                    display_marginal_values(marginal, t)
+
+# --- JOINT PRODUCTION PLAN ---
+with st.expander(t["plan_header"]):
+    wanted_df = st.data_editor(
+        pd.DataFrame({"Donut": list(recipes.keys()), "Wanted": [None] * len(recipes)}),
+        column_config={
+            "Donut": st.column_config.TextColumn(t["all_col_donut"], disabled=True),
+            "Wanted": st.column_config.NumberColumn(t["plan_target"], help=t["plan_target_help"], min_value=0, step=1),
+        },
+        hide_index=True,
+        use_container_width=True,
+        num_rows="fixed",
+    )
+    wanted = {row.Donut: int(row.Wanted) for row in wanted_df.itertuples() if pd.notna(row.Wanted)}
+    plan_indexed = index_covers(engine.donuts)
+    if not plan_indexed:
+        st.caption(t["index_missing"])
+    if st.button(t["plan_button"], use_container_width=True, disabled=not plan_indexed):
+        with timer.phase("plan"):
+            plan = get_planner().plan(
+                inventory, targets=wanted, max_columns=PLAN_COLUMNS, time_limit=solve_time_limit
+            )
+        with timer.phase("display"):
+            display_plan(plan, get_engine(), t)
+
+# --- MULTI-DAY SCHEDULE ---
+with st.expander(t["sched_header"]):
+    income_df = st.data_editor(
+        pd.DataFrame({"Name": berry_table["Name"], "Income": 0}),
+        column_config={
+            "Name": st.column_config.TextColumn(t["col_name"], disabled=True),
+            "Income": st.column_config.NumberColumn(t["sched_income"], min_value=0, step=1),
+        },
+        hide_index=True,
+        use_container_width=True,
+        num_rows="fixed",
+        height=300,
+        key="income_editor",
+    )
+    sched_days = st.slider(t["sched_days"], min_value=1, max_value=60, value=7)
+    sched_goal = st.radio(t["sched_goal"], ["count", "rarity"], format_func=lambda g: t[f"sched_{g}"], horizontal=True)
+    if not plan_indexed:
+        st.caption(t["index_missing"])
+    if st.button(t["sched_button"], use_container_width=True, disabled=not plan_indexed):
+        income = income_df["Income"].fillna(0).astype(int).to_numpy()
+        with timer.phase("schedule"):
+            schedule = get_planner().schedule(
+                inventory, income, sched_days, targets=wanted, objective=sched_goal,
+                max_columns=PLAN_COLUMNS, time_limit=solve_time_limit,
+            )
+        with timer.phase("display"):
+            display_schedule(schedule, get_engine(), t)
+
+# --- PERFORMANCE PANEL (debug only) ---
+timer.finish()
+if timer.enabled:
+    perf_history = st.session_state.setdefault("perf_history", deque(maxlen=50))
+    perf_history.append(timer.as_dict())
+    if debug_mode:
+        display_perf_panel(timer, perf_history)
@@ -0,0 +1,82 @@
+import contextvars
+import threading
+import time
+from concurrent.futures import wait
+
+from pool import MODES
+from solvers import SolveLimits, SolveOutcome
+
+# ---------------------------------------------------------------------
+# BACKGROUND SOLVES
+# ---------------------------------------------------------------------
+# A SolveJob is one user's economy + luxury solve running on a shared
+# thread pool, so the Streamlit script only polls it: it can draw progress,
+# take a Cancel click, or be rerun with new inputs while the solver works.
+#
+# The job itself is the `cancel` flag its solvers poll (see SolveLimits). It
+# reads as set once cancel() is called, and also once nobody has polled the
+# job for `abandon_after` seconds: a user who closed the tab or moved on
+# stops the search instead of leaving it to run out its time limit. CBC and
+# HiGHS can't be interrupted, so for them only the time limit applies.
+
+
+class SolveJob:
+    def __init__(self, executor, solver, donut, inventory, time_limit=None, gap=0.0, abandon_after=None):
+        self.donut = donut
+        self.inventory = inventory.copy()
+        self.time_limit = time_limit
+        self.gap = gap
+        self.abandon_after = abandon_after
+        self.started = time.monotonic()
+        self._seen = self.started
+        self._cancelled = threading.Event()
+        # mode -> (nodes searched, best objective so far or None), as last reported.
+        self.progress = {mode: (0, None) for mode in MODES}
+        # Each solve runs in a copy of the caller's context, so it reports to
+        # the caller's timing.PhaseTimer.
+        self._futures = {
+            mode: executor.submit(contextvars.copy_context().run, self._run, solver, mode) for mode in MODES
+        }
+
+    def _run(self, solver, mode):
+        def report(nodes, objective):
+            self.progress[mode] = (nodes, objective)
+
+        limits = SolveLimits(self.time_limit, self.gap, self, report)
+        return solver.solve_outcome(self.donut, self.inventory, mode, limits=limits)
+
+    def is_set(self):
+        if self._cancelled.is_set():
+            return True
+        return self.abandon_after is not None and time.monotonic() - self._seen > self.abandon_after
+
+    def poll(self):
+        # Marks the job as still wanted; True once there is nothing left to wait for.
+        self._seen = time.monotonic()
+        return self.done()
+
+    def cancel(self, grace=0.0):
+        # Waits up to `grace` seconds for running solvers to hand back what they found.
+        self._cancelled.set()
+        for future in self._futures.values():
+            future.cancel()
+        wait(self._futures.values(), timeout=grace)
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def done(self):
+        return self.cancelled() or all(future.done() for future in self._futures.values())
+
+    def finished(self, mode):
+        return self._futures[mode].done()
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def outcome(self, mode):
+        # The solvers.SolveOutcome for `mode`; "Cancelled" if it never got one.
+        future = self._futures[mode]
+        if future.done() and not future.cancelled():
+            return future.result()
+        return SolveOutcome(None, "Cancelled", None, None)
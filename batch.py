@@ -0,0 +1,145 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import threading
+import time
+from multiprocessing import Pool
+
+from engine import DonutEngine
+from recipe_index import RecipeIndex
+
+# ---------------------------------------------------------------------
+# HEADLESS BATCH SOLVER
+# ---------------------------------------------------------------------
+# Streams inventories through the same engine the app uses and writes one
+# JSON line of economy/luxury recipes per inventory. Input is read lazily
+# and results are written as they arrive, so memory stays flat no matter
+# how many inventories go through.
+#
+#   python batch.py bags.jsonl > results.jsonl
+#   cat bags.csv | python batch.py --format csv --workers 8 --unordered
+#
+# JSONL input: one object per line, either {"id": ..., "inventory": {...}}
+# (a berry -> count mapping or a list in catalog order) or a bare
+# {berry: count} mapping. CSV input: one column per berry, plus an optional
+# "id" column; missing berries count as 0.
+
+_engine = None
+
+
+def _init_worker(backend, use_index):
+    global _engine
+    _engine = DonutEngine(backend=backend)
+    if use_index:
+        _engine.recipe_index = RecipeIndex.load(_engine)
+
+
+def _solve_record(job):
+    record_id, inventory, donuts, error = job
+    if error is not None:
+        return {"id": record_id, "error": error}
+    try:
+        inv = _engine.inventory_vector(inventory)
+        results = {}
+        for donut in donuts or _engine.donuts:
+            economy = _engine.solve_counts(donut, inv, "min")
+            luxury = _engine.solve_counts(donut, inv, "max")
+            results[donut] = {"economy": _engine.recipe_mapping(economy), "luxury": _engine.recipe_mapping(luxury)}
+        return {"id": record_id, "results": results}
+    except (KeyError, TypeError, ValueError, OverflowError) as exc:
+        return {"id": record_id, "error": f"{type(exc).__name__}: {exc}"}
+
+
+def read_jsonl(stream):
+    for line_no, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_no, None, f"invalid JSON: {exc}"
+            continue
+        if isinstance(record, dict) and "inventory" in record:
+            yield record.get("id", line_no), record["inventory"], None
+        elif isinstance(record, dict):
+            record_id = record.pop("id", line_no)
+            yield record_id, record, None
+        else:
+            yield line_no, record, None
+
+
+def read_csv(stream):
+    for row_no, row in enumerate(csv.DictReader(stream), start=1):
+        record_id = row.pop("id", None) or row_no
+        if None in row:
+            # DictReader files fields past the header under None.
+            yield record_id, None, f"{len(row[None])} more field(s) than the header"
+            continue
+        try:
+            yield record_id, {name: int(count) for name, count in row.items() if count not in (None, "")}, None
+        except ValueError as exc:
+            yield record_id, None, f"invalid count: {exc}"
+
+
+def _throttled(jobs, slots):
+    # Pool.imap drains its input as fast as it can; holding a slot per job in
+    # flight keeps a huge input file from being pulled into memory up front.
+    for job in jobs:
+        slots.acquire()
+        yield job
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Solve economy/luxury recipes for a stream of inventories.")
+    parser.add_argument("input", nargs="?", default="-", help="CSV or JSONL file, '-' for stdin (default)")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default=None, help="default: from the file extension, else jsonl")
+    parser.add_argument("--output", default="-", help="JSONL output file, '-' for stdout (default)")
+    parser.add_argument("--donut", action="append", dest="donuts", help="only solve this donut (repeatable)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes; 1 solves in-process")
+    parser.add_argument("--chunksize", type=int, default=16)
+    parser.add_argument("--unordered", action="store_true", help="emit results as they finish instead of in input order")
+    parser.add_argument("--solver", default="auto", help="solver backend when the index can't answer")
+    parser.add_argument("--no-index", action="store_true", help="ignore the precomputed recipe index")
+    args = parser.parse_args()
+
+    fmt = args.format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    records = read_csv(source) if fmt == "csv" else read_jsonl(source)
+    jobs = ((record_id, inventory, args.donuts, error) for record_id, inventory, error in records)
+    init_args = (args.solver, not args.no_index)
+
+    start = time.perf_counter()
+    count = 0
+    try:
+        if args.workers <= 1:
+            _init_worker(*init_args)
+            for job in jobs:
+                sink.write(json.dumps(_solve_record(job), ensure_ascii=False) + "\n")
+                count += 1
+        else:
+            # Enough jobs in flight to keep every worker busy, and never fewer than one chunk.
+            slots = threading.Semaphore(max(args.workers * args.chunksize * 4, args.chunksize))
+            with Pool(args.workers, initializer=_init_worker, initargs=init_args) as pool:
+                imap = pool.imap_unordered if args.unordered else pool.imap
+                for result in imap(_solve_record, _throttled(jobs, slots), chunksize=args.chunksize):
+                    slots.release()
+                    sink.write(json.dumps(result, ensure_ascii=False) + "\n")
+                    count += 1
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed else 0.0
+    print(f"Processed {count} inventories in {elapsed:.2f}s ({rate:.1f} inventories/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+import argparse
+import json
+import platform
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from catalog import load_catalog, read_catalog, synthetic_catalog, write_catalog
+from engine import DonutEngine
+from pool import MODES, SolverPool
+from recipe_index import RecipeIndex
+
+# ---------------------------------------------------------------------
+# SOLVER BENCHMARK
+# ---------------------------------------------------------------------
+# Times engine.solve_counts (the app's solve path) for every donut in both
+# modes over seeded random inventories, single-threaded and on a worker pool.
+# Output is JSON with stable keys so runs from two commits can be diffed or
+# compared directly:
+#
+#   python bench.py --output before.json
+#   python bench.py --output after.json --compare before.json
+#
+# --scaling swaps the real catalog for synthetic ones of growing size and
+# reports, per size, how long the catalog takes to parse, compile and load
+# from the compiled cache, and solve latency on a handful of its donuts:
+#
+#   python bench.py --scaling --berries 33 100 200 --donuts 20 200 --samples 3
+
+# Inventory profiles: (share of berries present, max count of a present berry,
+# how many of the most common berries are eligible - None for all).
+PROFILES = {
+    "sparse": (0.25, 2, None),
+    "typical": (0.5, 4, None),
+    "rich": (0.9, 8, None),
+    # Only the 12 most common berries: mostly infeasible, exercises the "no" path.
+    "infeasible": (0.8, 8, 12),
+}
+
+
+def generate_inventories(n_berries, profile, samples, rng):
+    share, max_count, eligible = PROFILES[profile]
+    eligible = eligible or n_berries
+    inventories = np.zeros((samples, n_berries), dtype=np.int64)
+    present = rng.random((samples, eligible)) < share
+    inventories[:, :eligible] = rng.integers(1, max_count + 1, (samples, eligible)) * present
+    return inventories
+
+
+def latency_summary(seconds):
+    ms = np.asarray(seconds) * 1000.0
+    return {
+        "count": int(ms.size),
+        "mean_ms": round(float(ms.mean()), 4),
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p95_ms": round(float(np.percentile(ms, 95)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "max_ms": round(float(ms.max()), 4),
+        "solves_per_s": round(float(ms.size / (ms.sum() / 1000.0)), 2) if ms.sum() else None,
+    }
+
+
+def bench_single(engine, inventories_by_profile):
+    results = {}
+    every = []
+    for profile, inventories in inventories_by_profile.items():
+        results[profile] = {}
+        for mode in MODES:
+            timings = []
+            feasible = 0
+            for inv in inventories:
+                for donut in engine.donuts:
+                    start = time.perf_counter()
+                    counts = engine.solve_counts(donut, inv, mode)
+                    timings.append(time.perf_counter() - start)
+                    feasible += counts is not None
+            summary = latency_summary(timings)
+            summary["feasible_share"] = round(feasible / len(timings), 4)
+            results[profile][mode] = summary
+            every.extend(timings)
+    results["all"] = latency_summary(every)
+    return results
+
+
+def bench_parallel(engine, inventories, workers, kind):
+    with SolverPool(engine, workers=workers, kind=kind) as pool:
+        # Warm the workers up (process start, index load) outside the timed region.
+        pool.solve_all(inventories[0])
+        start = time.perf_counter()
+        futures = [pool.submit(donut, inv, mode) for inv in inventories for donut in engine.donuts for mode in MODES]
+        for future in futures:
+            future.result()
+        wall = time.perf_counter() - start
+    return {"solves": len(futures), "wall_s": round(wall, 4), "solves_per_s": round(len(futures) / wall, 2)}
+
+
+def bench_scaling(berry_sizes, donut_sizes, samples, seed, solver, timed_donuts=5):
+    # Solve time depends on the berry count, not on how many donuts there are,
+    # so only the first `timed_donuts` donuts of each catalog are solved.
+    results = []
+    for n_berries in berry_sizes:
+        for n_donuts in donut_sizes:
+            catalog = synthetic_catalog(n_berries, n_donuts, seed=seed)
+            with tempfile.TemporaryDirectory() as directory:
+                write_catalog(catalog, directory)
+                start = time.perf_counter()
+                read_catalog(directory)
+                parsed = time.perf_counter()
+                load_catalog(directory)
+                compiled = time.perf_counter()
+                catalog = load_catalog(directory)
+                cached = time.perf_counter()
+
+            engine = DonutEngine.from_catalog(catalog, backend=solver)
+            inventories = generate_inventories(n_berries, "typical", samples, np.random.default_rng(seed))
+            row = {
+                "berries": n_berries,
+                "donuts": n_donuts,
+                "backend": engine.backend,
+                "parse_ms": round((parsed - start) * 1000, 3),
+                "compile_ms": round((compiled - parsed) * 1000, 3),
+                "cached_load_ms": round((cached - compiled) * 1000, 3),
+            }
+            for mode in MODES:
+                timings = []
+                for inv in inventories:
+                    for donut in engine.donuts[:timed_donuts]:
+                        start = time.perf_counter()
+                        engine.solve_counts(donut, inv, mode)
+                        timings.append(time.perf_counter() - start)
+                row[mode] = latency_summary(timings)
+            results.append(row)
+            print(
+                f"{n_berries:>5} berries {n_donuts:>5} donuts  cached load {row['cached_load_ms']:>8.2f} ms  "
+                + "  ".join(f"{mode} p50 {row[mode]['p50_ms']:>9.2f} ms" for mode in MODES),
+                file=sys.stderr,
+            )
+    return results
+
+
+def peak_rss_mb():
+    # ru_maxrss is KiB on Linux (bytes on macOS).
+    scale = 1 / 1024 if sys.platform != "darwin" else 1 / (1024 * 1024)
+    return {
+        "self": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale, 1),
+        "children": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale, 1),
+    }
+
+
+def compare(current, baseline):
+    # Prints ratios for the headline numbers to stderr (stdout may carry the JSON);
+    # >1.00 on latency means slower.
+    print(f"{'case':<28}{'baseline':>12}{'current':>12}{'ratio':>8}", file=sys.stderr)
+
+    def row(label, old, new):
+        if old and new:
+            print(f"{label:<28}{old:>12.3f}{new:>12.3f}{new / old:>8.2f}", file=sys.stderr)
+
+    if "scaling" in current:
+        previous = {(r["berries"], r["donuts"]): r for r in baseline.get("scaling", [])}
+        for stats in current["scaling"]:
+            old = previous.get((stats["berries"], stats["donuts"]), {})
+            size = f"{stats['berries']}x{stats['donuts']}"
+            row(f"{size} cached_load_ms", old.get("cached_load_ms"), stats["cached_load_ms"])
+            for mode in MODES:
+                row(f"{size}/{mode} p50_ms", old.get(mode, {}).get("p50_ms"), stats[mode]["p50_ms"])
+        return
+
+    for profile, modes in current["single"].items():
+        if profile == "all" or profile not in baseline.get("single", {}):
+            continue
+        for mode, stats in modes.items():
+            old = baseline["single"][profile].get(mode, {})
+            for key in ("p50_ms", "p95_ms", "p99_ms"):
+                row(f"{profile}/{mode} {key}", old.get(key), stats[key])
+    for workers, stats in current["parallel"].items():
+        old = baseline.get("parallel", {}).get(workers, {})
+        row(f"parallel x{workers} solves/s", old.get("solves_per_s"), stats["solves_per_s"])
+
+
+def write_report(report, args):
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(report, json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark solve latency and throughput.")
+    parser.add_argument("--samples", type=int, default=None, help="inventories per profile (default 50, 3 with --scaling)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--solver", default="auto")
+    parser.add_argument("--no-index", action="store_true", help="benchmark the solver instead of the recipe index")
+    parser.add_argument("--workers", type=int, nargs="*", default=[2, 4], help="pool sizes for the parallel runs")
+    parser.add_argument("--pool", choices=["thread", "process"], default="process")
+    parser.add_argument("--output", default=None, help="write JSON here (default: stdout)")
+    parser.add_argument("--compare", default=None, help="baseline JSON to compare against")
+    parser.add_argument("--scaling", action="store_true", help="benchmark synthetic catalogs instead of the real one")
+    parser.add_argument("--berries", type=int, nargs="*", default=[33, 100, 200], help="synthetic catalog sizes")
+    parser.add_argument("--donuts", type=int, nargs="*", default=[20, 200], help="synthetic donut counts")
+    args = parser.parse_args()
+
+    if args.scaling:
+        samples = args.samples or 3
+        report = {
+            "config": {
+                "samples": samples,
+                "seed": args.seed,
+                "solver": args.solver,
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+            },
+            "scaling": bench_scaling(args.berries, args.donuts, samples, args.seed, args.solver),
+            "peak_rss_mb": peak_rss_mb(),
+        }
+        write_report(report, args)
+        return
+    args.samples = args.samples or 50
+
+    engine = DonutEngine(backend=args.solver)
+    if not args.no_index:
+        engine.recipe_index = RecipeIndex.load(engine)
+
+    rng = np.random.default_rng(args.seed)
+    inventories = {p: generate_inventories(len(engine.names), p, args.samples, rng) for p in PROFILES}
+    mixed = np.concatenate(list(inventories.values()))
+
+    report = {
+        "config": {
+            "samples_per_profile": args.samples,
+            "seed": args.seed,
+            "solver": engine.backend,
+            "index": engine.recipe_index is not None,
+            "pool": args.pool,
+            "berries": len(engine.names),
+            "donuts": len(engine.donuts),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+        },
+        "single": bench_single(engine, inventories),
+        "parallel": {str(w): bench_parallel(engine, mixed, w, args.pool) for w in args.workers},
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+    write_report(report, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import atexit
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from engine import MAX_SLOTS
+
+# ---------------------------------------------------------------------
+# SOLVE RESULT CACHE
+# ---------------------------------------------------------------------
+# Memoizes solve results keyed by (donut, mode, clipped inventory). One
+# instance lives on the process-wide engine, so every Streamlit session
+# shares it. Memory is LRU-bounded; the optional SQLite file keeps results
+# across restarts and is wiped whenever the catalog fingerprint changes.
+#
+# The file is bounded too: past `disk_maxsize` rows the oldest writes are
+# dropped. Writes are batched (every FLUSH_EVERY results or FLUSH_SECONDS,
+# and at exit) and the disk has its own lock, so a lookup never waits
+# behind a commit. A result still waiting in the batch is served from memory.
+
+FLUSH_EVERY = 64
+FLUSH_SECONDS = 1.0
+
+class SolveCache:
+    def __init__(self, maxsize=4096, path=None, fingerprint="", disk_maxsize=100_000):
+        self.maxsize = maxsize
+        self.disk_maxsize = disk_maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Guards the SQLite connection; never taken while holding _lock.
+        self._db_lock = threading.Lock()
+        self._pending = []
+        self._flushed = time.monotonic()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._db = None
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS solves ("
+                "donut TEXT, mode TEXT, inventory BLOB, counts BLOB, "
+                "PRIMARY KEY (donut, mode, inventory))"
+            )
+            row = self._db.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != fingerprint:
+                # Results from another catalog are meaningless here.
+                self._db.execute("DELETE FROM solves")
+                self._db.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+            self._db.commit()
+            atexit.register(self.flush)
+
+    @staticmethod
+    def key(donut, mode, inventory):
+        # Anything above 8 of one berry behaves like 8, so clamp before hashing.
+        inv = np.clip(np.asarray(inventory, dtype=np.int64), 0, MAX_SLOTS).astype(np.uint8)
+        return (donut, mode, inv.tobytes())
+
+    def get(self, key, default=None):
+        # Infeasible results are cached too (as None), so use `default` to detect a miss.
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._unpack(self._entries[key])
+
+        if self._db is not None:
+            with self._db_lock:
+                row = self._db.execute(
+                    "SELECT counts FROM solves WHERE donut = ? AND mode = ? AND inventory = ?", key
+                ).fetchone()
+            if row is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, row[0])
+                return self._unpack(row[0])
+
+        with self._lock:
+            self.misses += 1
+        return default
+
+    def put(self, key, counts):
+        packed = None if counts is None else np.asarray(counts, dtype=np.uint8).tobytes()
+        with self._lock:
+            self._remember(key, packed)
+            if self._db is None:
+                return
+            self._pending.append(key + (packed,))
+            due = len(self._pending) >= FLUSH_EVERY or time.monotonic() - self._flushed >= FLUSH_SECONDS
+        if due:
+            self.flush()
+
+    def flush(self):
+        # Writes batched results to the file and trims it to `disk_maxsize` rows.
+        if self._db is None:
+            return
+        with self._db_lock:
+            with self._lock:
+                rows, self._pending = self._pending, []
+                self._flushed = time.monotonic()
+            if not rows:
+                return
+            self._db.executemany("INSERT OR REPLACE INTO solves VALUES (?, ?, ?, ?)", rows)
+            # A replaced row gets a new rowid, so rowids follow write order: keep
+            # the last disk_maxsize of them.
+            self._db.execute(
+                "DELETE FROM solves WHERE rowid <= (SELECT MAX(rowid) FROM solves) - ?", (self.disk_maxsize,)
+            )
+            self._db.commit()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits + self.disk_hits) / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        with self._db_lock:
+            with self._lock:
+                self._entries.clear()
+                self._pending = []
+            if self._db is not None:
+                self._db.execute("DELETE FROM solves")
+                self._db.commit()
+
+    def _remember(self, key, packed):
+        self._entries[key] = packed
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _unpack(packed):
+        return None if packed is None else np.frombuffer(packed, dtype=np.uint8).astype(np.int64)
@@ -0,0 +1,276 @@
+import csv
+import hashlib
+import json
+import os
+import tempfile
+import zipfile
+from collections import namedtuple
+from io import StringIO
+
+import numpy as np
+
+# ---------------------------------------------------------------------
+# BERRY & DONUT CATALOG
+# ---------------------------------------------------------------------
+# Shared by the Streamlit app and the solver engine, so neither has to
+# import the other.
+#
+# The data lives in versioned directories under data/catalogs/, one per
+# game version or berry set:
+#
+#   catalog.json   {"schema": 1, "version": ..., "berries": "berries.csv",
+#                   "donuts": "donuts.json", "examples": "examples.json"}
+#   berries.csv    Name plus one column per stat. Row order is rarity:
+#                  common berries on top, rare ones at the bottom.
+#   donuts.json    {donut: {flavor: threshold}}
+#   examples.json  optional, {donut: [{"Name": ..., "Ingredients": ...}]}
+#
+# Everything is validated when read. load_catalog keeps the parsed arrays
+# in compiled.npz next to the sources and only re-reads the sources when
+# their content hash changes, so startup cost doesn't grow with the CSV.
+# Point DONUT_CATALOG at another directory to use a different catalog.
+
+FLAVORS = ["Sweet", "Spicy", "Sour", "Bitter", "Fresh"]
+STATS = FLAVORS + ["Cal", "Lv_Boost"]
+
+SCHEMA_VERSION = 1
+CATALOG_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "catalogs")
+DEFAULT_CATALOG = os.environ.get("DONUT_CATALOG") or os.path.join(CATALOG_ROOT, "za-v1")
+COMPILED_NAME = "compiled.npz"
+
+# matrix: berries x STATS, targets: donuts x FLAVORS (both int64).
+Catalog = namedtuple("Catalog", ["version", "names", "matrix", "donuts", "targets", "examples"])
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def _int_field(value, where):
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise CatalogError(f"{where}: expected a whole number, got {value!r}") from None
+    if number < 0 or str(number) != str(value).strip():
+        raise CatalogError(f"{where}: expected a whole number >= 0, got {value!r}")
+    return number
+
+
+def parse_berries(text, source="berries.csv"):
+    reader = csv.DictReader(StringIO(text.strip()))
+    columns = reader.fieldnames or []
+    missing = [c for c in ["Name"] + STATS if c not in columns]
+    if missing:
+        raise CatalogError(f"{source}: missing columns {missing}")
+    unexpected = [c for c in columns if c not in ["Name"] + STATS]
+    if unexpected:
+        raise CatalogError(f"{source}: unexpected columns {unexpected}")
+
+    names, rows = [], []
+    for line, row in enumerate(reader, start=2):
+        name = (row["Name"] or "").strip()
+        if not name:
+            raise CatalogError(f"{source}:{line}: empty berry name")
+        if name in names:
+            raise CatalogError(f"{source}:{line}: duplicate berry {name!r}")
+        names.append(name)
+        rows.append([_int_field(row[s], f"{source}:{line} {s}") for s in STATS])
+    if not names:
+        raise CatalogError(f"{source}: no berries")
+    return names, np.array(rows, dtype=np.int64)
+
+
+def parse_donuts(data, source="donuts.json"):
+    if not isinstance(data, dict) or not data:
+        raise CatalogError(f"{source}: expected a non-empty object of donut -> thresholds")
+    donuts, rows = [], []
+    for donut, thresholds in data.items():
+        if not isinstance(thresholds, dict) or sorted(thresholds) != sorted(FLAVORS):
+            raise CatalogError(f"{source}: {donut!r} needs exactly the thresholds {FLAVORS}")
+        donuts.append(donut)
+        rows.append([_int_field(thresholds[f], f"{source}: {donut!r} {f}") for f in FLAVORS])
+    return donuts, np.array(rows, dtype=np.int64)
+
+
+def parse_examples(data, donuts, source="examples.json"):
+    if not isinstance(data, dict):
+        raise CatalogError(f"{source}: expected an object of donut -> example list")
+    for donut, entries in data.items():
+        if donut not in donuts:
+            raise CatalogError(f"{source}: examples for unknown donut {donut!r}")
+        if not isinstance(entries, list) or not all(
+            isinstance(e, dict) and isinstance(e.get("Name"), str) and isinstance(e.get("Ingredients"), str)
+            for e in entries
+        ):
+            raise CatalogError(f"{source}: {donut!r} needs a list of {{'Name': ..., 'Ingredients': ...}}")
+    return data
+
+
+def _manifest(directory):
+    path = os.path.join(directory, "catalog.json")
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as exc:
+        raise CatalogError(f"{path}: {exc}") from None
+    if manifest.get("schema") != SCHEMA_VERSION:
+        raise CatalogError(f"{path}: schema {manifest.get('schema')!r} is not supported (expected {SCHEMA_VERSION})")
+    for key in ("version", "berries", "donuts"):
+        if not isinstance(manifest.get(key), str):
+            raise CatalogError(f"{path}: missing {key!r}")
+    return manifest
+
+
+def _sources(directory, manifest):
+    files = ["catalog.json", manifest["berries"], manifest["donuts"]]
+    if manifest.get("examples"):
+        files.append(manifest["examples"])
+    return [os.path.join(directory, name) for name in files]
+
+
+def source_digest(directory):
+    # Content hash of the manifest and every file it names.
+    h = hashlib.sha1()
+    for path in _sources(directory, _manifest(directory)):
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def read_catalog(directory=DEFAULT_CATALOG):
+    # Parses and validates the source files; raises CatalogError on any problem.
+    manifest = _manifest(directory)
+
+    def read(name):
+        with open(os.path.join(directory, name), encoding="utf-8") as f:
+            return f.read()
+
+    names, matrix = parse_berries(read(manifest["berries"]), manifest["berries"])
+    try:
+        donut_data = json.loads(read(manifest["donuts"]))
+        example_data = json.loads(read(manifest["examples"])) if manifest.get("examples") else {}
+    except json.JSONDecodeError as exc:
+        raise CatalogError(f"{directory}: {exc}") from None
+    donuts, targets = parse_donuts(donut_data, manifest["donuts"])
+    examples = parse_examples(example_data, donuts, manifest.get("examples"))
+    return Catalog(manifest["version"], names, matrix, donuts, targets, examples)
+
+
+def load_catalog(directory=DEFAULT_CATALOG, compiled=True):
+    # read_catalog behind the compiled.npz cache. A read-only data directory
+    # just means no cache, and a damaged cache file means a rebuild.
+    path = os.path.join(directory, COMPILED_NAME)
+    digest = source_digest(directory)
+    if compiled and os.path.exists(path):
+        catalog = _read_compiled(path, digest)
+        if catalog is not None:
+            return catalog
+
+    catalog = read_catalog(directory)
+    if compiled:
+        _write_compiled(path, digest, catalog)
+    return catalog
+
+
+def _read_compiled(path, digest):
+    # The cached Catalog, or None when it is stale or unreadable.
+    try:
+        with np.load(path) as data:
+            if int(data["schema"]) != SCHEMA_VERSION or str(data["digest"]) != digest:
+                return None
+            return Catalog(
+                str(data["version"]), data["names"].tolist(), data["matrix"],
+                data["donuts"].tolist(), data["targets"], json.loads(str(data["examples"])),
+            )
+    except (zipfile.BadZipFile, OSError, KeyError, ValueError, EOFError):
+        return None
+
+
+def _write_compiled(path, digest, catalog):
+    # Written to a temp file and renamed into place, so another process never
+    # reads a half-written cache and a killed one leaves the old file intact.
+    directory = os.path.dirname(path)
+    try:
+        fd, tmp = tempfile.mkstemp(prefix=".compiled-", suffix=".npz", dir=directory)
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(
+                f, schema=SCHEMA_VERSION, digest=digest, version=catalog.version,
+                names=np.array(catalog.names), matrix=catalog.matrix,
+                donuts=np.array(catalog.donuts), targets=catalog.targets,
+                examples=json.dumps(catalog.examples, ensure_ascii=False),
+            )
+        # mkstemp creates the file private; the cache is as readable as its sources.
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+
+
+def write_catalog(catalog, directory):
+    # Writes `catalog` as source files (used for generated catalogs).
+    os.makedirs(directory, exist_ok=True)
+    manifest = {
+        "schema": SCHEMA_VERSION, "version": catalog.version,
+        "berries": "berries.csv", "donuts": "donuts.json", "examples": "examples.json",
+    }
+    with open(os.path.join(directory, "catalog.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4)
+    with open(os.path.join(directory, "berries.csv"), "w", encoding="utf-8") as f:
+        f.write(berries_csv(catalog))
+    with open(os.path.join(directory, "donuts.json"), "w", encoding="utf-8") as f:
+        json.dump(donut_thresholds(catalog), f, indent=4, ensure_ascii=False)
+    with open(os.path.join(directory, "examples.json"), "w", encoding="utf-8") as f:
+        json.dump(catalog.examples, f, indent=4, ensure_ascii=False)
+
+
+def berries_csv(catalog):
+    lines = [",".join(["Name"] + STATS)]
+    lines += [",".join([name] + [str(int(v)) for v in row]) for name, row in zip(catalog.names, catalog.matrix)]
+    return "\n".join(lines) + "\n"
+
+
+def donut_thresholds(catalog):
+    return {donut: dict(zip(FLAVORS, (int(v) for v in row))) for donut, row in zip(catalog.donuts, catalog.targets)}
+
+
+def synthetic_catalog(n_berries, n_donuts, seed=0):
+    # A made-up catalog shaped like the real one, for scaling benchmarks: each
+    # berry has one to three flavors that get stronger (and pricier in calories
+    # and boost) towards the rare end, and each donut's thresholds are 90% of a
+    # random 6-8 berry mix, so every donut is craftable from a full bag.
+    rng = np.random.default_rng(seed)
+    rarity = np.linspace(0.0, 1.0, n_berries)
+    matrix = np.zeros((n_berries, len(STATS)), dtype=np.int64)
+    for i in range(n_berries):
+        strength = 40 + 60 * rarity[i]
+        picked = rng.choice(len(FLAVORS), size=rng.integers(1, 4), replace=False)
+        shares = rng.dirichlet(np.ones(len(picked))) * (1 + rarity[i])
+        matrix[i, picked] = np.maximum(5, np.round(strength * shares / 5) * 5)
+        matrix[i, STATS.index("Cal")] = int(round((80 + 320 * rarity[i]) / 10) * 10)
+        matrix[i, STATS.index("Lv_Boost")] = int(2 + round(8 * rarity[i]))
+    flavors = matrix[:, :len(FLAVORS)]
+    targets = np.zeros((n_donuts, len(FLAVORS)), dtype=np.int64)
+    for d in range(n_donuts):
+        mix = rng.choice(n_berries, size=rng.integers(6, 9))
+        targets[d] = np.floor(flavors[mix].sum(axis=0) * 0.9 / 10) * 10
+    names = [f"Berry {i:04d}" for i in range(n_berries)]
+    donuts = [f"Donut {d:04d}" for d in range(n_donuts)]
+    return Catalog(f"synthetic-{n_berries}x{n_donuts}-{seed}", names, matrix, donuts, targets, {})
+
+
+# The default catalog, and the same data under the names the app and engine
+# have always used.
+CATALOG = load_catalog()
+berry_csv = berries_csv(CATALOG)
+recipes = donut_thresholds(CATALOG)
+# --- EXAMPLE RECIPES DATA (4 Examples per Donut) ---
+# Constraint 1: "Rainbow Variety" - Max 1 berry per type (approx).
+# Constraint 2: "Balanced Pair" - Max 2 berries per type.
+# Constraint 3/4: "Bulk/Specialized" - Unrestricted.
+EXAMPLE_RECIPES = CATALOG.examples
@@ -0,0 +1,98 @@
+import logging
+import re
+from collections import namedtuple
+
+import numpy as np
+
+from catalog import EXAMPLE_RECIPES
+from engine import FLAVORS
+
+# ---------------------------------------------------------------------
+# CURATED EXAMPLE RECIPES
+# ---------------------------------------------------------------------
+# EXAMPLE_RECIPES is hand-written text ("2x Hyper Tanga, 1x Kasib, ...").
+# It is parsed once into count vectors, with short names ("Tanga") mapped
+# to catalog names ("Hyper Tanga"), and every example is checked against
+# its donut's thresholds. Problems are logged at load time. Only examples
+# that pass count as matches, and matching an inventory against them is one
+# vectorized dominance check, so the app can show a curated recipe the bag
+# covers before the optimizer has answered.
+
+logger = logging.getLogger("donut.catalog")
+
+CuratedRecipe = namedtuple("CuratedRecipe", ["donut", "name", "counts", "problems"])
+
+_ITEM = re.compile(r"^\s*(\d+)\s*x\s+(.+?)\s*$", re.IGNORECASE)
+
+
+def normalize_berry(engine, name):
+    # Catalog name for `name`, or None. Accepts the name without the "Hyper "
+    # prefix and any letter case.
+    name = " ".join(name.split())
+    for candidate in (name, f"Hyper {name}"):
+        if candidate in engine.index:
+            return candidate
+    lowered = {known.lower(): known for known in engine.names}
+    return lowered.get(name.lower()) or lowered.get(f"hyper {name.lower()}")
+
+
+def parse_ingredients(engine, text):
+    # "2x Hyper Tanga, 1x Kasib" -> (count vector, list of problems).
+    counts = np.zeros(len(engine.names), dtype=np.int64)
+    problems = []
+    for item in text.split(","):
+        match = _ITEM.match(item)
+        if match is None:
+            problems.append(f"can't read {item.strip()!r}")
+            continue
+        berry = normalize_berry(engine, match.group(2))
+        if berry is None:
+            problems.append(f"unknown berry {match.group(2)!r}")
+            continue
+        counts[engine.index[berry]] += int(match.group(1))
+    return counts, problems
+
+
+def check_recipe(engine, donut, counts):
+    # Why `counts` is not a valid recipe for `donut` (empty if it is).
+    if donut not in engine.targets:
+        return [f"unknown donut {donut!r}"]
+    problems = []
+    if counts.sum() > engine.max_slots:
+        problems.append(f"{int(counts.sum())} berries, at most {engine.max_slots} fit")
+    achieved = engine.flavors.T @ counts
+    for k, flavor in enumerate(FLAVORS):
+        if achieved[k] < engine.targets[donut][k]:
+            problems.append(f"{flavor} {int(achieved[k])} < {int(engine.targets[donut][k])}")
+    return problems
+
+
+class CuratedRecipes:
+    def __init__(self, engine, examples=EXAMPLE_RECIPES):
+        self.engine = engine
+        self.recipes = {}
+        # Per donut: the examples that passed, and their counts stacked for matching.
+        self._valid = {}
+        for donut, entries in examples.items():
+            parsed = []
+            for entry in entries:
+                counts, problems = parse_ingredients(engine, entry["Ingredients"])
+                problems += check_recipe(engine, donut, counts)
+                if problems:
+                    logger.warning("Example %r for %s is invalid: %s", entry["Name"], donut, "; ".join(problems))
+                parsed.append(CuratedRecipe(donut, entry["Name"], counts, problems))
+            self.recipes[donut] = parsed
+            valid = [recipe for recipe in parsed if not recipe.problems]
+            matrix = np.array([recipe.counts for recipe in valid], dtype=np.int64).reshape(-1, len(engine.names))
+            self._valid[donut] = (valid, matrix)
+
+    def invalid(self):
+        return [recipe for parsed in self.recipes.values() for recipe in parsed if recipe.problems]
+
+    def matches(self, donut, inventory):
+        # Valid curated recipes for `donut` the inventory can make, in catalog order.
+        valid, matrix = self._valid.get(donut, ([], None))
+        if not valid:
+            return []
+        inv = self.engine.inventory_vector(inventory)
+        return [valid[i] for i in np.flatnonzero(np.all(matrix <= inv, axis=1))]
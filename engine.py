@@ -0,0 +1,260 @@
+import hashlib
+from collections import namedtuple
+
+import numpy as np
+from pulp import LpProblem, LpMinimize, LpMaximize, LpVariable, LpAffineExpression
+
+import timing
+from catalog import FLAVORS, STATS, berry_csv, recipes, parse_berries, parse_donuts
+from solvers import BACKENDS, exact, exact_outcome, k_best, pareto_front, pick_backend
+
+# ---------------------------------------------------------------------
+# DONUT ENGINE
+# ---------------------------------------------------------------------
+# Streamlit-free solver core. The berry table is parsed once into a dense
+# integer matrix (berries x stats) and every model is built straight from
+# that matrix, so a solve never touches pandas.
+
+MAX_SLOTS = 8
+
+_MISSING = object()
+
+# One flavor a donut can't reach: the threshold, and the most that any 8
+# berries from the inventory add of that flavor alone. "Total" is all five
+# flavors summed.
+Shortfall = namedtuple("Shortfall", ["flavor", "needed", "reachable"])
+
+
+class DonutEngine:
+    max_slots = MAX_SLOTS
+
+    def __init__(self, berry_csv=berry_csv, recipes=recipes, backend="auto"):
+        names, matrix = parse_berries(berry_csv)
+        donuts, targets = parse_donuts(recipes)
+        self._load(names, matrix, donuts, targets, backend)
+
+    @classmethod
+    def from_catalog(cls, catalog, backend="auto"):
+        # Straight from a catalog.Catalog's arrays (e.g. load_catalog's compiled
+        # cache), skipping the CSV.
+        engine = cls.__new__(cls)
+        engine._load(catalog.names, catalog.matrix, catalog.donuts, catalog.targets, backend)
+        return engine
+
+    def _load(self, names, matrix, donuts, targets, backend):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+        # matrix[:, :5] -> flavors, matrix[:, 5] -> Cal, matrix[:, 6] -> Lv_Boost
+        self.matrix = np.asarray(matrix, dtype=np.int64)
+        self.flavors = self.matrix[:, :len(FLAVORS)]
+        self.cal = self.matrix[:, STATS.index("Cal")]
+        self.boost = self.matrix[:, STATS.index("Lv_Boost")]
+
+        # Row order is rarity: common berries on top, rare ones at the bottom.
+        self.weights = np.arange(1, len(self.names) + 1, dtype=np.int64)
+
+        self.donuts = list(donuts)
+        self.targets = {donut: np.asarray(row, dtype=np.int64) for donut, row in zip(self.donuts, targets)}
+
+        # Plain-int copies for PuLP, which is much faster with Python ints than numpy scalars
+        self._flavor_cols = [self.flavors[:, k].tolist() for k in range(len(FLAVORS))]
+        self._weight_list = self.weights.tolist()
+
+        # Per flavor (plus the summed column), berries from strongest to weakest,
+        # for the feasibility screen.
+        screen = np.column_stack([self.flavors, self.flavors.sum(axis=1)]).T
+        self._screen_order = np.argsort(-screen, axis=1, kind="stable")
+        self._screen_values = np.take_along_axis(screen, self._screen_order, axis=1)
+
+        # Optional precomputed lookup table (see recipe_index.py). Donuts it covers
+        # are answered without building a model at all.
+        self.recipe_index = None
+        # Solver used when the index can't answer; see solvers.BACKENDS.
+        if backend == "auto":
+            backend = pick_backend(len(self.names))
+        elif backend not in BACKENDS:
+            raise ValueError(f"Unknown solver backend {backend!r}, expected 'auto' or one of {sorted(BACKENDS)}")
+        self.backend = backend
+        # Optional result cache (see cache.py), shared by everyone using this engine.
+        self.cache = None
+
+    def __getstate__(self):
+        # Worker processes get a copy without the cache: its lock and SQLite handle can't be pickled.
+        state = self.__dict__.copy()
+        state["cache"] = None
+        return state
+
+    @property
+    def fingerprint(self):
+        # Changes whenever the berry stats or donut thresholds do.
+        h = hashlib.sha1()
+        h.update("\n".join(self.names).encode())
+        h.update(self.matrix.tobytes())
+        for donut in self.donuts:
+            h.update(donut.encode())
+            h.update(self.targets[donut].tobytes())
+        return h.hexdigest()
+
+    def inventory_vector(self, inventory, clip=True):
+        # Accepts {berry name: count} or a flat sequence in catalog order, of
+        # integer counts only: 1.9 berries or a nested list is a caller's bug, not
+        # something to round or flatten. Single-donut solves clip to 8; planners
+        # that share one bag across donuts pass clip=False.
+        if isinstance(inventory, dict):
+            vec = np.zeros(len(self.names), dtype=np.int64)
+            for name, count in inventory.items():
+                if isinstance(count, bool) or not isinstance(count, (int, np.integer)):
+                    raise ValueError(f"Count for {name!r} must be an integer, got {count!r}")
+                vec[self.index[name]] = count
+        else:
+            vec = np.asarray(inventory)
+            if vec.ndim != 1 or vec.shape[0] != len(self.names):
+                raise ValueError(f"Expected a flat list of {len(self.names)} inventory entries, got shape {vec.shape}")
+            if vec.dtype.kind not in "iu":
+                raise ValueError(f"Inventory counts must be integers, got {vec.dtype}")
+            vec = vec.astype(np.int64)
+        # Negative counts make no sense and more than 8 of a berry can never go into one donut.
+        return np.clip(vec, 0, MAX_SLOTS if clip else None)
+
+    def flavor_bounds(self, inventory):
+        # The most of each flavor (and of all five summed) that any 8 berries from
+        # the inventory can add, each column on its own: fill the slots with the
+        # strongest berries of that flavor, vectorized over all six columns.
+        inv = self.inventory_vector(inventory)[self._screen_order]
+        before = np.cumsum(inv, axis=1) - inv
+        taken = np.clip(MAX_SLOTS - before, 0, inv)
+        return (taken * self._screen_values).sum(axis=1)
+
+    def screen(self, donut, inventory):
+        # Flavors the donut can't reach with this inventory, as Shortfalls. Empty
+        # means the screen passed; the donut can still turn out infeasible when
+        # the flavors can't all be reached by the same 8 berries.
+        reachable = self.flavor_bounds(inventory)
+        target = self.targets[donut]
+        needed = np.append(target, target.sum())
+        return [
+            Shortfall(name, int(needed[k]), int(reachable[k]))
+            for k, name in enumerate(FLAVORS + ["Total"])
+            if needed[k] > reachable[k]
+        ]
+
+    def build_model(self, donut, inventory, mode="min"):
+        target = self.targets[donut]
+        inv = self.inventory_vector(inventory)
+        sense = LpMinimize if mode == "min" else LpMaximize
+        prob = LpProblem("DonutOpt", sense)
+
+        # Berries we don't own can't be used, so they don't get a variable at all.
+        used = np.flatnonzero(inv).tolist()
+        berry_vars = {
+            i: LpVariable(f"count_{i}", lowBound=0, upBound=int(inv[i]), cat="Integer")
+            for i in used
+        }
+
+        prob += LpAffineExpression([(berry_vars[i], self._weight_list[i]) for i in used])
+
+        for k, col in enumerate(self._flavor_cols):
+            terms = [(berry_vars[i], col[i]) for i in used if col[i]]
+            prob += LpAffineExpression(terms) >= int(target[k])
+
+        prob += LpAffineExpression([(v, 1) for v in berry_vars.values()]) <= MAX_SLOTS
+        return prob, berry_vars
+
+    def solve_counts(self, donut, inventory, mode="min", hint=None):
+        # Returns the berry count vector of the optimal recipe, or None if infeasible.
+        # `hint` is an optional solvers.WarmStart for the backend.
+        return self.solve_outcome(donut, inventory, mode, hint).counts
+
+    def solve_outcome(self, donut, inventory, mode="min", hint=None, limits=None):
+        # solve_counts as a solvers.SolveOutcome, optionally bounded by a
+        # solvers.SolveLimits. Only exact results go into the cache.
+        if self.cache is None:
+            return self._solve_outcome(donut, inventory, mode, hint, limits)
+        timer = timing.current()
+        inv = self.inventory_vector(inventory)
+        key = self.cache.key(donut, mode, inv)
+        with timer.phase("cache"):
+            counts = self.cache.get(key, _MISSING)
+        if counts is _MISSING:
+            outcome = self._solve_outcome(donut, inv, mode, hint, limits)
+            if exact(outcome, limits):
+                self.cache.put(key, outcome.counts)
+            return outcome
+        timer.record_solve(donut=donut, mode=mode, source="cache", feasible=counts is not None)
+        return exact_outcome(counts, self.weights)
+
+    def _solve_outcome(self, donut, inventory, mode, hint=None, limits=None):
+        timer = timing.current()
+        # Most impossible donuts fail on a single flavor; that is one vectorized check.
+        with timer.phase("screen"):
+            short = self.screen(donut, inventory)
+        if short:
+            timer.record_solve(donut=donut, mode=mode, source="screen", feasible=False)
+            return exact_outcome(None, self.weights)
+        if self.recipe_index is not None and self.recipe_index.covers(donut):
+            with timer.phase("index_lookup"):
+                counts = self.recipe_index.lookup(donut, inventory, mode)
+            if timer.enabled:
+                timer.record_solve(
+                    donut=donut, mode=mode, source="index", feasible=counts is not None,
+                    objective=None if counts is None else int(counts @ self.weights),
+                )
+            return exact_outcome(counts, self.weights)
+        outcome = BACKENDS[self.backend](self, donut, inventory, mode, hint=hint, limits=limits)
+        timer.record_solve(
+            donut=donut, mode=mode, source=self.backend, status=outcome.status,
+            nodes=outcome.nodes, objective=outcome.objective, warm=hint is not None,
+        )
+        return outcome
+
+    def solve_top_k(self, donut, inventory, mode="min", k=10, exclude=(), at_most=None):
+        # Up to k distinct recipes, best first, as count vectors. `exclude` names
+        # berries not to use at all; `at_most` maps berry name -> most to use.
+        inv = self.inventory_vector(inventory)
+        for name in exclude:
+            inv[self.index[name]] = 0
+        for name, limit in (at_most or {}).items():
+            inv[self.index[name]] = min(inv[self.index[name]], max(int(limit), 0))
+
+        timer = timing.current()
+        if mode == "min" and self.recipe_index is not None and self.recipe_index.covers(donut):
+            with timer.phase("index_lookup"):
+                found = self.recipe_index.ranked(donut, inv, k)
+            timer.record_solve(donut=donut, mode=mode, source="index", k=k, found=len(found))
+            return found
+        with timer.phase("solve"):
+            ranked, nodes = k_best(
+                self.flavors, self.weights, self.targets[donut], inv, self.max_slots, k, maximize=(mode != "min")
+            )
+        timer.record_solve(donut=donut, mode=mode, source="k_best", k=k, found=len(ranked), nodes=nodes)
+        return [counts for _, counts in ranked]
+
+    def solve_pareto(self, donut, inventory):
+        # Pareto-optimal recipes over rarity (lower is better), Lv_Boost and
+        # calories (higher is better), as count vectors from least to most rare.
+        inv = self.inventory_vector(inventory)
+        timer = timing.current()
+        with timer.phase("solve"):
+            front, nodes = pareto_front(
+                self.flavors, self.weights, self.cal, self.boost, self.targets[donut], inv, self.max_slots
+            )
+        timer.record_solve(donut=donut, mode="pareto", source="pareto", found=len(front), nodes=nodes)
+        return [counts for *_, counts in front]
+
+    def recipe(self, counts):
+        # Same row format the UI has always displayed.
+        return [
+            {"Berry": self.names[i], "Count": int(counts[i]), "Cal": int(self.cal[i]), "Lv_Boost": int(self.boost[i])}
+            for i in np.flatnonzero(counts)
+        ]
+
+    def recipe_mapping(self, counts):
+        # {berry name: count}, the shape the JSON front ends emit.
+        if counts is None:
+            return None
+        return {self.names[i]: int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def solve(self, donut, inventory, mode="min"):
+        counts = self.solve_counts(donut, inventory, mode)
+        return None if counts is None else self.recipe(counts)
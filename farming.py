@@ -0,0 +1,94 @@
+from collections import namedtuple
+
+import numpy as np
+
+from recipe_index import minimal_recipes
+
+# ---------------------------------------------------------------------
+# WHAT TO FARM NEXT
+# ---------------------------------------------------------------------
+# Every recipe contains a minimal recipe, so both questions below are
+# answered against a donut's minimal recipes (the recipe index) in one
+# vectorized pass each instead of one solve per edited inventory:
+#
+#   next_berries     the berries to collect so the donut becomes craftable,
+#                    cheapest by rarity weight (rare berries are the hard
+#                    ones to find), ties going to the cheaper recipe.
+#   marginal_values  for every berry, the economy optimum after collecting
+#                    1..max_extra more of it. A recipe the bag can't make
+#                    yet becomes makeable by one berry j only if j is the
+#                    one berry it is short of, so grouping those recipes by
+#                    (j, units short) answers all berries x extras at once.
+
+FarmPlan = namedtuple("FarmPlan", ["donut", "extra", "recipe", "cost"])
+MarginalValue = namedtuple("MarginalValue", ["berry", "extra", "objective", "gain"])
+
+
+class FarmAdvisor:
+    def __init__(self, engine):
+        self.engine = engine
+        self._patterns = {}
+
+    def patterns(self, donut):
+        # (minimal recipes in economy order, their economy weights)
+        if donut not in self._patterns:
+            table = minimal_recipes(self.engine, donut).astype(np.int64)
+            self._patterns[donut] = (table, table @ self.engine.weights)
+        return self._patterns[donut]
+
+    def next_berries(self, donut, inventory):
+        # FarmPlan with the berries to collect (`extra`, all zero if the bag can
+        # already make the donut), the recipe they complete and their weight.
+        # A donut no 8 berries of the catalog can make gets extra, recipe and
+        # cost all None.
+        table, _ = self.patterns(donut)
+        if len(table) == 0:
+            return FarmPlan(donut, None, None, None)
+        inv = self.engine.inventory_vector(inventory)
+        missing = np.clip(table - inv, 0, None)
+        cost = missing @ self.engine.weights
+        best = int(np.argmin(cost))
+        return FarmPlan(donut, missing[best], table[best], int(cost[best]))
+
+    def next_berries_all(self, inventory):
+        return {donut: self.next_berries(donut, inventory) for donut in self.engine.donuts}
+
+    def marginal_values(self, donut, inventory, max_extra=3):
+        # One MarginalValue per berry, most useful first: the fewest extra units
+        # (1..max_extra) that reach the best economy objective available with up
+        # to max_extra more of that berry, that objective (None if still
+        # impossible) and the improvement over today's (None if the donut isn't
+        # craftable today, so any objective at all is an improvement).
+        engine = self.engine
+        table, costs = self.patterns(donut)
+        inv = engine.inventory_vector(inventory)
+
+        short = table > inv
+        n_short = short.sum(axis=1)
+        makeable = np.flatnonzero(n_short == 0)
+        current = int(costs[makeable[0]]) if makeable.size else None
+
+        # best[j, e]: cheapest recipe that e + 1 more of berry j makes possible.
+        best = np.full((len(engine.names), max_extra), np.iinfo(np.int64).max, dtype=np.int64)
+        rows = np.flatnonzero(n_short == 1)
+        berry = short[rows].argmax(axis=1)
+        need = table[rows, berry] - inv[berry]
+        within = need <= max_extra
+        np.minimum.at(best, (berry[within], need[within] - 1), costs[rows[within]])
+        best = np.minimum.accumulate(best, axis=1)
+        if current is not None:
+            best = np.minimum(best, current)
+
+        values = []
+        for j, name in enumerate(engine.names):
+            after = int(best[j, -1])
+            if after == np.iinfo(np.int64).max:
+                values.append(MarginalValue(name, 0, None, None))
+                continue
+            extra = int(np.argmax(best[j] == after)) + 1
+            if current is not None and after == current:
+                extra = 0
+            values.append(MarginalValue(name, extra, after, None if current is None else current - after))
+        unranked = np.iinfo(np.int64).max
+        values.sort(key=lambda v: (v.extra == 0, unranked if v.objective is None else v.objective, v.extra))
+        return values
@@ -0,0 +1,144 @@
+import threading
+
+import numpy as np
+
+import timing
+from solvers import WarmStart, cover_lower_bound, exact, exact_outcome
+
+# ---------------------------------------------------------------------
+# INCREMENTAL RE-SOLVE
+# ---------------------------------------------------------------------
+# Remembers the last inventory and optimal recipe per (donut, mode) for one
+# user (one Streamlit session), so the usual "edit one cell, recalculate"
+# loop rarely reaches a solver. When the inventory changes, the previous
+# optimum is reused if it is provably still optimal:
+#
+#   - no count went up: the feasible set only shrank, so a recipe that still
+#     fits is still optimal (and an infeasible donut stays infeasible);
+#   - some counts went up: any better recipe must use more of one of those
+#     berries than the old bag held, and a bound on every such recipe shows
+#     none can beat the old one.
+#
+# Otherwise the solve is warm-started: a recipe that still fits becomes the
+# incumbent, and after a pure decrease the old objective is a bound the new
+# one can only match, so the search stops as soon as it does.
+
+
+class IncrementalSolver:
+    def __init__(self, engine):
+        self.engine = engine
+        self._last = {}
+        # Economy and luxury may be solved on two threads at once (see background.py).
+        self._lock = threading.Lock()
+        self.reused = 0
+        self.warm = 0
+        self.cold = 0
+
+    def solve_counts(self, donut, inventory, mode="min"):
+        return self.solve_outcome(donut, inventory, mode).counts
+
+    def solve_outcome(self, donut, inventory, mode="min", limits=None):
+        # engine.solve_outcome with the reuse / warm start above. Only exact
+        # results are remembered: an incumbent cut short by `limits` proves nothing.
+        engine = self.engine
+        timer = timing.current()
+        inv = engine.inventory_vector(inventory)
+        previous = self._last.get((donut, mode))
+
+        hint = None
+        if previous is not None:
+            with timer.phase("incremental"):
+                reuse, hint = self._reuse(donut, mode, *previous, inv)
+            if reuse:
+                counts = previous[1]
+                timer.record_solve(donut=donut, mode=mode, source="incremental", feasible=counts is not None)
+                with self._lock:
+                    self.reused += 1
+                    self._last[donut, mode] = (inv, counts)
+                return exact_outcome(counts, engine.weights)
+
+        with self._lock:
+            if hint is None:
+                self.cold += 1
+            else:
+                self.warm += 1
+        outcome = engine.solve_outcome(donut, inv, mode, hint=hint, limits=limits)
+        if exact(outcome, limits):
+            with self._lock:
+                self._last[donut, mode] = (inv, outcome.counts)
+        return outcome
+
+    def solve(self, donut, inventory, mode="min"):
+        counts = self.solve_counts(donut, inventory, mode)
+        return None if counts is None else self.engine.recipe(counts)
+
+    def stats(self):
+        return {"reused": self.reused, "warm": self.warm, "cold": self.cold}
+
+    def clear(self):
+        self._last.clear()
+
+    def _reuse(self, donut, mode, old_inv, counts, inv):
+        # Returns (previous result still optimal?, WarmStart hint or None).
+        raised = np.flatnonzero(inv > old_inv)
+        if counts is None:
+            # Infeasible before; only more of a raised berry can change that.
+            return not self._reachable(donut, old_inv, inv, raised), None
+
+        fits = bool(np.all(counts <= inv))
+        if raised.size == 0:
+            if fits:
+                return True, None
+            return False, WarmStart(None, int(counts @ self.engine.weights))
+        if not fits:
+            return False, None
+        if self._unbeatable(donut, mode, old_inv, counts, inv, raised):
+            return True, None
+        return False, WarmStart(counts, None)
+
+    def _unbeatable(self, donut, mode, old_inv, counts, inv, raised):
+        # A recipe the old bag couldn't make takes at least old_inv[j] + 1 of some
+        # raised berry j. Bound the best such recipe for every j.
+        engine = self.engine
+        weights = engine.weights
+        objective = int(counts @ weights)
+        for j in raised:
+            need = int(old_inv[j]) + 1
+            slots = engine.max_slots - need
+            forced = need * int(weights[j])
+            if mode == "min":
+                deficit = engine.targets[donut] - need * engine.flavors[j]
+                if forced + cover_lower_bound(engine.flavors, weights, deficit, slots, engine.max_slots) < objective:
+                    return False
+            else:
+                if forced + self._fill_bound(inv, j, need, slots, weights) > objective:
+                    return False
+        return True
+
+    def _reachable(self, donut, old_inv, inv, raised):
+        # Could any recipe taking old_inv[j] + 1 of a raised berry j reach every
+        # flavor threshold? Each flavor, and all of them summed, is judged on its own.
+        engine = self.engine
+        columns = [engine.flavors[:, k] for k in range(engine.flavors.shape[1])] + [engine.flavors.sum(axis=1)]
+        for j in raised:
+            need = int(old_inv[j]) + 1
+            slots = engine.max_slots - need
+            deficit = np.maximum(engine.targets[donut] - need * engine.flavors[j], 0)
+            deficit = list(deficit) + [int(deficit.sum())]
+            if all(d == 0 or self._fill_bound(inv, j, need, slots, col) >= d for col, d in zip(columns, deficit)):
+                return True
+        return False
+
+    def _fill_bound(self, inv, j, need, slots, column):
+        # Most of `column` that `slots` more berries from the bag (beyond the
+        # `need` of berry j) can add; greedy is exact for a single column.
+        caps = inv.copy()
+        caps[j] -= need
+        total = 0
+        for i in np.argsort(-column, kind="stable"):
+            if slots == 0 or column[i] <= 0:
+                break
+            take = min(int(caps[i]), slots)
+            total += take * int(column[i])
+            slots -= take
+        return total
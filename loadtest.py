@@ -0,0 +1,319 @@
+import argparse
+import json
+import os
+import platform
+import resource
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from background import SolveJob
+from bench import PROFILES, generate_inventories, latency_summary
+from cache import SolveCache
+from catalog import CATALOG, DEFAULT_CATALOG, load_catalog
+from engine import DonutEngine
+from incremental import IncrementalSolver
+from pool import MODES
+from recipe_index import RecipeIndex
+
+# ---------------------------------------------------------------------
+# LOAD TEST
+# ---------------------------------------------------------------------
+# Simulates N concurrent users of one app instance on this machine and
+# reports how click latency, errors, CPU and open solver subprocesses change
+# with N. A user picks a donut, edits a few inventory cells, clicks
+# "Calculate Recipes", waits for the answer, thinks for a while (exponential,
+# --think seconds on average) and goes again.
+#
+# Two drivers:
+#   engine   the app's solve path without the UI: one shared engine with its
+#            result cache and recipe index, an IncrementalSolver per user, and
+#            each click a SolveJob on a shared thread pool, as in app.py.
+#            Cheap enough to simulate hundreds of users.
+#   apptest  every user is a streamlit.testing AppTest of app.py, so a click
+#            is a full script rerun (widgets, tables, solve, display).
+#
+#   python loadtest.py --users 1 4 16 64 --duration 30
+#   python loadtest.py --driver apptest --users 1 2 4 --duration 60 --output load.json
+#
+# Subprocesses are counted from /proc, so this runs on Linux only.
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.py")
+
+
+def solver_subprocesses(pid=None):
+    # Live descendants of `pid` (default: this process): CBC binaries, pool workers.
+    pid = pid or os.getpid()
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", encoding="utf-8") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name is in parentheses and may contain spaces; ppid follows it.
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    found, stack = [], list(children.get(pid, []))
+    while stack:
+        child = stack.pop()
+        found.append(child)
+        stack.extend(children.get(child, []))
+    return len(found)
+
+
+class Sampler:
+    # Samples the subprocess count every `interval` seconds on a background thread.
+    def __init__(self, interval=0.1):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.samples.append(solver_subprocesses())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self):
+        samples = self.samples or [0]
+        return {"mean": round(sum(samples) / len(samples), 2), "max": max(samples)}
+
+
+def cpu_seconds():
+    # Children are only counted once reaped, which PuLP does for every CBC run.
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return own.ru_utime + own.ru_stime + children.ru_utime + children.ru_stime
+
+
+class User:
+    # One simulated user: a bag that drifts between clicks and a favorite donut.
+    def __init__(self, donuts, n_berries, rng, profile="typical"):
+        self.donuts = donuts
+        self.rng = rng
+        self.inventory = generate_inventories(n_berries, profile, 1, rng)[0]
+        self.donut = donuts[rng.integers(len(donuts))]
+
+    def next_click(self):
+        # Most clicks follow a small edit; some switch donut instead.
+        if self.rng.random() < 0.3:
+            self.donut = self.donuts[self.rng.integers(len(self.donuts))]
+        else:
+            for i in self.rng.integers(len(self.inventory), size=self.rng.integers(1, 4)):
+                self.inventory[i] = max(0, self.inventory[i] + self.rng.choice([-2, -1, 1, 2]))
+        return self.donut, self.inventory.copy()
+
+    def think(self, mean, deadline):
+        time.sleep(max(0.0, min(self.rng.exponential(mean), deadline - time.monotonic())))
+
+
+class EngineDriver:
+    def __init__(self, args):
+        self.engine = DonutEngine.from_catalog(load_catalog(args.catalog), backend=args.solver)
+        if not args.no_index:
+            self.engine.recipe_index = RecipeIndex.load(self.engine)
+        self.args = args
+
+    def start_level(self):
+        # A cold result cache per level, so levels are comparable.
+        if self.args.cache_size > 0:
+            self.engine.cache = SolveCache(maxsize=self.args.cache_size, fingerprint=self.engine.fingerprint)
+        self.executor = ThreadPoolExecutor(thread_name_prefix="donut-job")
+
+    def end_level(self):
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def session(self):
+        return IncrementalSolver(self.engine)
+
+    def click(self, session, donut, inventory):
+        # Returns the solve statuses; raises on a failed solve.
+        job = SolveJob(self.executor, session, donut, inventory, time_limit=self.args.time_limit, gap=self.args.gap)
+        while not job.poll():
+            time.sleep(0.005)
+        return [job.outcome(mode).status for mode in MODES]
+
+
+class AppTestDriver:
+    def __init__(self, args):
+        from streamlit.testing.v1 import AppTest
+        from translations import TRANSLATIONS
+
+        # Read by app.py on every run. The catalog is whatever app.py loads
+        # (DONUT_CATALOG), since it shares this process's catalog module.
+        os.environ["DONUT_TIME_LIMIT"] = str(args.time_limit or 0)
+        os.environ["DONUT_GAP"] = str(args.gap)
+        os.environ["DONUT_SOLVER"] = args.solver
+        self._app_test = AppTest
+        # Labels of the page's default language, the first one.
+        self._labels = next(iter(TRANSLATIONS.values()))
+        self.engine = DonutEngine.from_catalog(CATALOG)
+        self.args = args
+
+    def start_level(self):
+        pass
+
+    def end_level(self):
+        pass
+
+    def session(self):
+        # Opening the page is part of a session, not of a click.
+        at = self._app_test.from_file(APP_PATH, default_timeout=self.args.timeout).run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return at
+
+    def click(self, at, donut, inventory):
+        donut_box = next(box for box in at.selectbox if box.label == self._labels["select_label"])
+        donut_box.set_value(donut)
+        at.session_state["inventory"] = inventory
+        button = next(b for b in at.button if b.label == self._labels["calc_button"])
+        button.click().run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        # Only limited solves can be told apart on the page.
+        limited = [w for w in at.warning if self._labels["solve_timeout"] in w.value]
+        limited += [s for s in at.success if f"({self._labels['solve_incumbent']})" in s.value]
+        return ["Time limit"] * len(limited)
+
+
+def run_level(driver, users, args, level):
+    records = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    def simulate(user_id):
+        rng = np.random.default_rng([args.seed, level, user_id])
+        user = User(driver.engine.donuts, len(driver.engine.names), rng, args.profile)
+        try:
+            session = driver.session()
+        except Exception as exc:
+            with lock:
+                records.append((None, f"{type(exc).__name__}: {exc}", []))
+            return
+        # Users arrive spread over the first think time rather than all at once.
+        user.think(args.think, deadline)
+        while time.monotonic() < deadline:
+            donut, inventory = user.next_click()
+            start = time.perf_counter()
+            error, statuses = None, []
+            try:
+                statuses = driver.click(session, donut, inventory)
+            except Exception as exc:
+                error = f"{type(exc).__name__}: {exc}"
+            with lock:
+                records.append((time.perf_counter() - start, error, statuses))
+            user.think(args.think, deadline)
+
+    driver.start_level()
+    cpu_before = cpu_seconds()
+    wall_before = time.perf_counter()
+    with Sampler() as sampler:
+        threads = [threading.Thread(target=simulate, args=(u,), daemon=True) for u in range(users)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    wall = time.perf_counter() - wall_before
+    cpu = cpu_seconds() - cpu_before
+    driver.end_level()
+
+    timings = [seconds for seconds, error, _ in records if error is None and seconds is not None]
+    errors = [error for _, error, _ in records if error is not None]
+    limited = sum(status in ("Time limit", "Cancelled") for _, _, statuses in records for status in statuses)
+    return {
+        "users": users,
+        "clicks": len(records),
+        "clicks_per_s": round(len(records) / wall, 2),
+        "latency": latency_summary(timings) if timings else None,
+        "errors": len(errors),
+        "error_samples": sorted(set(errors))[:5],
+        "time_limited": limited,
+        "cpu_s": round(cpu, 2),
+        # 1.0 is one core busy for the whole level.
+        "cpu_cores_used": round(cpu / wall, 2),
+        "subprocesses": sampler.summary(),
+    }
+
+
+def print_level(row):
+    latency = row["latency"] or {}
+    print(
+        f"{row['users']:>6}{row['clicks']:>8}{latency.get('p50_ms', 0):>10.1f}{latency.get('p95_ms', 0):>10.1f}"
+        f"{latency.get('p99_ms', 0):>10.1f}{row['errors']:>8}{row['cpu_cores_used']:>8.2f}"
+        f"{row['subprocesses']['max']:>8}",
+        file=sys.stderr,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate concurrent users and report latency versus concurrency.")
+    parser.add_argument("--driver", choices=["engine", "apptest"], default="engine")
+    parser.add_argument("--users", type=int, nargs="*", default=[1, 4, 16, 64], help="concurrency levels")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds per level")
+    parser.add_argument("--think", type=float, default=2.0, help="mean think time between clicks, seconds")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="typical", help="starting bags (see bench.py)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="engine driver: catalog directory")
+    parser.add_argument("--solver", default="auto")
+    parser.add_argument("--no-index", action="store_true", help="engine driver: skip the recipe index")
+    parser.add_argument("--cache-size", type=int, default=4096, help="engine driver: 0 disables the result cache")
+    parser.add_argument("--time-limit", type=float, default=10.0, help="per-solve limit in seconds, 0 for none")
+    parser.add_argument("--gap", type=float, default=0.0, help="relative optimality gap")
+    parser.add_argument("--timeout", type=float, default=120.0, help="apptest driver: seconds before a rerun fails")
+    parser.add_argument("--output", default=None, help="write JSON here (default: stdout)")
+    args = parser.parse_args()
+    if not sys.platform.startswith("linux"):
+        parser.error("counting solver subprocesses needs Linux /proc")
+    args.time_limit = args.time_limit or None
+
+    driver = EngineDriver(args) if args.driver == "engine" else AppTestDriver(args)
+    print(f"{'users':>6}{'clicks':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}{'cores':>8}{'procs':>8}", file=sys.stderr)
+    levels = []
+    for level, users in enumerate(args.users):
+        row = run_level(driver, users, args, level)
+        print_level(row)
+        levels.append(row)
+
+    report = {
+        "config": {
+            "driver": args.driver,
+            "duration_s": args.duration,
+            "think_s": args.think,
+            "profile": args.profile,
+            "seed": args.seed,
+            "solver": driver.engine.backend,
+            "index": args.driver == "engine" and not args.no_index,
+            "time_limit_s": args.time_limit,
+            "gap": args.gap,
+            "berries": len(driver.engine.names),
+            "donuts": len(driver.engine.donuts),
+            "cpus": os.cpu_count(),
+            "python": platform.python_version(),
+        },
+        "levels": levels,
+    }
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+import numpy as np
+from pulp import (
+    LpProblem, LpMaximize, LpMinimize, LpVariable, LpAffineExpression, LpSolutionOptimal, LpStatus, HiGHS,
+    PULP_CBC_CMD, value,
+)
+
+from recipe_index import minimal_recipes
+
+# ---------------------------------------------------------------------
+# JOINT PRODUCTION PLANNER
+# ---------------------------------------------------------------------
+# How many donuts can one bag make when every berry can only be used once?
+# Rather than copying every berry variable per donut, each *minimal recipe*
+# (the patterns stored in the recipe index) becomes one integer column:
+# "craft this exact recipe y times". A plan never benefits from extra berries
+# on top of a minimal recipe, so this loses nothing, and the model grows with
+# the number of patterns the bag can afford, not with donuts x berries.
+#
+# objective="count":  make as many donuts as possible (weighted by
+#                     `priorities`, capped by `targets`), then spend as few
+#                     rare berries as possible. Two solves, not one big-M
+#                     objective: the count first, then the rarity with that
+#                     count fixed, which CBC proves optimal far sooner.
+# objective="rarity": make exactly `targets` donuts with the fewest rare berries.
+#
+# A big bag (say a month of berry income) can afford thousands of patterns,
+# and the integer model over all of them stops being quick. With
+# `max_columns`, the LP relaxation over every pattern is solved first (that
+# stays fast) and the integer model only gets the patterns the LP uses plus
+# the `max_columns` with the best reduced costs: price-and-branch. The LP
+# optimum is returned as `bound`, so the cost of the restriction is visible.
+# `time_limit` caps each solve of the default solver; if the rarity step
+# runs out before improving anything, the count step's plan is kept. "proven" is False whenever either
+# shortcut may have cost something.
+#
+# schedule() spreads a plan over several days of berry income in two
+# stages. First, what to make: one plan for the whole period's berries,
+# which decides the recipes, so rare berries aren't stranded on an early
+# donut that a later one needed. Second, when: rolling forward a day at a
+# time, craft as many of the planned batches as that day's berries allow
+# (a tiny model over the batches left). The last day holds the whole
+# period's berries, so everything planned gets made by then and the second
+# stage never changes what is made. Expected income is a guess: re-run it
+# daily with the real bag and treat only day 1 as final.
+
+
+class ProductionPlanner:
+    def __init__(self, engine, solver=None):
+        self.engine = engine
+        self.solver = solver
+        self._patterns = {}
+
+    def patterns(self, donut):
+        # Minimal recipes for a donut, from the recipe index (NotIndexed if it has none).
+        if donut not in self._patterns:
+            self._patterns[donut] = minimal_recipes(self.engine, donut).astype(np.int64)
+        return self._patterns[donut]
+
+    def plan(self, inventory, targets=None, priorities=None, objective="count", max_columns=None, time_limit=None):
+        engine = self.engine
+        inv = engine.inventory_vector(inventory, clip=False)
+        targets = {d: int(n) for d, n in (targets or {}).items() if n is not None}
+        priorities = priorities or {}
+
+        if objective == "count":
+            donuts = [d for d in engine.donuts if targets.get(d, 1) > 0]
+            sense = LpMaximize
+        elif objective == "rarity":
+            donuts = [d for d in engine.donuts if targets.get(d, 0) > 0]
+            sense = LpMinimize
+        else:
+            raise ValueError(f"Unknown objective {objective!r}, expected 'count' or 'rarity'")
+
+        # One column per affordable pattern.
+        columns = []
+        for donut in donuts:
+            table = self.patterns(donut)
+            for row in table[np.all(table <= inv, axis=1)]:
+                used = np.flatnonzero(row)
+                columns.append((donut, row, int(row @ engine.weights), int(np.min(inv[used] // row[used]))))
+
+        solver = self.solver or self._default_solver(time_limit)
+        bound = None
+        if columns and max_columns is not None and len(columns) > max_columns:
+            prob, y = self._model(columns, inv, donuts, targets, priorities, objective, sense, relax=True)
+            prob.solve(solver)
+            if LpStatus[prob.status] != "Optimal":
+                return self._empty_plan(LpStatus[prob.status], donuts, inv)
+            lp = [value(var) or 0.0 for var in y]
+            if objective == "count":
+                bound = sum(priorities.get(donut, 1) * times for times, (donut, _, _, _) in zip(lp, columns))
+            else:
+                bound = sum(cost * times for times, (_, _, cost, _) in zip(lp, columns))
+            # Reduced costs are <= 0 at a maximum and >= 0 at a minimum; closest to zero first.
+            sign = -1 if sense == LpMaximize else 1
+            ranked = sorted(range(len(columns)), key=lambda j: sign * (y[j].dj or 0.0))
+            keep = set(ranked[:max_columns]) | {j for j, times in enumerate(lp) if times > 1e-6}
+            columns = [columns[j] for j in sorted(keep)]
+
+        prob, y = self._model(columns, inv, donuts, targets, priorities, objective, sense)
+        proven = True
+        chosen = []
+        if columns:
+            prob.solve(solver)
+            status = LpStatus[prob.status]
+            proven = bound is None and prob.sol_status == LpSolutionOptimal
+            chosen = [int(round(value(var) or 0)) for var in y]
+            if objective == "count" and status == "Optimal":
+                # Second step: keep that many donuts, spend the fewest rare berries.
+                best = round(value(prob.objective) or 0)
+                prob.sense = LpMinimize
+                prob.setObjective(LpAffineExpression([(var, cost) for var, (_, _, cost, _) in zip(y, columns)]))
+                prob += LpAffineExpression([
+                    (var, priorities.get(donut, 1)) for var, (donut, _, _, _) in zip(y, columns)
+                ]) >= best, "donuts_made"
+                prob.solve(solver)
+                if LpStatus[prob.status] == "Optimal":
+                    chosen = [int(round(value(var) or 0)) for var in y]
+                    proven = proven and prob.sol_status == LpSolutionOptimal
+                else:
+                    # Out of time before any cheaper plan: keep the first step's.
+                    proven = False
+        else:
+            # Nothing is affordable: making zero donuts is the (only) plan.
+            status = "Optimal" if objective == "count" else "Infeasible"
+
+        made = {donut: 0 for donut in donuts}
+        batches = []
+        used = np.zeros(len(engine.names), dtype=np.int64)
+        if status == "Optimal":
+            for times, (donut, row, _, _) in zip(chosen, columns):
+                if times:
+                    made[donut] += times
+                    used += times * row
+                    batches.append({"donut": donut, "times": times, "counts": row})
+
+        return {
+            "status": status,
+            "made": made,
+            "batches": batches,
+            "used": used,
+            "leftover": inv - used,
+            "rarity": int(used @ engine.weights),
+            "columns": len(columns),
+            "bound": bound,
+            "proven": proven,
+        }
+
+    def _model(self, columns, inv, donuts, targets, priorities, objective, sense, relax=False):
+        engine = self.engine
+        prob = LpProblem("DonutPlan", sense)
+        y = [
+            LpVariable(f"craft_{j}", lowBound=0, upBound=limit, cat="Continuous" if relax else "Integer")
+            for j, (_, _, _, limit) in enumerate(columns)
+        ]
+
+        if objective == "count" and relax:
+            # Donuts first, rarity as a tie-break: no amount of saved berries is
+            # worth one donut. Fine for the LP, whose reduced costs rank columns.
+            big = int(inv @ engine.weights) + 1
+            prob += LpAffineExpression([
+                (var, big * priorities.get(donut, 1) - cost) for var, (donut, _, cost, _) in zip(y, columns)
+            ])
+        elif objective == "count":
+            # The integer model runs lexicographically (see plan()): a big-M
+            # weighting is slow for the solver to prove optimal.
+            prob += LpAffineExpression([(var, priorities.get(donut, 1)) for var, (donut, _, _, _) in zip(y, columns)])
+        else:
+            prob += LpAffineExpression([(var, cost) for var, (_, _, cost, _) in zip(y, columns)])
+
+        per_berry = {}
+        per_donut = {donut: [] for donut in donuts}
+        for var, (donut, row, _, _) in zip(y, columns):
+            per_donut[donut].append((var, 1))
+            for i in np.flatnonzero(row).tolist():
+                per_berry.setdefault(i, []).append((var, int(row[i])))
+        for i, terms in per_berry.items():
+            prob += LpAffineExpression(terms) <= int(inv[i])
+        for donut, terms in per_donut.items():
+            if donut in targets:
+                if objective == "count":
+                    prob += LpAffineExpression(terms) <= targets[donut]
+                else:
+                    prob += LpAffineExpression(terms) >= targets[donut]
+        return prob, y
+
+    def _empty_plan(self, status, donuts, inv):
+        return {
+            "status": status,
+            "made": {donut: 0 for donut in donuts},
+            "batches": [],
+            "used": np.zeros(len(self.engine.names), dtype=np.int64),
+            "leftover": inv,
+            "rarity": 0,
+            "columns": 0,
+            "bound": None,
+            "proven": True,
+        }
+
+    def schedule(
+        self, inventory, income, days, targets=None, priorities=None, objective="count", max_columns=100, time_limit=5
+    ):
+        # Day-by-day plan over `days` days. `income` is how many of each berry
+        # arrive at the start of every day after the first (a vector or a
+        # {berry: count} mapping); `targets` are totals for the whole period.
+        # Returns plan()'s result for the period plus "days": one list of
+        # batches ({"donut", "times", "counts"}) per day.
+        engine = self.engine
+        inv = engine.inventory_vector(inventory, clip=False)
+        income = engine.inventory_vector(income, clip=False)
+        days = max(int(days), 1)
+        plan = self.plan(
+            inv + (days - 1) * income, targets, priorities, objective, max_columns=max_columns, time_limit=time_limit
+        )
+        plan["days"] = [[] for _ in range(days)]
+        batches = plan["batches"]
+        if plan["status"] != "Optimal" or not batches:
+            return plan
+
+        # Day by day, craft as many of the remaining batches as the berries on hand allow.
+        priorities = priorities or {}
+        left = [batch["times"] for batch in batches]
+        used = np.zeros(len(engine.names), dtype=np.int64)
+        for d in range(days):
+            if not any(left):
+                break
+            stock = inv + d * income - used
+            crafted = self._craft_today(batches, left, stock, priorities)
+            for b, times in enumerate(crafted):
+                if times:
+                    left[b] -= times
+                    used += times * batches[b]["counts"]
+                    plan["days"][d].append({"donut": batches[b]["donut"], "times": times, "counts": batches[b]["counts"]})
+        return plan
+
+    def _craft_today(self, batches, left, stock, priorities):
+        # How many of each remaining batch to craft from `stock`: everything if it
+        # fits, otherwise the most (priority-weighted) donuts a small model finds.
+        need = sum(times * batch["counts"] for times, batch in zip(left, batches))
+        if np.all(need <= stock):
+            return list(left)
+        prob = LpProblem("DonutDay", LpMaximize)
+        x = [LpVariable(f"craft_{b}", lowBound=0, upBound=times, cat="Integer") for b, times in enumerate(left)]
+        prob += LpAffineExpression([(var, priorities.get(batch["donut"], 1)) for var, batch in zip(x, batches)])
+        for i in np.flatnonzero(need > stock).tolist():
+            prob += LpAffineExpression([(var, int(batch["counts"][i])) for var, batch in zip(x, batches)]) <= int(stock[i])
+        prob.solve(self.solver or self._default_solver())
+        return [int(round(value(var) or 0)) for var in x]
+
+    @staticmethod
+    def _default_solver(time_limit=None):
+        highs = HiGHS(msg=False, timeLimit=time_limit)
+        return highs if highs.available() else PULP_CBC_CMD(msg=False, timeLimit=time_limit)
@@ -0,0 +1,79 @@
+import contextvars
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+
+# ---------------------------------------------------------------------
+# SOLVER POOL
+# ---------------------------------------------------------------------
+# Runs many independent solves concurrently. "thread" shares the caller's
+# engine (and its cache) and is the right choice when answers come from the
+# recipe index or the CBC subprocess. "process" gives each worker its own
+# copy of the engine, so the pure-Python branch and bound can use every core;
+# the parent still checks and fills the shared cache.
+
+MODES = ("min", "max")
+
+_MISSING = object()
+_worker_engine = None
+
+
+def _init_worker(engine):
+    global _worker_engine
+    _worker_engine = engine
+
+
+def _solve_in_worker(donut, inventory, mode):
+    return _worker_engine.solve_counts(donut, inventory, mode)
+
+
+class SolverPool:
+    def __init__(self, engine, workers=None, kind="thread"):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown pool kind {kind!r}, expected 'thread' or 'process'")
+        self.engine = engine
+        self.kind = kind
+        if kind == "process":
+            self._executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(engine,))
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="donut-solver")
+
+    def submit(self, donut, inventory, mode="min"):
+        # Returns a Future resolving to the optimal count vector (or None).
+        inv = self.engine.inventory_vector(inventory)
+        if self.kind == "thread":
+            # In a copy of the caller's context, so solves report to its timing.PhaseTimer.
+            return self._executor.submit(contextvars.copy_context().run, self.engine.solve_counts, donut, inv, mode)
+
+        cache = self.engine.cache
+        if cache is None:
+            return self._executor.submit(_solve_in_worker, donut, inv, mode)
+
+        key = cache.key(donut, mode, inv)
+        hit = cache.get(key, _MISSING)
+        if hit is not _MISSING:
+            future = Future()
+            future.set_result(hit)
+            return future
+
+        def remember(done):
+            if not done.cancelled() and done.exception() is None:
+                cache.put(key, done.result())
+
+        future = self._executor.submit(_solve_in_worker, donut, inv, mode)
+        future.add_done_callback(remember)
+        return future
+
+    def solve_all(self, inventory, donuts=None):
+        # Every donut x {economy, luxury} in flight at once.
+        # Returns {donut: {"min": counts or None, "max": counts or None}}.
+        donuts = list(donuts or self.engine.donuts)
+        futures = {(donut, mode): self.submit(donut, inventory, mode) for donut in donuts for mode in MODES}
+        return {donut: {mode: futures[donut, mode].result() for mode in MODES} for donut in donuts}
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=not wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
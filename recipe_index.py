@@ -0,0 +1,223 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from catalog import DEFAULT_CATALOG, load_catalog
+from engine import DonutEngine, MAX_SLOTS
+
+# ---------------------------------------------------------------------
+# PRECOMPUTED RECIPE INDEX
+# ---------------------------------------------------------------------
+# The thresholds in `recipes` never change and a donut holds at most 8
+# berries, so the set of *minimal* recipes (drop any single berry and a
+# flavor falls short) is finite and small. We enumerate it offline and
+# store it ranked by the economy weight. At request time:
+#   economy -> first entry the inventory dominates
+#   luxury  -> best dominated entry, topped up greedily with the rarest
+#              berries left over (every luxury optimum is a minimal recipe
+#              plus such a top-up)
+# so neither mode needs CBC.
+#
+# Enumerating is slow (over a minute for the shipped catalog even on a
+# process pool, minutes per donut once a catalog has a few dozen berries),
+# so it only ever happens here, offline. Indexes are keyed by the engine
+# fingerprint, so one built for another catalog (DONUT_CATALOG) or after a
+# threshold edit is picked up without replacing the shipped one:
+#
+#   python recipe_index.py [--catalog DIR]
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+DEFAULT_INDEX_PATH = os.path.join(DATA_DIR, "recipe_index.npz")
+INDEX_DIR = os.path.join(DATA_DIR, "indexes")
+
+
+class NotIndexed(LookupError):
+    pass
+
+
+def index_path(engine):
+    return os.path.join(INDEX_DIR, f"{engine.fingerprint[:16]}.npz")
+
+
+def enumerate_minimal_recipes(flavors, target, max_slots=MAX_SLOTS):
+    # Depth-first over berries in catalog order, choosing how many of each to add.
+    # A branch is cut as soon as the remaining slots can't close a flavor gap even
+    # with the strongest berry still to come.
+    flavors = [tuple(row) for row in np.asarray(flavors).tolist()]
+    target = [int(x) for x in target]
+    n = len(flavors)
+    n_flavors = len(target)
+
+    suffix_max = [[0] * n_flavors for _ in range(n + 1)]
+    for i in range(n - 1, -1, -1):
+        suffix_max[i] = [max(suffix_max[i + 1][k], flavors[i][k]) for k in range(n_flavors)]
+
+    found = []
+    counts = [0] * n
+
+    def is_minimal(upto, achieved):
+        for j in range(upto + 1):
+            if counts[j]:
+                fj = flavors[j]
+                if all(achieved[k] - fj[k] >= target[k] for k in range(n_flavors)):
+                    return False
+        return True
+
+    def visit(i, slots, deficit):
+        if i == n or slots == 0:
+            return
+        best = suffix_max[i]
+        for k in range(n_flavors):
+            if deficit[k] > slots * best[k]:
+                return
+
+        visit(i + 1, slots, deficit)
+
+        fi = flavors[i]
+        d = deficit
+        for c in range(1, slots + 1):
+            d = [d[k] - fi[k] for k in range(n_flavors)]
+            counts[i] = c
+            if max(d) <= 0:
+                # Feasible: adding more of anything would only make it non-minimal.
+                achieved = [target[k] - d[k] for k in range(n_flavors)]
+                if is_minimal(i, achieved):
+                    found.append(tuple(counts))
+                break
+            visit(i + 1, slots - c, d)
+        counts[i] = 0
+
+    visit(0, max_slots, target)
+    return np.array(found, dtype=np.uint8).reshape(-1, n)
+
+
+def minimal_recipes(engine, donut, enumerate_missing=False):
+    # A donut's minimal recipes in economy order (uint8 rows), from the engine's
+    # index. A donut it doesn't cover raises NotIndexed: enumerating it takes
+    # minutes, which no request can wait for. Offline callers can pass
+    # enumerate_missing=True instead (and should keep the result).
+    index = engine.recipe_index
+    if index is not None and index.covers(donut):
+        return index.tables[donut]
+    if not enumerate_missing:
+        raise NotIndexed(f"{donut!r} is not in the recipe index; build it with: python recipe_index.py")
+    table = enumerate_minimal_recipes(engine.flavors, engine.targets[donut], engine.max_slots)
+    return table[np.argsort(table.astype(np.int64) @ engine.weights, kind="stable")]
+
+
+def _enumerate_for(args):
+    flavors, target = args
+    return enumerate_minimal_recipes(flavors, target)
+
+
+def build_index(engine, workers=None):
+    jobs = [(engine.flavors, engine.targets[d]) for d in engine.donuts]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        found = list(pool.map(_enumerate_for, jobs))
+
+    arrays = {
+        "berries": np.array(engine.names),
+        "donuts": np.array(engine.donuts),
+        "flavors": engine.flavors,
+        "targets": np.array([engine.targets[d] for d in engine.donuts]),
+    }
+    for k, counts in enumerate(found):
+        # Stable sort keeps catalog order among equal-weight recipes.
+        cost = counts.astype(np.int64) @ engine.weights
+        arrays[f"recipes_{k}"] = counts[np.argsort(cost, kind="stable")]
+    return arrays
+
+
+class RecipeIndex:
+    def __init__(self, engine, tables):
+        self.engine = engine
+        self.tables = tables
+        # Per-donut economy weight of each entry, in index order (ascending).
+        self.costs = {d: t.astype(np.int64) @ engine.weights for d, t in tables.items()}
+        self.sizes = {d: t.sum(axis=1, dtype=np.int64) for d, t in tables.items()}
+        # Rarest-first weights for the luxury top-up.
+        self._rev_weights = engine.weights[::-1]
+
+    @classmethod
+    def load(cls, engine, path=None):
+        # The index built for this exact catalog, else the shipped one; None when
+        # neither exists or matches the catalog's berries.
+        for candidate in [path] if path else [index_path(engine), DEFAULT_INDEX_PATH]:
+            index = cls._load(engine, candidate)
+            if index is not None:
+                return index
+        return None
+
+    @classmethod
+    def _load(cls, engine, path):
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as data:
+            if (
+                data["berries"].tolist() != engine.names
+                or not np.array_equal(data["flavors"], engine.flavors)
+            ):
+                return None
+            targets = {d: t for d, t in zip(data["donuts"].tolist(), data["targets"])}
+            tables = {}
+            for k, donut in enumerate(data["donuts"].tolist()):
+                # A donut whose thresholds changed is left out and falls back to the solver.
+                if donut in engine.targets and np.array_equal(targets[donut], engine.targets[donut]):
+                    tables[donut] = data[f"recipes_{k}"]
+        return cls(engine, tables)
+
+    def covers(self, donut):
+        return donut in self.tables
+
+    def lookup(self, donut, inventory, mode="min"):
+        inv = self.engine.inventory_vector(inventory)
+        table = self.tables[donut]
+        dominated = np.flatnonzero(np.all(table <= inv, axis=1))
+        if dominated.size == 0:
+            return None
+
+        if mode == "min":
+            return table[dominated[0]].astype(np.int64)
+
+        base = table[dominated].astype(np.int64)
+        # Greedy top-up with the rarest leftovers, vectorized over every candidate.
+        leftover = (inv - base)[:, ::-1]
+        slots = MAX_SLOTS - self.sizes[donut][dominated]
+        before = np.cumsum(leftover, axis=1) - leftover
+        extra = np.clip(slots[:, None] - before, 0, leftover)
+        totals = self.costs[donut][dominated] + extra @ self._rev_weights
+        best = int(np.argmax(totals))
+        return base[best] + extra[best, ::-1]
+
+    def ranked(self, donut, inventory, k):
+        # The k cheapest minimal recipes the inventory can make, in economy order.
+        inv = self.engine.inventory_vector(inventory)
+        table = self.tables[donut]
+        dominated = np.flatnonzero(np.all(table <= inv, axis=1))[:k]
+        return [table[i].astype(np.int64) for i in dominated]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the precomputed recipe index.")
+    parser.add_argument("--catalog", default=DEFAULT_CATALOG, help="catalog directory")
+    parser.add_argument("--output", default=None, help="default: keyed by the catalog's fingerprint")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    engine = DonutEngine.from_catalog(load_catalog(args.catalog))
+    output = args.output or index_path(engine)
+    arrays = build_index(engine, workers=args.workers)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    np.savez_compressed(output, **arrays)
+
+    for k, donut in enumerate(engine.donuts):
+        print(f"{donut}: {len(arrays[f'recipes_{k}'])} minimal recipes")
+    print(f"Wrote {output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import threading
+from concurrent.futures import wait
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cache import SolveCache
+from engine import DonutEngine
+from pool import MODES, SolverPool
+from recipe_index import RecipeIndex
+
+# ---------------------------------------------------------------------
+# JSON HTTP API
+# ---------------------------------------------------------------------
+# A small standard-library HTTP front end for the engine, for clients that
+# don't need the Streamlit UI (and for load testing one box).
+#
+#   POST /solve   {"inventory": {...} | [...], "donut": "<name>" | "all"}
+#                 -> {"results": {donut: {"economy": {...} | null, "luxury": ...}}}
+#   GET  /health  -> pool occupancy and cache counters
+#
+# Solves run on a bounded SolverPool. At most --max-pending requests may be
+# in flight; the next one gets 429 straight away instead of queueing, and a
+# request that takes longer than --timeout seconds gets 504.
+
+MODE_KEYS = {"min": "economy", "max": "luxury"}
+# A full inventory as a JSON object is a few KB even for big catalogs.
+MAX_BODY_BYTES = 64 * 1024
+
+
+class DonutAPI:
+    def __init__(self, engine, pool, max_pending=64, timeout=10.0):
+        self.engine = engine
+        self.pool = pool
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.rejected = 0
+        self.timed_out = 0
+
+    def solve(self, payload):
+        # Returns (HTTP status, JSON body).
+        if not isinstance(payload, dict) or "inventory" not in payload:
+            return 400, {"error": "expected a JSON object with an 'inventory' field"}
+        donut = payload.get("donut", "all")
+        if not isinstance(donut, str):
+            return 400, {"error": "'donut' must be a donut name or \"all\""}
+        if donut == "all":
+            donuts = self.engine.donuts
+        elif donut in self.engine.targets:
+            donuts = [donut]
+        else:
+            return 404, {"error": f"unknown donut {donut!r}", "donuts": self.engine.donuts}
+        try:
+            inv = self.engine.inventory_vector(payload["inventory"])
+        except (KeyError, TypeError, ValueError, OverflowError) as exc:
+            return 400, {"error": f"bad inventory: {exc}"}
+
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            return 429, {"error": "solver pool is saturated, retry shortly"}
+        with self._lock:
+            self.in_flight += 1
+        try:
+            futures = {(d, mode): self.pool.submit(d, inv, mode) for d in donuts for mode in MODES}
+            done, pending = wait(futures.values(), timeout=self.timeout)
+            if pending:
+                for future in pending:
+                    future.cancel()
+                with self._lock:
+                    self.timed_out += 1
+                return 504, {"error": f"solve exceeded {self.timeout:g}s"}
+            results = {
+                d: {MODE_KEYS[mode]: self.engine.recipe_mapping(futures[d, mode].result()) for mode in MODES}
+                for d in donuts
+            }
+            return 200, {"results": results}
+        except Exception as exc:
+            # A crashed solve must not take the connection down with it.
+            return 500, {"error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+            self._slots.release()
+
+    def health(self):
+        with self._lock:
+            body = {
+                "ok": True,
+                "in_flight": self.in_flight,
+                "max_pending": self.max_pending,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+            }
+        if self.engine.cache is not None:
+            body["cache"] = self.engine.cache.stats()
+        return 200, body
+
+
+class DonutRequestHandler(BaseHTTPRequestHandler):
+    server_version = "DonutAPI/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._reply(*self.server.api.health())
+        elif self.path == "/donuts":
+            self._reply(200, {"donuts": self.server.api.engine.donuts})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._reply(404, {"error": "not found"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            # The body is left unread, so the connection can't be reused.
+            self.close_connection = True
+            if length < 0:
+                self._reply(400, {"error": "a non-negative integer Content-Length is required"})
+            else:
+                self._reply(413, {"error": f"request body over {MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"null")
+        except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+            self._reply(400, {"error": f"invalid JSON: {exc}"})
+            return
+        self._reply(*self.server.api.solve(payload))
+
+    def _reply(self, status, body):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if status == 429:
+            self.send_header("Retry-After", "1")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class DonutHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections long before the pool is saturated;
+    # overload should surface as 429s, not TCP resets.
+    request_queue_size = 256
+
+
+def make_server(api, host="127.0.0.1", port=8000, quiet=False):
+    server = DonutHTTPServer((host, port), DonutRequestHandler)
+    server.api = api
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the donut solver as a JSON HTTP API.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="solver pool size")
+    parser.add_argument("--pool", choices=["thread", "process"], default="process")
+    parser.add_argument("--max-pending", type=int, default=64, help="requests in flight before answering 429")
+    parser.add_argument("--timeout", type=float, default=10.0, help="per-request solve timeout in seconds")
+    parser.add_argument("--solver", default="auto")
+    parser.add_argument("--cache-size", type=int, default=4096, help="0 disables the result cache")
+    parser.add_argument("--quiet", action="store_true", help="don't log every request")
+    args = parser.parse_args()
+
+    engine = DonutEngine(backend=args.solver)
+    engine.recipe_index = RecipeIndex.load(engine)
+    if args.cache_size > 0:
+        engine.cache = SolveCache(maxsize=args.cache_size, fingerprint=engine.fingerprint)
+
+    pool = SolverPool(engine, workers=args.workers, kind=args.pool)
+    api = DonutAPI(engine, pool, max_pending=args.max_pending, timeout=args.timeout)
+    server = make_server(api, args.host, args.port, quiet=args.quiet)
+    print(f"Serving on http://{args.host}:{args.port} ({args.pool} pool, {args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool.shutdown(wait=False)
+
+
+if __name__ == "__main__":
+    main()
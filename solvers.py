@@ -0,0 +1,597 @@
+import argparse
+import heapq
+import math
+import time
+from collections import namedtuple
+
+import numpy as np
+from pulp import HiGHS, LpSolutionIntegerFeasible, LpStatus, PULP_CBC_CMD, value
+
+import timing
+
+# ---------------------------------------------------------------------
+# SOLVER BACKENDS
+# ---------------------------------------------------------------------
+# Every backend has the signature backend(engine, donut, inventory, mode,
+# hint=None) and returns a SolveOutcome. "bnb" runs entirely in-process;
+# "cbc" is PuLP's bundled CBC binary (temp files + subprocess) and stays as
+# the fallback; "highs" is used only if `highspy` is installed. "auto", the
+# engine default, picks by catalog size (see pick_backend): bnb's search
+# tree grows much faster with the berry count than a MIP solver's.
+#
+# A WarmStart hint carries what an earlier solve already proved: a recipe
+# that is still feasible (`incumbent`) and/or an objective no recipe can
+# beat (`bound`). Backends use what they can and ignore the rest.
+#
+# SolveLimits bounds one solve: `time_limit` in seconds, `gap` a relative
+# optimality gap (0.02 accepts a recipe within 2% of the best), `cancel`
+# anything with an is_set() method (a threading.Event), and `progress` a
+# callable(nodes, objective) the search calls now and then from its own
+# thread. A solve that stops early reports status "Time limit" or
+# "Cancelled", with the best recipe found so far as `counts` if it has one.
+# With a gap, "Optimal" means optimal within that gap, as in CBC.
+
+SolveOutcome = namedtuple("SolveOutcome", ["counts", "status", "objective", "nodes"])
+WarmStart = namedtuple("WarmStart", ["incumbent", "bound"])
+SolveLimits = namedtuple("SolveLimits", ["time_limit", "gap", "cancel", "progress"], defaults=(None, 0.0, None, None))
+
+_UNREACHABLE = np.iinfo(np.int32).max
+_cover_cache = {}
+# Nodes between two looks at the clock / cancel flag.
+_CHECK_EVERY = 1024
+
+
+class _Proven(Exception):
+    # Raised inside branch_and_bound once the incumbent meets `stop_at`.
+    pass
+
+
+class _Stopped(Exception):
+    # Raised inside branch_and_bound when a SolveLimits runs out; args[0] is the status.
+    pass
+
+
+def exact(outcome, limits=None):
+    # True if `outcome` is the true optimum (or a proof there is none), which
+    # is what may be cached or reused.
+    if outcome.status == "Infeasible":
+        return True
+    return outcome.status == "Optimal" and (limits is None or not limits.gap)
+
+
+def exact_outcome(counts, weights):
+    # The SolveOutcome for an answer known to be exact (cache, index, reuse).
+    if counts is None:
+        return SolveOutcome(None, "Infeasible", None, None)
+    return SolveOutcome(counts, "Optimal", int(counts @ weights), None)
+
+
+def _cover_costs(flavors, weights, max_slots):
+    # cover[k][q, s, d]: cheapest weight that adds at least d of flavor k with at
+    # most s berries drawn from positions q.. of the rarest-first order, ignoring
+    # inventory. The last table is the same for all flavors summed. Ignoring
+    # inventory only makes it cheaper, so it is a valid economy lower bound, and it
+    # depends on the catalog alone, so it is built once per catalog.
+    key = (flavors.tobytes(), flavors.shape, weights.tobytes(), max_slots)
+    if key in _cover_cache:
+        return _cover_cache[key]
+
+    order = np.argsort(-weights, kind="stable")
+    n = len(order)
+    columns = [flavors[:, k] for k in range(flavors.shape[1])] + [flavors.sum(axis=1)]
+    tables = []
+    for col in columns:
+        depth = int(col.max()) * max_slots
+        span = np.arange(depth + 1)
+        table = np.full((n + 1, max_slots + 1, depth + 1), _UNREACHABLE, dtype=np.int64)
+        table[:, :, 0] = 0
+        for q in range(n - 1, -1, -1):
+            i = order[q]
+            table[q] = table[q + 1]
+            gain = int(col[i])
+            if gain == 0:
+                continue
+            source = np.maximum(span - gain, 0)
+            for slots in range(1, max_slots + 1):
+                np.minimum(table[q, slots], int(weights[i]) + table[q, slots - 1][source], out=table[q, slots])
+        tables.append(np.minimum(table, _UNREACHABLE).astype(np.int32))
+
+    positions = np.empty(n, dtype=np.int64)
+    positions[order] = np.arange(n)
+    _cover_cache[key] = (tables, positions)
+    return tables, positions
+
+
+def cover_lower_bound(flavors, weights, deficit, slots, max_slots):
+    # Cheapest weight any `slots` berries (inventory ignored) need to add at least
+    # `deficit` of every flavor; math.inf if no such handful exists.
+    if slots < 0:
+        return math.inf
+    deficit = np.maximum(np.asarray(deficit, dtype=np.int64), 0)
+    tables, _ = _cover_costs(np.asarray(flavors), np.asarray(weights), max_slots)
+    best = 0
+    for table, d in zip(tables, list(deficit) + [int(deficit.sum())]):
+        if d >= table.shape[2]:
+            return math.inf
+        best = max(best, int(table[0, slots, d]))
+    return math.inf if best >= _UNREACHABLE else best
+
+
+def _reach_tables(rows, cap, n_flavors, max_slots):
+    # reach[p][k][s]: the most of flavor k that s slots can still add from the
+    # berries in stock at positions p.., and reach[p][-1][s] the same for all
+    # flavors summed. Anything short of that is a dead branch.
+    m = len(rows)
+    totals = [sum(row) for row in rows]
+    reach = [None] * (m + 1)
+    reach[m] = [[0] * (max_slots + 1) for _ in range(n_flavors + 1)]
+    for p in range(m - 1, -1, -1):
+        reach[p] = []
+        for k in range(n_flavors + 1):
+            values = sorted(
+                (v for q in range(p, m) for v in [rows[q][k] if k < n_flavors else totals[q]] * min(cap[q], max_slots)),
+                reverse=True,
+            )[:max_slots]
+            sums = [0]
+            for s in range(max_slots):
+                sums.append(sums[-1] + (values[s] if s < len(values) else 0))
+            reach[p].append(sums)
+    return reach
+
+
+def branch_and_bound(
+    flavors, weights, target, caps, max_slots, maximize=False, incumbent=None, stop_at=None, limits=None
+):
+    # Depth-first branch and bound for: min/max weights @ x
+    #   s.t. flavors.T @ x >= target, sum(x) <= max_slots, 0 <= x <= caps, x integer.
+    # Berries are decided rarest first. With at most 8 slots the tree is tiny
+    # once it is bounded properly. A feasible `incumbent` seeds the search so
+    # it only has to look for something strictly better; `stop_at` is an
+    # objective known to be unbeatable, and reaching it ends the search.
+    # `limits` is an optional SolveLimits.
+    deadline = None if limits is None or limits.time_limit is None else time.perf_counter() + limits.time_limit
+    flavors = np.asarray(flavors)
+    weights = np.asarray(weights)
+    order = [int(i) for i in np.flatnonzero(caps)]
+    order.sort(key=lambda i: weights[i], reverse=True)
+    rows = [tuple(int(v) for v in flavors[i]) for i in order]
+    w = [int(weights[i]) for i in order]
+    cap = [int(caps[i]) for i in order]
+    m = len(order)
+    n_flavors = len(target)
+    reach = _reach_tables(rows, cap, n_flavors, max_slots)
+
+    if not maximize:
+        cover, positions = _cover_costs(flavors, weights, max_slots)
+        depth = [table.shape[2] - 1 for table in cover]
+        start = [int(positions[i]) for i in order] + [len(positions)]
+
+    best = [-math.inf if maximize else math.inf, None]
+    if incumbent is not None:
+        best = [int(np.asarray(incumbent) @ weights), [int(incumbent[i]) for i in order]]
+    counts = [0] * m
+    nodes = 0
+
+    limits = limits or SolveLimits()
+    watched = deadline is not None or limits.cancel is not None or limits.progress is not None
+    gap = limits.gap or 0.0
+
+    def check():
+        if limits.progress is not None:
+            limits.progress(nodes, None if best[1] is None else best[0])
+        if limits.cancel is not None and limits.cancel.is_set():
+            raise _Stopped("Cancelled")
+        if deadline is not None and time.perf_counter() > deadline:
+            raise _Stopped("Time limit")
+
+    def fill_bound(p, slots):
+        # Weights are sorted descending, so the greedy fill is exact.
+        total = 0
+        while slots > 0 and p < m:
+            take = min(cap[p], slots)
+            total += take * w[p]
+            slots -= take
+            p += 1
+        return total
+
+    def visit(p, slots, deficit, cost):
+        nonlocal nodes
+        nodes += 1
+        if watched and nodes % _CHECK_EVERY == 0:
+            check()
+
+        if max(deficit) <= 0:
+            if (cost > best[0]) if maximize else (cost < best[0]):
+                best[0] = cost
+                best[1] = counts[:]
+                if stop_at is not None and cost == stop_at:
+                    raise _Proven
+            if not maximize:
+                return
+        if p == m or slots == 0:
+            return
+
+        top = reach[p]
+        short = 0
+        for k in range(n_flavors):
+            if deficit[k] > 0:
+                if deficit[k] > top[k][slots]:
+                    return
+                short += deficit[k]
+        if short > top[n_flavors][slots]:
+            return
+
+        if maximize:
+            if cost + fill_bound(p, slots) <= best[0] * (1 + gap):
+                return
+        else:
+            # Objectives are integers, so a branch must be able to beat the incumbent
+            # by one (or, with a gap, get under best * (1 - gap)).
+            q = start[p]
+            limit = (best[0] if not gap or best[1] is None else math.ceil(best[0] * (1 - gap))) - 1 - cost
+            if short > depth[n_flavors] or cover[n_flavors][q, slots, short] > limit:
+                return
+            for k in range(n_flavors):
+                if deficit[k] > 0 and (deficit[k] > depth[k] or cover[k][q, slots, deficit[k]] > limit):
+                    return
+
+        row = rows[p]
+        choices = range(min(cap[p], slots), -1, -1) if maximize else range(min(cap[p], slots) + 1)
+        for c in choices:
+            counts[p] = c
+            visit(p + 1, slots - c, [deficit[k] - c * row[k] for k in range(n_flavors)], cost + c * w[p])
+        counts[p] = 0
+
+    status = "Optimal"
+    if stop_at is None or best[0] != stop_at:
+        try:
+            visit(0, max_slots, [int(t) for t in target], 0)
+        except _Proven:
+            pass
+        except _Stopped as stop:
+            status = stop.args[0]
+
+    if best[1] is None:
+        return SolveOutcome(None, "Infeasible" if status == "Optimal" else status, None, nodes)
+    result = np.zeros(len(caps), dtype=np.int64)
+    for p, i in enumerate(order):
+        result[i] = best[1][p]
+    return SolveOutcome(result, status, int(best[0]), nodes)
+
+
+def k_best(flavors, weights, target, caps, max_slots, k, maximize=False):
+    # The k best distinct recipes for the same problem as branch_and_bound,
+    # best first, as a list of (objective, counts), plus the node count.
+    # Every count vector is generated once: a node adds one or more of a
+    # single berry at position q and its children only add berries after q.
+    # The worst of the k kept so far is the pruning threshold.
+    #
+    # Economy only ranks minimal recipes (no single berry can be dropped, as
+    # in the recipe index): a recipe plus a spare berry isn't an alternative,
+    # just a worse copy, and there would be dozens of them.
+    flavors = np.asarray(flavors)
+    weights = np.asarray(weights)
+    order = [int(i) for i in np.flatnonzero(caps)]
+    order.sort(key=lambda i: weights[i], reverse=True)
+    rows = [tuple(int(v) for v in flavors[i]) for i in order]
+    w = [int(weights[i]) for i in order]
+    cap = [int(caps[i]) for i in order]
+    m = len(order)
+    n_flavors = len(target)
+    reach = _reach_tables(rows, cap, n_flavors, max_slots)
+    if not maximize:
+        cover, positions = _cover_costs(flavors, weights, max_slots)
+        depth = [table.shape[2] - 1 for table in cover]
+        start = [int(positions[i]) for i in order] + [len(positions)]
+
+    # Min-heap on score (higher is better), so kept[0] is the worst one kept.
+    kept = []
+    counts = [0] * m
+    nodes = 0
+
+    def optimistic(p, slots, deficit, cost):
+        # Best score anything below this node can reach, or None if nothing can.
+        satisfied = max(deficit) <= 0
+        if not satisfied:
+            top = reach[p]
+            short = 0
+            for f in range(n_flavors):
+                if deficit[f] > 0:
+                    if deficit[f] > top[f][slots]:
+                        return None
+                    short += deficit[f]
+            if short > top[n_flavors][slots]:
+                return None
+        if maximize:
+            total, left = cost, slots
+            for q in range(p, m):
+                if left == 0:
+                    break
+                take = min(cap[q], left)
+                total += take * w[q]
+                left -= take
+            return total
+        if satisfied:
+            return -cost
+        q = start[p]
+        short = sum(d for d in deficit if d > 0)
+        if short > depth[n_flavors]:
+            return None
+        extra = int(cover[n_flavors][q, slots, short])
+        for f in range(n_flavors):
+            if deficit[f] > 0:
+                if deficit[f] > depth[f]:
+                    return None
+                extra = max(extra, int(cover[f][q, slots, deficit[f]]))
+        return None if extra >= _UNREACHABLE else -(cost + extra)
+
+    def visit(p, slots, deficit, cost):
+        nonlocal nodes
+        nodes += 1
+        if max(deficit) <= 0:
+            if maximize or all(
+                any(deficit[f] + rows[q][f] > 0 for f in range(n_flavors)) for q in range(p) if counts[q]
+            ):
+                score = cost if maximize else -cost
+                if len(kept) < k:
+                    heapq.heappush(kept, (score, nodes, counts[:]))
+                elif score > kept[0][0]:
+                    heapq.heapreplace(kept, (score, nodes, counts[:]))
+            if not maximize:
+                return
+        if slots == 0:
+            return
+        for q in range(p, m):
+            # The bound at q covers every child that starts at q or later, so
+            # once it fails none of the remaining children can help.
+            bound = optimistic(q, slots, deficit, cost)
+            if bound is None or (len(kept) == k and bound <= kept[0][0]):
+                break
+            row = rows[q]
+            for c in range(1, min(cap[q], slots) + 1):
+                counts[q] = c
+                visit(q + 1, slots - c, [deficit[f] - c * row[f] for f in range(n_flavors)], cost + c * w[q])
+            counts[q] = 0
+
+    if k > 0:
+        visit(0, max_slots, [int(t) for t in target], 0)
+
+    ranked = []
+    for score, _, best in sorted(kept, key=lambda item: (-item[0], item[1])):
+        result = np.zeros(len(caps), dtype=np.int64)
+        for p, i in enumerate(order):
+            result[i] = best[p]
+        ranked.append((score if maximize else -score, result))
+    return ranked, nodes
+
+
+def pareto_front(flavors, weights, cal, boost, target, caps, max_slots):
+    # Every recipe that is Pareto-optimal for (rarity weight down, Lv_Boost up,
+    # calories up), one per distinct objective vector, as a list of
+    # (weight, boost, cal, counts) sorted by weight, plus the node count.
+    # One enumeration in the same tree as k_best, with recipes kept whether or
+    # not they are minimal (a spare berry costs rarity but adds boost and
+    # calories). A branch is cut when a point already found weakly dominates
+    # its ideal point: the cheapest weight it could reach (cover-cost bound)
+    # with the most boost and calories its free slots could add.
+    flavors = np.asarray(flavors)
+    weights = np.asarray(weights)
+    order = [int(i) for i in np.flatnonzero(caps)]
+    order.sort(key=lambda i: weights[i], reverse=True)
+    rows = [tuple(int(v) for v in flavors[i]) for i in order]
+    w = [int(weights[i]) for i in order]
+    cap = [int(caps[i]) for i in order]
+    bo = [int(boost[i]) for i in order]
+    ca = [int(cal[i]) for i in order]
+    m = len(order)
+    n_flavors = len(target)
+    reach = _reach_tables(rows, cap, n_flavors, max_slots)
+    # gain[p][0][s] / gain[p][1][s]: most boost / calories s slots can add from p on.
+    gain = _reach_tables(list(zip(bo, ca)), cap, 2, max_slots)
+    cover, positions = _cover_costs(flavors, weights, max_slots)
+    depth = [table.shape[2] - 1 for table in cover]
+    start = [int(positions[i]) for i in order] + [len(positions)]
+
+    # best_cal[c, b]: most calories among points found with weight <= c and
+    # boost >= b (-1 if none), so a dominance check is a single lookup. A
+    # recipe can repeat a berry, so the extremes are 8 of the top berry.
+    top_weight = int(weights.max()) * max_slots
+    top_boost = int(np.max(boost)) * max_slots
+    best_cal = np.full((top_weight + 1, top_boost + 1), -1, dtype=np.int64)
+    found = {}
+    counts = [0] * m
+    nodes = 0
+
+    def dominated(cost, b, k):
+        return cost <= top_weight and best_cal[cost, min(b, top_boost)] >= k
+
+    def visit(p, slots, deficit, cost, b, k):
+        nonlocal nodes
+        nodes += 1
+        satisfied = max(deficit) <= 0
+        if satisfied and not dominated(cost, b, k):
+            found[cost, b, k] = counts[:]
+            np.maximum(best_cal[cost:, :b + 1], k, out=best_cal[cost:, :b + 1])
+        if slots == 0:
+            return
+        for q in range(p, m):
+            # The bounds at q cover every child that starts at q or later, so
+            # once they fail none of the remaining children can help.
+            if satisfied:
+                extra = w[m - 1]
+            else:
+                top = reach[q]
+                short = 0
+                for f in range(n_flavors):
+                    if deficit[f] > 0:
+                        if deficit[f] > top[f][slots] or deficit[f] > depth[f]:
+                            return
+                        short += deficit[f]
+                if short > top[n_flavors][slots] or short > depth[n_flavors]:
+                    return
+                extra = int(cover[n_flavors][start[q], slots, short])
+                for f in range(n_flavors):
+                    if deficit[f] > 0:
+                        extra = max(extra, int(cover[f][start[q], slots, deficit[f]]))
+                if extra >= _UNREACHABLE:
+                    return
+            if dominated(cost + extra, b + gain[q][0][slots], k + gain[q][1][slots]):
+                return
+            row = rows[q]
+            for c in range(min(cap[q], slots), 0, -1):
+                counts[q] = c
+                visit(
+                    q + 1, slots - c, [deficit[f] - c * row[f] for f in range(n_flavors)],
+                    cost + c * w[q], b + c * bo[q], k + c * ca[q],
+                )
+            counts[q] = 0
+
+    visit(0, max_slots, [int(t) for t in target], 0, 0, 0)
+
+    # A point kept early can be dominated by one found later; drop those.
+    points = sorted(found, key=lambda point: (point[0], -point[1], -point[2]))
+    front = []
+    for point in points:
+        if any(o != point and o[0] <= point[0] and o[1] >= point[1] and o[2] >= point[2] for o in points):
+            continue
+        result = np.zeros(len(caps), dtype=np.int64)
+        for p, i in enumerate(order):
+            result[i] = found[point][p]
+        front.append(point + (result,))
+    return front, nodes
+
+
+def solve_bnb(engine, donut, inventory, mode="min", hint=None, limits=None):
+    inv = engine.inventory_vector(inventory)
+    hint = hint or WarmStart(None, None)
+    with timing.current().phase("solve"):
+        return branch_and_bound(
+            engine.flavors, engine.weights, engine.targets[donut], inv, engine.max_slots, maximize=(mode != "min"),
+            incumbent=hint.incumbent, stop_at=hint.bound, limits=limits,
+        )
+
+
+def _solve_pulp(engine, donut, inventory, mode, solver, hint=None):
+    # CBC and HiGHS apply the time limit and gap themselves. They can't be
+    # interrupted, so `cancel` is ignored and the time limit is what bounds them.
+    timer = timing.current()
+    with timer.phase("model_build"):
+        prob, berry_vars = engine.build_model(donut, inventory, mode)
+        if hint is not None and hint.incumbent is not None:
+            for i, var in berry_vars.items():
+                var.setInitialValue(int(hint.incumbent[i]))
+    with timer.phase("solve"):
+        prob.solve(solver)
+    status = LpStatus[prob.status]
+    # A solver stopped by its time limit still reports "Optimal"; sol_status
+    # says the solution is only the best one found.
+    if prob.sol_status == LpSolutionIntegerFeasible or (status == "Not Solved" and solver.timeLimit is not None):
+        status = "Time limit"
+    if status not in ("Optimal", "Time limit") or any(value(var) is None for var in berry_vars.values()):
+        return SolveOutcome(None, status, None, None)
+    counts = np.zeros(len(engine.names), dtype=np.int64)
+    for i, var in berry_vars.items():
+        counts[i] = int(round(value(var)))
+    return SolveOutcome(counts, status, int(counts @ engine.weights), None)
+
+
+def _warm(hint):
+    return hint is not None and hint.incumbent is not None
+
+
+def _limit_options(limits):
+    limits = limits or SolveLimits()
+    return {"timeLimit": limits.time_limit, "gapRel": limits.gap or None}
+
+
+def solve_cbc(engine, donut, inventory, mode="min", hint=None, limits=None):
+    solver = PULP_CBC_CMD(msg=False, warmStart=_warm(hint), **_limit_options(limits))
+    return _solve_pulp(engine, donut, inventory, mode, solver, hint)
+
+
+def solve_highs(engine, donut, inventory, mode="min", hint=None, limits=None):
+    # In-memory HiGHS through its Python bindings; no files, no subprocess.
+    solver = HiGHS(msg=False, warmStart=_warm(hint), **_limit_options(limits))
+    return _solve_pulp(engine, donut, inventory, mode, solver, hint)
+
+
+BACKENDS = {
+    "bnb": solve_bnb,
+    "cbc": solve_cbc,
+    "highs": solve_highs,
+}
+
+
+def available_backends():
+    names = ["bnb"]
+    if PULP_CBC_CMD(msg=False).available():
+        names.append("cbc")
+    if HiGHS(msg=False).available():
+        names.append("highs")
+    return names
+
+
+# Past this many berries CBC beats bnb on slow solves. On synthetic catalogs
+# (typical bags, ms): 50 berries bnb p95 73 / cbc 326; 70: bnb 370 / cbc 674
+# but bnb max 1204; 100: bnb p95 2526 / cbc 905; 200: bnb up to 15.9 s.
+BNB_MAX_BERRIES = 60
+
+
+def pick_backend(n_berries):
+    # The backend "auto" stands for with a catalog of `n_berries`.
+    if n_berries <= BNB_MAX_BERRIES:
+        return "bnb"
+    if HiGHS(msg=False).available():
+        return "highs"
+    return "cbc" if PULP_CBC_CMD(msg=False).available() else "bnb"
+
+
+def verify_backends(engine, inventories, backends=None):
+    # Solves every (inventory, donut, mode) with each backend and returns the
+    # cases where the optimal objectives disagree. The recipe index, when the
+    # engine has one, is checked as an extra backend.
+    backends = backends or available_backends()
+    mismatches = []
+    for inv in inventories:
+        for donut in engine.donuts:
+            for mode in ("min", "max"):
+                objectives = {}
+                for name in backends:
+                    objectives[name] = BACKENDS[name](engine, donut, inv, mode).objective
+                if engine.recipe_index is not None and engine.recipe_index.covers(donut):
+                    counts = engine.recipe_index.lookup(donut, inv, mode)
+                    objectives["index"] = None if counts is None else int(counts @ engine.weights)
+                if len(set(objectives.values())) > 1:
+                    mismatches.append({"inventory": [int(x) for x in inv], "donut": donut, "mode": mode, "objectives": objectives})
+    return mismatches
+
+
+def main():
+    from engine import DonutEngine
+    from recipe_index import RecipeIndex
+
+    parser = argparse.ArgumentParser(description="Cross-check solver backends on random inventories.")
+    parser.add_argument("--samples", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backends", nargs="*", default=None)
+    args = parser.parse_args()
+
+    engine = DonutEngine()
+    engine.recipe_index = RecipeIndex.load(engine)
+    rng = np.random.default_rng(args.seed)
+    inventories = []
+    for _ in range(args.samples):
+        density = rng.choice([0.3, 0.6, 0.9])
+        inventories.append(rng.integers(0, 6, len(engine.names)) * (rng.random(len(engine.names)) < density))
+
+    backends = args.backends or available_backends()
+    mismatches = verify_backends(engine, inventories, backends)
+    for case in mismatches:
+        print(case)
+    checked = backends + (["index"] if engine.recipe_index is not None else [])
+    print(f"{len(mismatches)} mismatches over {args.samples} inventories ({', '.join(checked)})")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from catalog import synthetic_catalog
+from engine import MAX_SLOTS, DonutEngine
+from incremental import IncrementalSolver
+from recipe_index import RecipeIndex
+from solvers import (
+    PULP_CBC_CMD, branch_and_bound, k_best, pareto_front, verify_backends,
+)
+
+# The hand-written searches (branch and bound, k-best, Pareto front, the
+# incremental reuse proofs) checked against CBC, the recipe index and brute
+# force, so a pruning change that drops a recipe fails here.
+
+SEEDS = [0, 1, 2]
+
+
+def random_bags(n_berries, count, rng, most=5):
+    density = rng.choice([0.3, 0.6, 0.9], size=count)
+    return [rng.integers(0, most + 1, n_berries) * (rng.random(n_berries) < d) for d in density]
+
+
+def small_bag(n_berries, rng, kinds=7, most=4):
+    # Few enough berry kinds that every recipe can be enumerated.
+    bag = np.zeros(n_berries, dtype=np.int64)
+    chosen = rng.choice(n_berries, size=kinds, replace=False)
+    bag[chosen] = rng.integers(1, most + 1, kinds)
+    return bag
+
+
+def all_recipes(engine, donut, bag):
+    # Every count vector within the bag and 8 slots that meets the donut's
+    # thresholds, as rows.
+    used = np.flatnonzero(bag)
+    grid = np.array(list(itertools.product(*(range(int(bag[i]) + 1) for i in used))), dtype=np.int64)
+    grid = grid[grid.sum(axis=1) <= MAX_SLOTS]
+    recipes = np.zeros((len(grid), len(bag)), dtype=np.int64)
+    recipes[:, used] = grid
+    feasible = np.all(recipes @ engine.flavors >= engine.targets[donut], axis=1)
+    return recipes[feasible]
+
+
+def is_minimal(engine, donut, counts):
+    achieved = counts @ engine.flavors
+    return not any(np.all(achieved - engine.flavors[j] >= engine.targets[donut]) for j in np.flatnonzero(counts))
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = DonutEngine()
+    engine.recipe_index = RecipeIndex.load(engine)
+    return engine
+
+
+@pytest.fixture(scope="module")
+def small_engine():
+    # Few berries and halved thresholds, so most small bags make a donut in
+    # dozens to hundreds of ways.
+    catalog = synthetic_catalog(10, 4, seed=3)
+    return DonutEngine.from_catalog(catalog._replace(targets=catalog.targets // 2), backend="bnb")
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_backends_agree(engine, seed):
+    backends = ["bnb"] + (["cbc"] if PULP_CBC_CMD(msg=False).available() else [])
+    bags = random_bags(len(engine.names), 4, np.random.default_rng(seed))
+    assert verify_backends(engine, bags, backends) == []
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_branch_and_bound_matches_brute_force(small_engine, seed):
+    e = small_engine
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        bag = small_bag(len(e.names), rng)
+        for donut in e.donuts:
+            recipes = all_recipes(e, donut, bag)
+            for maximize in (False, True):
+                outcome = branch_and_bound(e.flavors, e.weights, e.targets[donut], bag, MAX_SLOTS, maximize=maximize)
+                if len(recipes) == 0:
+                    assert outcome.counts is None
+                    continue
+                costs = recipes @ e.weights
+                assert outcome.objective == (costs.max() if maximize else costs.min())
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_k_best_matches_brute_force(small_engine, seed):
+    e = small_engine
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        bag = small_bag(len(e.names), rng)
+        for donut in e.donuts:
+            recipes = all_recipes(e, donut, bag)
+            for maximize in (False, True):
+                if not maximize:
+                    # Economy ranks minimal recipes only.
+                    recipes_ranked = [r for r in recipes if is_minimal(e, donut, r)]
+                else:
+                    recipes_ranked = list(recipes)
+                expected = sorted((int(r @ e.weights) for r in recipes_ranked), reverse=maximize)[:10]
+                ranked, _ = k_best(e.flavors, e.weights, e.targets[donut], bag, MAX_SLOTS, 10, maximize=maximize)
+                assert [objective for objective, _ in ranked] == expected
+                seen = {tuple(counts) for _, counts in ranked}
+                assert len(seen) == len(ranked)
+                for objective, counts in ranked:
+                    assert np.all(counts <= bag) and counts.sum() <= MAX_SLOTS
+                    assert np.all(counts @ e.flavors >= e.targets[donut])
+                    assert int(counts @ e.weights) == objective
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_pareto_front_matches_brute_force(small_engine, seed):
+    e = small_engine
+    rng = np.random.default_rng(seed)
+    for _ in range(5):
+        bag = small_bag(len(e.names), rng)
+        for donut in e.donuts:
+            points = {(int(r @ e.weights), int(r @ e.boost), int(r @ e.cal)) for r in all_recipes(e, donut, bag)}
+            expected = {
+                p for p in points
+                if not any(q != p and q[0] <= p[0] and q[1] >= p[1] and q[2] >= p[2] for q in points)
+            }
+            front, _ = pareto_front(e.flavors, e.weights, e.cal, e.boost, e.targets[donut], bag, MAX_SLOTS)
+            assert {(weight, boost, cal) for weight, boost, cal, _ in front} == expected
+            assert len(front) == len(expected)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_incremental_matches_fresh_solves(seed):
+    # A run of small edits, as in the app: every reused or warm-started answer
+    # must have the optimal objective.
+    engine = DonutEngine(backend="bnb")
+    session = IncrementalSolver(engine)
+    rng = np.random.default_rng(seed)
+    bag = random_bags(len(engine.names), 1, rng)[0]
+    for _ in range(40):
+        for i in rng.integers(len(bag), size=rng.integers(1, 4)):
+            bag[i] = max(0, bag[i] + rng.choice([-2, -1, 1, 2]))
+        donut = engine.donuts[rng.integers(len(engine.donuts))]
+        for mode in ("min", "max"):
+            reused = session.solve_counts(donut, bag, mode)
+            fresh = engine.solve_counts(donut, bag, mode)
+            assert (reused is None) == (fresh is None)
+            if fresh is not None:
+                assert int(reused @ engine.weights) == int(fresh @ engine.weights)
+    assert session.reused + session.warm > 0
@@ -0,0 +1,112 @@
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+# ---------------------------------------------------------------------
+# PER-PHASE TIMING
+# ---------------------------------------------------------------------
+# A PhaseTimer collects how long each named phase of one request (one
+# Streamlit rerun, one API call) took, plus solver details recorded along
+# the way. The engine doesn't take a timer argument; it reports to whatever
+# timer is active in the current context, which is a disabled no-op unless
+# the caller activated a real one. Disabled timers cost one attribute check
+# per phase. Context variables don't follow work onto executor threads by
+# themselves: submit through contextvars.copy_context().run (one copy per
+# task) to keep reporting to the caller's timer. A timer may be written
+# from several threads at once.
+
+logger = logging.getLogger("donut.perf")
+
+
+class PhaseTimer:
+    def __init__(self, enabled=True, label="request"):
+        self.enabled = enabled
+        self.label = label
+        self.phases = {}
+        self.solves = []
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self.total = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return nullcontext()
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def record_solve(self, **fields):
+        # Solver status, node count, objective, where the answer came from...
+        if self.enabled:
+            with self._lock:
+                self.solves.append(fields)
+
+    def finish(self):
+        self.total = time.perf_counter() - self._started
+        if self.enabled:
+            logger.info(json.dumps(self.as_dict(), default=str))
+        return self
+
+    def as_dict(self):
+        # A snapshot: a job abandoned by this request may still be reporting to it.
+        with self._lock:
+            phases, solves = dict(self.phases), list(self.solves)
+        return {
+            "event": self.label,
+            "total_ms": None if self.total is None else round(self.total * 1000, 3),
+            "phases_ms": {name: round(s * 1000, 3) for name, s in phases.items()},
+            "solves": solves,
+        }
+
+
+_DISABLED = PhaseTimer(enabled=False)
+_current = ContextVar("donut_phase_timer", default=_DISABLED)
+
+
+def current():
+    return _current.get()
+
+
+def activate(timer):
+    # Make `timer` the one engine code reports to in this context (thread).
+    return _current.set(timer)
+
+
+def summarize(history):
+    # Rolling per-phase aggregates over a list of PhaseTimer.as_dict() records.
+    samples = {}
+    for record in history:
+        if record["total_ms"] is not None:
+            samples.setdefault("total", []).append(record["total_ms"])
+        for name, ms in record["phases_ms"].items():
+            samples.setdefault(name, []).append(ms)
+    summary = {}
+    for name, values in samples.items():
+        ordered = sorted(values)
+        summary[name] = {
+            "n": len(values),
+            "mean_ms": round(sum(values) / len(values), 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))], 3),
+            "max_ms": round(ordered[-1], 3),
+        }
+    return summary
+
+
+def enable_logging(level=logging.INFO):
+    # Send the JSON lines to stderr unless the host app already routes them somewhere.
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+        logger.addHandler(handler)
+    logger.setLevel(level)
@@ -0,0 +1,841 @@
+# ---------------------------------------------------------------------
+# UI TRANSLATIONS
+# ---------------------------------------------------------------------
+# Lives outside app.py so it is built once per process instead of on every
+# Streamlit rerun.
+
+TRANSLATIONS = {
+    "English 🇺🇸": {
+        "title": "🍩 Pokémon Legends: Z-A Donut Calculator",
+        "intro": """When you don't have many rare berries in your satchel, it can be difficult or annoying to check if you are able to create the donuts to battle the Legendary Pokémon. \nThis guide helps you figure out if it is possible to create each donut based on your inventory. \nIt also suggests an economical (using fewer rare berries) and a luxurious (using rare berries, giving full power) recipe.""",
+        "hope": "Hope this helps!",
+        "instructions_header": "Instructions:",
+        "step1": "1. Enter your **Inventory** in the table below (Look for the **✏️** column).",
+        "step2": "2. Select the **Donut** you want to craft.",
+        "step3": "3. Click **Calculate**.",
+        "select_label": "Select Target Donut:",
+        "examples_label": "💡 View Standard Recipes (Examples)",
+        "examples_col_name": "Recipe Name",
+        "examples_col_ing": "Ingredients",
+        "examples_col_ok": "Meets thresholds",
+        "curated_title": "Curated Recipe",
+        "curated_desc": "*A standard recipe your bag already covers.*",
+        "inventory_header": "Your Inventory",
+        "toggle_stats": "Show Berry Stats",
+        "toggle_help": "Check this to see detailed flavor values.",
+        "calc_button": "Calculate Recipes",
+        "eco_title": "Economy Recipe",
+        "eco_desc": "*Uses common berries (top of list).*",
+        "lux_title": "Luxury Recipe",
+        "lux_desc": "*Uses rare berries (bottom of list).*",
+        "stats_expand": "Show Required Flavor Stats",
+        "error_msg": "Not possible with current inventory.",
+        "slots": "Slots",
+        "cal": "Calories",
+        "boost": "Lv. Boost",
+        "all_toggle": "Evaluate all donuts at once",
+        "all_help": "Calculates economy and luxury recipes for every donut in one go.",
+        "all_col_donut": "Donut",
+        "all_col_possible": "Possible",
+        "plan_header": "Production Plan (all donuts, shared inventory)",
+        "plan_target": "Wanted",
+        "plan_target_help": "Leave empty to make as many as possible.",
+        "plan_button": "Plan Production",
+        "plan_times": "Times",
+        "plan_total": "Donuts made",
+        "plan_none": "No donut can be made with this inventory.",
+        "sched_header": "Multi-day Schedule (daily berry income)",
+        "sched_income": "Gathered per day",
+        "sched_days": "Days to plan",
+        "sched_goal": "Goal",
+        "sched_count": "Most donuts",
+        "sched_rarity": "Fewest rare berries (makes the Wanted counts above)",
+        "sched_button": "Plan Schedule",
+        "sched_day": "Day",
+        "sched_none": "Nothing can be crafted in this period.",
+        "plan_unproven": "Best plan found within the search limits; it may not be optimal.",
+        "index_missing": "This needs the recipe index for the current catalog. Build it with `python recipe_index.py`.",
+        "alt_header": "Alternative Recipes",
+        "alt_mode": "Rank by",
+        "alt_k": "How many recipes",
+        "alt_exclude": "Don't use these berries",
+        "alt_limit": "Limit these berries",
+        "alt_limit_n": "At most this many of each limited berry",
+        "alt_button": "Show Alternatives",
+        "alt_rank": "#",
+        "alt_recipe": "Recipe",
+        "alt_none": "No recipe matches these filters.",
+        "pareto_header": "Trade-offs (rarity vs. Lv. Boost vs. calories)",
+        "pareto_help": "Every recipe here is unbeatable: no other recipe uses less rare berries while giving at least the same Lv. Boost and calories.",
+        "pareto_button": "Find Trade-offs",
+        "pareto_rarity": "Rarity",
+        "pareto_pick": "Pick a recipe",
+        "short_header": "Why it's not possible",
+        "short_flavor": "Flavor",
+        "short_needed": "Needed",
+        "short_best": "Best with your berries",
+        "short_missing": "Missing",
+        "short_total": "All flavors combined",
+        "short_joint": "Each flavor can be reached on its own, but not all of them with the same 8 berries.",
+        "farm_header": "What to farm next",
+        "farm_all": "All donuts",
+        "farm_button": "Analyze",
+        "farm_ready": "You can already make this donut.",
+        "farm_collect": "Collect",
+        "farm_then": "Then you can make",
+        "farm_rank": "Which berries help most (up to 3 more of one berry)",
+        "farm_extra": "More",
+        "farm_after": "Economy rarity after",
+        "farm_gain": "Improvement",
+        "farm_unlocks": "Makes it possible",
+        "farm_no_effect": "No effect",
+        "farm_impossible": "No 8 berries in this catalog can make this donut.",
+        "solve_progress": "Solving… {elapsed:.1f} s",
+        "solve_nodes": "{nodes:,} branches searched",
+        "solve_cancel": "Cancel",
+        "solve_cancelled": "Cancelled before a recipe was found.",
+        "solve_timeout": "No recipe found within the time limit. That doesn't mean the donut is impossible.",
+        "solve_incumbent": "best found so far",
+        "solve_incumbent_desc": "The solver stopped before proving this is the best recipe.",
+        "solve_gap": "Within {gap:.0%} of the best possible recipe.",
+        # Column Headers
+        "col_name": "Berry Name",
+        "col_inv": "✏️ Inventory",
+        "col_inv_help": "Enter the amount you have in your bag.",
+        "col_sweet": "🔒 Sweet",
+        "col_spicy": "🔒 Spicy",
+        "col_sour": "🔒 Sour",
+        "col_bitter": "🔒 Bitter",
+        "col_fresh": "🔒 Fresh",
+        "col_boost": "🔒 Lv. Boost",
+        "col_cal": "🔒 Cal"
+    },
+    "Deutsch 🇩🇪": {
+        "title": "🍩 Pokémon Legenden: Z-A Donut Rechner",
+        "intro": """Wenn man nicht viele seltene Beeren im Beutel hat, kann es nervig sein herauszufinden, ob man die Donuts für den Kampf gegen die Legendären Pokémon herstellen kann. \nDieser Guide hilft dir zu prüfen, ob ein Rezept mit deinem Inventar möglich ist. \nEr schlägt außerdem ein sparsames (wenige seltene Beeren) und ein luxuriöses (maximale Power) Rezept vor.""",
+        "hope": "Hoffentlich hilft das!",
+        "instructions_header": "Anleitung:",
+        "step1": "1. Trage dein **Inventar** unten in die Tabelle ein (Spalte mit **✏️**).",
+        "step2": "2. Wähle den **Donut**, den du backen möchtest.",
+        "step3": "3. Klicke auf **Berechnen**.",
+        "select_label": "Wähle den Ziel-Donut:",
+        "examples_label": "💡 Standard-Rezepte anzeigen (Beispiele)",
+        "examples_col_name": "Rezept-Name",
+        "examples_col_ing": "Zutaten",
+        "examples_col_ok": "Erfüllt Werte",
+        "curated_title": "Standardrezept",
+        "curated_desc": "*Ein Standardrezept, das deine Tasche bereits abdeckt.*",
+        "inventory_header": "Dein Inventar",
+        "toggle_stats": "Beeren-Werte anzeigen",
+        "toggle_help": "Anklicken, um Details zu Geschmack und Kalorien zu sehen.",
+        "calc_button": "Rezepte berechnen",
+        "eco_title": "Sparsammes Rezept",
+        "eco_desc": "*Nutzt häufige Beeren (oben in der Liste).* und spart Slots.",
+        "lux_title": "Luxus Rezept",
+        "lux_desc": "*Nutzt seltene Beeren (unten in der Liste) und füllt Slots auf.*",
+        "stats_expand": "Benötigte Geschmackswerte anzeigen",
+        "error_msg": "Mit dem aktuellen Inventar nicht machbar.",
+        "slots": "Plätze",
+        "cal": "Kalorien",
+        "boost": "Lv. Bonus",
+        "all_toggle": "Alle Donuts auf einmal prüfen",
+        "all_help": "Berechnet sparsame und luxuriöse Rezepte für alle Donuts auf einmal.",
+        "all_col_donut": "Donut",
+        "all_col_possible": "Machbar",
+        "plan_header": "Produktionsplan (alle Donuts, gemeinsames Inventar)",
+        "plan_target": "Gewünscht",
+        "plan_target_help": "Leer lassen, um so viele wie möglich zu backen.",
+        "plan_button": "Produktion planen",
+        "plan_times": "Anzahl",
+        "plan_total": "Gebackene Donuts",
+        "plan_none": "Mit diesem Inventar kann kein Donut gebacken werden.",
+        "sched_header": "Mehrtagesplan (tägliche Beerenernte)",
+        "sched_income": "Pro Tag gesammelt",
+        "sched_days": "Zu planende Tage",
+        "sched_goal": "Ziel",
+        "sched_count": "Möglichst viele Donuts",
+        "sched_rarity": "Möglichst wenige seltene Beeren (backt die gewünschten Mengen oben)",
+        "sched_button": "Zeitplan erstellen",
+        "sched_day": "Tag",
+        "sched_none": "In diesem Zeitraum kann nichts gebacken werden.",
+        "plan_unproven": "Bester innerhalb der Suchgrenzen gefundener Plan; er ist eventuell nicht optimal.",
+        "index_missing": "Dafür wird der Rezeptindex des aktuellen Katalogs benötigt. Erstelle ihn mit `python recipe_index.py`.",
+        "alt_header": "Alternative Rezepte",
+        "alt_mode": "Sortieren nach",
+        "alt_k": "Anzahl Rezepte",
+        "alt_exclude": "Diese Beeren nicht verwenden",
+        "alt_limit": "Diese Beeren begrenzen",
+        "alt_limit_n": "Höchstens so viele von jeder begrenzten Beere",
+        "alt_button": "Alternativen anzeigen",
+        "alt_rank": "#",
+        "alt_recipe": "Rezept",
+        "alt_none": "Kein Rezept passt zu diesen Filtern.",
+        "pareto_header": "Abwägungen (Seltenheit vs. Lv.-Bonus vs. Kalorien)",
+        "pareto_help": "Jedes Rezept hier ist unschlagbar: Kein anderes Rezept braucht weniger seltene Beeren und bringt dabei mindestens denselben Lv.-Bonus und dieselben Kalorien.",
+        "pareto_button": "Abwägungen finden",
+        "pareto_rarity": "Seltenheit",
+        "pareto_pick": "Rezept auswählen",
+        "short_header": "Warum es nicht geht",
+        "short_flavor": "Geschmack",
+        "short_needed": "Benötigt",
+        "short_best": "Maximal mit deinen Beeren",
+        "short_missing": "Fehlt",
+        "short_total": "Alle Geschmäcker zusammen",
+        "short_joint": "Jeder Geschmack ist für sich erreichbar, aber nicht alle mit denselben 8 Beeren.",
+        "farm_header": "Was als Nächstes sammeln?",
+        "farm_all": "Alle Donuts",
+        "farm_button": "Analysieren",
+        "farm_ready": "Du kannst diesen Donut bereits backen.",
+        "farm_collect": "Sammeln",
+        "farm_then": "Dann kannst du backen",
+        "farm_rank": "Welche Beeren am meisten helfen (bis zu 3 mehr einer Beere)",
+        "farm_extra": "Mehr",
+        "farm_after": "Seltenheit (Spar) danach",
+        "farm_gain": "Verbesserung",
+        "farm_unlocks": "Macht es möglich",
+        "farm_no_effect": "Keine Wirkung",
+        "farm_impossible": "Mit keinen 8 Beeren dieses Katalogs lässt sich dieser Donut backen.",
+        "solve_progress": "Berechne… {elapsed:.1f} s",
+        "solve_nodes": "{nodes:,} Zweige durchsucht",
+        "solve_cancel": "Abbrechen",
+        "solve_cancelled": "Abgebrochen, bevor ein Rezept gefunden wurde.",
+        "solve_timeout": "Innerhalb des Zeitlimits wurde kein Rezept gefunden. Das heißt nicht, dass der Donut unmöglich ist.",
+        "solve_incumbent": "bisher bestes Ergebnis",
+        "solve_incumbent_desc": "Die Suche wurde beendet, bevor bewiesen war, dass dies das beste Rezept ist.",
+        "solve_gap": "Höchstens {gap:.0%} vom bestmöglichen Rezept entfernt.",
+        "col_name": "Beere",
+        "col_inv": "✏️ Anzahl",
+        "col_inv_help": "Trage hier ein, wie viele du im Beutel hast.",
+        "col_sweet": "🔒 Süß",
+        "col_spicy": "🔒 Scharf",
+        "col_sour": "🔒 Sauer",
+        "col_bitter": "🔒 Bitter",
+        "col_fresh": "🔒 Frisch",
+        "col_boost": "🔒 Lv. Bonus",
+        "col_cal": "🔒 Kal"
+    },
+    "Français 🇫🇷": {
+        "title": "🍩 Calculateur de Beignets Pokémon Z-A",
+        "intro": "Il est parfois difficile de savoir si l'on peut cuisiner les beignets pour les Pokémon Légendaires. Ce guide vous aide à vérifier la faisabilité selon votre inventaire.",
+        "hope": "J'espère que cela aidera !",
+        "instructions_header": "Instructions :",
+        "step1": "1. Entrez votre **Inventaire** dans le tableau (Colonne **✏️**).",
+        "step2": "2. Sélectionnez le **Beignet**.",
+        "step3": "3. Cliquez sur **Calculer**.",
+        "select_label": "Choisir le Beignet :",
+        "examples_label": "💡 Voir Recettes Standards",
+        "examples_col_name": "Nom",
+        "examples_col_ing": "Ingrédients",
+        "examples_col_ok": "Atteint les seuils",
+        "curated_title": "Recette standard",
+        "curated_desc": "*Une recette standard que votre sac permet déjà.*",
+        "inventory_header": "Votre Inventaire",
+        "toggle_stats": "Afficher les stats",
+        "toggle_help": "Voir les détails des saveurs.",
+        "calc_button": "Calculer les Recettes",
+        "eco_title": "Recette Économique",
+        "eco_desc": "*Utilise des baies communes.*",
+        "lux_title": "Recette Luxe",
+        "lux_desc": "*Utilise des baies rares.*",
+        "stats_expand": "Voir les stats requises",
+        "error_msg": "Impossible avec l'inventaire actuel.",
+        "slots": "Slots",
+        "cal": "Calories",
+        "boost": "Boost Niv.",
+        "all_toggle": "Évaluer tous les beignets",
+        "all_help": "Calcule les recettes économiques et de luxe pour tous les beignets.",
+        "all_col_donut": "Beignet",
+        "all_col_possible": "Possible",
+        "plan_header": "Plan de production (tous les beignets, inventaire partagé)",
+        "plan_target": "Souhaité",
+        "plan_target_help": "Laisser vide pour en faire le plus possible.",
+        "plan_button": "Planifier la production",
+        "plan_times": "Fois",
+        "plan_total": "Beignets préparés",
+        "plan_none": "Aucun beignet possible avec cet inventaire.",
+        "sched_header": "Planning sur plusieurs jours (récolte quotidienne)",
+        "sched_income": "Récoltées par jour",
+        "sched_days": "Jours à planifier",
+        "sched_goal": "Objectif",
+        "sched_count": "Le plus de beignets",
+        "sched_rarity": "Le moins de baies rares (prépare les quantités souhaitées ci-dessus)",
+        "sched_button": "Planifier les jours",
+        "sched_day": "Jour",
+        "sched_none": "Rien ne peut être préparé sur cette période.",
+        "plan_unproven": "Meilleur plan trouvé dans les limites de la recherche ; il n'est peut-être pas optimal.",
+        "index_missing": "Cette fonction nécessite l'index des recettes du catalogue actuel. Créez-le avec `python recipe_index.py`.",
+        "alt_header": "Recettes alternatives",
+        "alt_mode": "Classer par",
+        "alt_k": "Nombre de recettes",
+        "alt_exclude": "Ne pas utiliser ces baies",
+        "alt_limit": "Limiter ces baies",
+        "alt_limit_n": "Au maximum ce nombre de chaque baie limitée",
+        "alt_button": "Afficher les alternatives",
+        "alt_rank": "#",
+        "alt_recipe": "Recette",
+        "alt_none": "Aucune recette ne correspond à ces filtres.",
+        "pareto_header": "Compromis (rareté vs. Bonus Niv. vs. calories)",
+        "pareto_help": "Chaque recette ici est imbattable : aucune autre n'utilise moins de baies rares tout en donnant au moins le même Bonus Niv. et les mêmes calories.",
+        "pareto_button": "Trouver les compromis",
+        "pareto_rarity": "Rareté",
+        "pareto_pick": "Choisir une recette",
+        "short_header": "Pourquoi ce n'est pas possible",
+        "short_flavor": "Saveur",
+        "short_needed": "Requis",
+        "short_best": "Maximum avec vos baies",
+        "short_missing": "Manquant",
+        "short_total": "Toutes saveurs confondues",
+        "short_joint": "Chaque saveur est atteignable seule, mais pas toutes avec les mêmes 8 baies.",
+        "farm_header": "Que récolter ensuite ?",
+        "farm_all": "Tous les beignets",
+        "farm_button": "Analyser",
+        "farm_ready": "Vous pouvez déjà faire ce beignet.",
+        "farm_collect": "À récolter",
+        "farm_then": "Ensuite vous pouvez faire",
+        "farm_rank": "Baies les plus utiles (jusqu'à 3 de plus d'une baie)",
+        "farm_extra": "En plus",
+        "farm_after": "Rareté (éco) après",
+        "farm_gain": "Amélioration",
+        "farm_unlocks": "Rend possible",
+        "farm_no_effect": "Sans effet",
+        "farm_impossible": "Aucune combinaison de 8 baies de ce catalogue ne permet ce beignet.",
+        "solve_progress": "Calcul en cours… {elapsed:.1f} s",
+        "solve_nodes": "{nodes:,} branches explorées",
+        "solve_cancel": "Annuler",
+        "solve_cancelled": "Annulé avant qu'une recette soit trouvée.",
+        "solve_timeout": "Aucune recette trouvée dans le temps imparti. Cela ne veut pas dire que le donut est impossible.",
+        "solve_incumbent": "meilleure trouvée jusqu'ici",
+        "solve_incumbent_desc": "La recherche s'est arrêtée avant de prouver que c'est la meilleure recette.",
+        "solve_gap": "À moins de {gap:.0%} de la meilleure recette possible.",
+        "col_name": "Baie",
+        "col_inv": "✏️ Qté",
+        "col_inv_help": "Quantité dans votre sac.",
+        "col_sweet": "🔒 Sucré",
+        "col_spicy": "🔒 Épicé",
+        "col_sour": "🔒 Acide",
+        "col_bitter": "🔒 Amer",
+        "col_fresh": "🔒 Frais",
+        "col_boost": "🔒 Boost",
+        "col_cal": "🔒 Cal"
+    },
+    "Italiano 🇮🇹": {
+        "title": "🍩 Calcolatore Ciambelle Pokémon Z-A",
+        "intro": "Controlla se hai abbastanza bacche per cucinare le ciambelle per i Pokémon Leggendari.",
+        "hope": "Spero sia d'aiuto!",
+        "instructions_header": "Istruzioni:",
+        "step1": "1. Inserisci il tuo **Inventario** nella tabella (Colonna **✏️**).",
+        "step2": "2. Seleziona la **Ciambella**.",
+        "step3": "3. Clicca su **Calcola**.",
+        "select_label": "Seleziona Ciambella:",
+        "examples_label": "💡 Vedi Ricette Standard",
+        "examples_col_name": "Nome",
+        "examples_col_ing": "Ingredienti",
+        "examples_col_ok": "Soddisfa i requisiti",
+        "curated_title": "Ricetta standard",
+        "curated_desc": "*Una ricetta standard che la tua borsa copre già.*",
+        "inventory_header": "Il tuo Inventario",
+        "toggle_stats": "Mostra statistiche",
+        "toggle_help": "Vedi i dettagli dei sapori.",
+        "calc_button": "Calcola Ricette",
+        "eco_title": "Ricetta Economica",
+        "eco_desc": "*Usa bacche comuni.*",
+        "lux_title": "Ricetta Lusso",
+        "lux_desc": "*Usa bacche rare.*",
+        "stats_expand": "Vedi statistiche richieste",
+        "error_msg": "Impossibile con l'inventario attuale.",
+        "slots": "Slot",
+        "cal": "Calorie",
+        "boost": "Liv. Boost",
+        "all_toggle": "Valuta tutte le ciambelle",
+        "all_help": "Calcola le ricette economiche e di lusso per tutte le ciambelle.",
+        "all_col_donut": "Ciambella",
+        "all_col_possible": "Possibile",
+        "plan_header": "Piano di produzione (tutte le ciambelle, inventario condiviso)",
+        "plan_target": "Desiderate",
+        "plan_target_help": "Lascia vuoto per farne il più possibile.",
+        "plan_button": "Pianifica produzione",
+        "plan_times": "Volte",
+        "plan_total": "Ciambelle prodotte",
+        "plan_none": "Nessuna ciambella possibile con questo inventario.",
+        "sched_header": "Piano su più giorni (raccolta giornaliera)",
+        "sched_income": "Raccolte al giorno",
+        "sched_days": "Giorni da pianificare",
+        "sched_goal": "Obiettivo",
+        "sched_count": "Più ciambelle possibile",
+        "sched_rarity": "Meno bacche rare possibile (prepara le quantità desiderate sopra)",
+        "sched_button": "Pianifica i giorni",
+        "sched_day": "Giorno",
+        "sched_none": "In questo periodo non si può preparare nulla.",
+        "plan_unproven": "Miglior piano trovato entro i limiti della ricerca; potrebbe non essere ottimale.",
+        "index_missing": "Serve l'indice delle ricette del catalogo attuale. Crealo con `python recipe_index.py`.",
+        "alt_header": "Ricette alternative",
+        "alt_mode": "Ordina per",
+        "alt_k": "Quante ricette",
+        "alt_exclude": "Non usare queste bacche",
+        "alt_limit": "Limita queste bacche",
+        "alt_limit_n": "Al massimo questo numero per ogni bacca limitata",
+        "alt_button": "Mostra alternative",
+        "alt_rank": "#",
+        "alt_recipe": "Ricetta",
+        "alt_none": "Nessuna ricetta corrisponde a questi filtri.",
+        "pareto_header": "Compromessi (rarità vs. Bonus Liv. vs. calorie)",
+        "pareto_help": "Ogni ricetta qui è imbattibile: nessun'altra usa bacche meno rare dando almeno lo stesso Bonus Liv. e le stesse calorie.",
+        "pareto_button": "Trova compromessi",
+        "pareto_rarity": "Rarità",
+        "pareto_pick": "Scegli una ricetta",
+        "short_header": "Perché non è possibile",
+        "short_flavor": "Sapore",
+        "short_needed": "Richiesto",
+        "short_best": "Massimo con le tue bacche",
+        "short_missing": "Mancante",
+        "short_total": "Tutti i sapori insieme",
+        "short_joint": "Ogni sapore è raggiungibile da solo, ma non tutti con le stesse 8 bacche.",
+        "farm_header": "Cosa raccogliere dopo?",
+        "farm_all": "Tutte le ciambelle",
+        "farm_button": "Analizza",
+        "farm_ready": "Puoi già preparare questa ciambella.",
+        "farm_collect": "Da raccogliere",
+        "farm_then": "Poi puoi preparare",
+        "farm_rank": "Bacche più utili (fino a 3 in più di una bacca)",
+        "farm_extra": "In più",
+        "farm_after": "Rarità (eco) dopo",
+        "farm_gain": "Miglioramento",
+        "farm_unlocks": "La rende possibile",
+        "farm_no_effect": "Nessun effetto",
+        "farm_impossible": "Nessuna combinazione di 8 bacche di questo catalogo può preparare questa ciambella.",
+        "solve_progress": "Calcolo in corso… {elapsed:.1f} s",
+        "solve_nodes": "{nodes:,} rami esplorati",
+        "solve_cancel": "Annulla",
+        "solve_cancelled": "Annullato prima di trovare una ricetta.",
+        "solve_timeout": "Nessuna ricetta trovata entro il limite di tempo. Non significa che la ciambella sia impossibile.",
+        "solve_incumbent": "migliore trovata finora",
+        "solve_incumbent_desc": "La ricerca si è fermata prima di dimostrare che questa è la ricetta migliore.",
+        "solve_gap": "Entro il {gap:.0%} dalla migliore ricetta possibile.",
+        "col_name": "Bacca",
+        "col_inv": "✏️ Qtà",
+        "col_inv_help": "Quantità nella borsa.",
+        "col_sweet": "🔒 Dolce",
+        "col_spicy": "🔒 Pepato",
+        "col_sour": "🔒 Aspro",
+        "col_bitter": "🔒 Amaro",
+        "col_fresh": "🔒 Fresco",
+        "col_boost": "🔒 Lv. Boost",
+        "col_cal": "🔒 Cal"
+    },
+    "Español 🇪🇸": {
+        "title": "🍩 Calculadora de Donas Pokémon Z-A",
+        "intro": "Comprueba si tienes suficientes bayas para cocinar las donas para los Pokémon Legendarios.",
+        "hope": "¡Espero que ayude!",
+        "instructions_header": "Instrucciones:",
+        "step1": "1. Introduce tu **Inventario** en la tabla (Columna **✏️**).",
+        "step2": "2. Selecciona la **Dona**.",
+        "step3": "3. Haz clic en **Calcular**.",
+        "select_label": "Seleccionar Dona:",
+        "examples_label": "💡 Ver Recetas Estándar",
+        "examples_col_name": "Nombre",
+        "examples_col_ing": "Ingredientes",
+        "examples_col_ok": "Cumple los requisitos",
+        "curated_title": "Receta estándar",
+        "curated_desc": "*Una receta estándar que tu bolsa ya cubre.*",
+        "inventory_header": "Tu Inventario",
+        "toggle_stats": "Mostrar estadísticas",
+        "toggle_help": "Ver detalles de sabor.",
+        "calc_button": "Calcular Recetas",
+        "eco_title": "Receta Económica",
+        "eco_desc": "*Usa bayas comunes.*",
+        "lux_title": "Receta de Lujo",
+        "lux_desc": "*Usa bayas raras.*",
+        "stats_expand": "Ver estadísticas requeridas",
+        "error_msg": "Imposible con el inventario actual.",
+        "slots": "Espacios",
+        "cal": "Calorías",
+        "boost": "Niv. Boost",
+        "all_toggle": "Evaluar todas las donas",
+        "all_help": "Calcula las recetas económicas y de lujo para todas las donas.",
+        "all_col_donut": "Dona",
+        "all_col_possible": "Posible",
+        "plan_header": "Plan de producción (todas las donas, inventario compartido)",
+        "plan_target": "Deseadas",
+        "plan_target_help": "Déjalo vacío para hacer tantas como sea posible.",
+        "plan_button": "Planificar producción",
+        "plan_times": "Veces",
+        "plan_total": "Donas hechas",
+        "plan_none": "No se puede hacer ninguna dona con este inventario.",
+        "sched_header": "Plan de varios días (cosecha diaria)",
+        "sched_income": "Recolectadas por día",
+        "sched_days": "Días a planificar",
+        "sched_goal": "Objetivo",
+        "sched_count": "Más donas",
+        "sched_rarity": "Menos bayas raras (prepara las cantidades deseadas de arriba)",
+        "sched_button": "Planificar días",
+        "sched_day": "Día",
+        "sched_none": "No se puede preparar nada en este periodo.",
+        "plan_unproven": "Mejor plan encontrado dentro de los límites de búsqueda; puede que no sea óptimo.",
+        "index_missing": "Esto necesita el índice de recetas del catálogo actual. Créalo con `python recipe_index.py`.",
+        "alt_header": "Recetas alternativas",
+        "alt_mode": "Ordenar por",
+        "alt_k": "Cuántas recetas",
+        "alt_exclude": "No usar estas bayas",
+        "alt_limit": "Limitar estas bayas",
+        "alt_limit_n": "Como máximo esta cantidad de cada baya limitada",
+        "alt_button": "Mostrar alternativas",
+        "alt_rank": "#",
+        "alt_recipe": "Receta",
+        "alt_none": "Ninguna receta cumple estos filtros.",
+        "pareto_header": "Compromisos (rareza vs. Bonus Nv. vs. calorías)",
+        "pareto_help": "Cada receta aquí es inmejorable: ninguna otra usa bayas menos raras dando al menos el mismo Bonus Nv. y las mismas calorías.",
+        "pareto_button": "Buscar compromisos",
+        "pareto_rarity": "Rareza",
+        "pareto_pick": "Elegir una receta",
+        "short_header": "Por qué no es posible",
+        "short_flavor": "Sabor",
+        "short_needed": "Necesario",
+        "short_best": "Máximo con tus bayas",
+        "short_missing": "Falta",
+        "short_total": "Todos los sabores juntos",
+        "short_joint": "Cada sabor se puede alcanzar por separado, pero no todos con las mismas 8 bayas.",
+        "farm_header": "¿Qué recolectar ahora?",
+        "farm_all": "Todas las donas",
+        "farm_button": "Analizar",
+        "farm_ready": "Ya puedes hacer esta dona.",
+        "farm_collect": "Recolectar",
+        "farm_then": "Luego puedes hacer",
+        "farm_rank": "Qué bayas ayudan más (hasta 3 más de una baya)",
+        "farm_extra": "Más",
+        "farm_after": "Rareza (eco) después",
+        "farm_gain": "Mejora",
+        "farm_unlocks": "La hace posible",
+        "farm_no_effect": "Sin efecto",
+        "farm_impossible": "Ninguna combinación de 8 bayas de este catálogo puede preparar esta dona.",
+        "solve_progress": "Calculando… {elapsed:.1f} s",
+        "solve_nodes": "{nodes:,} ramas exploradas",
+        "solve_cancel": "Cancelar",
+        "solve_cancelled": "Cancelado antes de encontrar una receta.",
+        "solve_timeout": "No se encontró ninguna receta dentro del límite de tiempo. Eso no significa que la dona sea imposible.",
+        "solve_incumbent": "la mejor encontrada hasta ahora",
+        "solve_incumbent_desc": "La búsqueda se detuvo antes de demostrar que esta es la mejor receta.",
+        "solve_gap": "A menos de un {gap:.0%} de la mejor receta posible.",
+        "col_name": "Baya",
+        "col_inv": "✏️ Cant.",
+        "col_inv_help": "Cantidad en tu bolsa.",
+        "col_sweet": "🔒 Dulce",
+        "col_spicy": "🔒 Picante",
+        "col_sour": "🔒 Ácido",
+        "col_bitter": "🔒 Amargo",
+        "col_fresh": "🔒 Fresco",
+        "col_boost": "🔒 Niv.+",
+        "col_cal": "🔒 Cal"
+    },
+    "Korean 🇰🇷": {
+        "title": "🍩 포켓몬 레전드 Z-A 도넛 계산기",
+        "intro": "전설의 포켓몬을 위한 도넛을 만들 재료가 충분한지 확인하세요.",
+        "hope": "도움이 되길 바랍니다!",
+        "instructions_header": "사용법:",
+        "step1": "1. 아래 표에 **가방(인벤토리)** 수량을 입력하세요 (**✏️** 열).",
+        "step2": "2. 만들고 싶은 **도넛**을 선택하세요.",
+        "step3": "3. **계산하기** 버튼을 누르세요.",
+        "select_label": "도넛 선택:",
+        "examples_label": "💡 추천 레시피 보기 (예시)",
+        "examples_col_name": "레시피 이름",
+        "examples_col_ing": "재료",
+        "examples_col_ok": "기준 충족",
+        "curated_title": "추천 레시피",
+        "curated_desc": "*가방에 있는 재료로 바로 만들 수 있는 기본 레시피입니다.*",
+        "inventory_header": "보유 열매",
+        "toggle_stats": "상세 스탯 표시",
+        "toggle_help": "맛과 칼로리 정보를 확인합니다.",
+        "calc_button": "레시피 계산",
+        "eco_title": "경제적인 레시피",
+        "eco_desc": "*흔한 열매 위주 사용.*",
+        "lux_title": "고급 레시피",
+        "lux_desc": "*희귀 열매 위주 사용.*",
+        "stats_expand": "필요 조건 보기",
+        "error_msg": "현재 재료로는 만들 수 없습니다.",
+        "slots": "슬롯",
+        "cal": "칼로리",
+        "boost": "레벨 부스트",
+        "all_toggle": "모든 도넛 한 번에 계산",
+        "all_help": "모든 도넛의 경제적/고급 레시피를 한 번에 계산합니다.",
+        "all_col_donut": "도넛",
+        "all_col_possible": "가능",
+        "plan_header": "생산 계획 (모든 도넛, 공유 인벤토리)",
+        "plan_target": "목표 수량",
+        "plan_target_help": "비워 두면 가능한 한 많이 만듭니다.",
+        "plan_button": "생산 계획 세우기",
+        "plan_times": "횟수",
+        "plan_total": "만든 도넛",
+        "plan_none": "현재 재료로는 어떤 도넛도 만들 수 없습니다.",
+        "sched_header": "여러 날 계획 (매일 열매 수확)",
+        "sched_income": "하루 수확량",
+        "sched_days": "계획할 일수",
+        "sched_goal": "목표",
+        "sched_count": "도넛 최대한 많이",
+        "sched_rarity": "희귀 열매 최소 사용 (위의 원하는 수량 제작)",
+        "sched_button": "일정 계획",
+        "sched_day": "일",
+        "sched_none": "이 기간에는 만들 수 있는 것이 없습니다.",
+        "plan_unproven": "탐색 제한 안에서 찾은 최선의 계획이며, 최적이 아닐 수 있습니다.",
+        "index_missing": "현재 카탈로그의 레시피 색인이 필요합니다. `python recipe_index.py`로 만드세요.",
+        "alt_header": "대체 레시피",
+        "alt_mode": "정렬 기준",
+        "alt_k": "레시피 개수",
+        "alt_exclude": "사용하지 않을 나무열매",
+        "alt_limit": "개수를 제한할 나무열매",
+        "alt_limit_n": "제한된 나무열매별 최대 개수",
+        "alt_button": "대체 레시피 보기",
+        "alt_rank": "#",
+        "alt_recipe": "레시피",
+        "alt_none": "이 조건에 맞는 레시피가 없습니다.",
+        "pareto_header": "절충안 (희귀도 vs. 레벨 보너스 vs. 칼로리)",
+        "pareto_help": "여기 있는 레시피는 모두 최선입니다. 같은 레벨 보너스와 칼로리를 주면서 덜 희귀한 나무열매를 쓰는 다른 레시피는 없습니다.",
+        "pareto_button": "절충안 찾기",
+        "pareto_rarity": "희귀도",
+        "pareto_pick": "레시피 선택",
+        "short_header": "만들 수 없는 이유",
+        "short_flavor": "맛",
+        "short_needed": "필요",
+        "short_best": "보유 나무열매로 최대",
+        "short_missing": "부족",
+        "short_total": "모든 맛 합계",
+        "short_joint": "각 맛은 따로는 도달할 수 있지만, 같은 8개의 나무열매로 모두 채울 수는 없습니다.",
+        "farm_header": "다음에 모을 나무열매",
+        "farm_all": "모든 도넛",
+        "farm_button": "분석",
+        "farm_ready": "이 도넛은 이미 만들 수 있습니다.",
+        "farm_collect": "모을 것",
+        "farm_then": "그러면 만들 수 있는 레시피",
+        "farm_rank": "가장 도움이 되는 나무열매 (한 종류 최대 3개 추가)",
+        "farm_extra": "추가",
+        "farm_after": "추가 후 희귀도 (절약)",
+        "farm_gain": "개선",
+        "farm_unlocks": "만들 수 있게 됨",
+        "farm_no_effect": "효과 없음",
+        "farm_impossible": "이 카탈로그의 열매 8개로는 이 도넛을 만들 수 없습니다.",
+        "solve_progress": "계산 중… {elapsed:.1f}초",
+        "solve_nodes": "{nodes:,}개 분기 탐색",
+        "solve_cancel": "취소",
+        "solve_cancelled": "레시피를 찾기 전에 취소되었습니다.",
+        "solve_timeout": "제한 시간 안에 레시피를 찾지 못했습니다. 도넛을 만들 수 없다는 뜻은 아닙니다.",
+        "solve_incumbent": "지금까지 찾은 최선",
+        "solve_incumbent_desc": "최적의 레시피임을 증명하기 전에 탐색이 중단되었습니다.",
+        "solve_gap": "가능한 최선의 레시피와 {gap:.0%} 이내 차이입니다.",
+        "col_name": "열매 이름",
+        "col_inv": "✏️ 수량",
+        "col_inv_help": "가방에 있는 수량을 입력하세요.",
+        "col_sweet": "🔒 단맛",
+        "col_spicy": "🔒 매운맛",
+        "col_sour": "🔒 신맛",
+        "col_bitter": "🔒 쓴맛",
+        "col_fresh": "🔒 떫은맛",
+        "col_boost": "🔒 Lv.+",
+        "col_cal": "🔒 Cal"
+    },
+    "Japanese 🇯🇵": {
+        "title": "🍩 ポケモンレジェンズZ-A ドーナツ計算機",
+        "intro": "伝説のポケモン用のドーナツを作るためのきのみが足りているか確認しましょう。",
+        "hope": "お役に立てば幸いです！",
+        "instructions_header": "使い方:",
+        "step1": "1. 下の表に**持ち物**の数を入力してください (**✏️** の列)。",
+        "step2": "2. 作りたい**ドーナツ**を選んでください。",
+        "step3": "3. **計算する**をクリックしてください。",
+        "select_label": "ドーナツを選択:",
+        "examples_label": "💡 標準レシピを表示 (例)",
+        "examples_col_name": "レシピ名",
+        "examples_col_ing": "材料",
+        "examples_col_ok": "基準を満たす",
+        "curated_title": "定番レシピ",
+        "curated_desc": "*手持ちのきのみですでに作れる定番レシピです。*",
+        "inventory_header": "バッグの中身",
+        "toggle_stats": "ステータスを表示",
+        "toggle_help": "味やカロリーの詳細を表示します。",
+        "calc_button": "レシピを計算",
+        "eco_title": "節約レシピ",
+        "eco_desc": "*手に入りやすいきのみを使用。*",
+        "lux_title": "豪華レシピ",
+        "lux_desc": "*レアなきのみを使用。*",
+        "stats_expand": "必要ステータスを見る",
+        "error_msg": "現在の持ち物では作れません。",
+        "slots": "スロット",
+        "cal": "カロリー",
+        "boost": "Lv.ブースト",
+        "all_toggle": "すべてのドーナツを一括計算",
+        "all_help": "すべてのドーナツの節約・豪華レシピをまとめて計算します。",
+        "all_col_donut": "ドーナツ",
+        "all_col_possible": "作成可能",
+        "plan_header": "生産計画 (全ドーナツ・共有の持ち物)",
+        "plan_target": "目標数",
+        "plan_target_help": "空欄なら作れるだけ作ります。",
+        "plan_button": "生産を計画",
+        "plan_times": "回数",
+        "plan_total": "作れるドーナツ",
+        "plan_none": "現在の持ち物ではどのドーナツも作れません。",
+        "sched_header": "複数日の計画（毎日のきのみ収穫）",
+        "sched_income": "1日の収穫数",
+        "sched_days": "計画する日数",
+        "sched_goal": "目標",
+        "sched_count": "ドーナツをできるだけ多く",
+        "sched_rarity": "レアなきのみを最小限に（上の希望数を作る）",
+        "sched_button": "日程を計画",
+        "sched_day": "日目",
+        "sched_none": "この期間には何も作れません。",
+        "plan_unproven": "探索の制限内で見つかった最良の計画です。最適ではない可能性があります。",
+        "index_missing": "現在のカタログのレシピ索引が必要です。`python recipe_index.py` で作成してください。",
+        "alt_header": "代わりのレシピ",
+        "alt_mode": "並べ替え",
+        "alt_k": "レシピの数",
+        "alt_exclude": "使わないきのみ",
+        "alt_limit": "数を制限するきのみ",
+        "alt_limit_n": "制限したきのみごとの最大数",
+        "alt_button": "代わりのレシピを表示",
+        "alt_rank": "#",
+        "alt_recipe": "レシピ",
+        "alt_none": "この条件に合うレシピはありません。",
+        "pareto_header": "トレードオフ（レア度・レベルボーナス・カロリー）",
+        "pareto_help": "ここにあるレシピはどれも最適です。同じレベルボーナスとカロリーのまま、よりレアでないきのみで作れる別のレシピはありません。",
+        "pareto_button": "トレードオフを探す",
+        "pareto_rarity": "レア度",
+        "pareto_pick": "レシピを選ぶ",
+        "short_header": "作れない理由",
+        "short_flavor": "味",
+        "short_needed": "必要",
+        "short_best": "手持ちのきのみでの最大",
+        "short_missing": "不足",
+        "short_total": "すべての味の合計",
+        "short_joint": "それぞれの味は単独なら届きますが、同じ8個のきのみですべてを満たすことはできません。",
+        "farm_header": "次に集めるきのみ",
+        "farm_all": "すべてのドーナツ",
+        "farm_button": "分析",
+        "farm_ready": "このドーナツはすでに作れます。",
+        "farm_collect": "集めるもの",
+        "farm_then": "そうすれば作れるレシピ",
+        "farm_rank": "役に立つきのみ（1種類につき最大3個追加）",
+        "farm_extra": "追加",
+        "farm_after": "追加後のレア度（節約）",
+        "farm_gain": "改善",
+        "farm_unlocks": "作れるようになる",
+        "farm_no_effect": "効果なし",
+        "farm_impossible": "このカタログのきのみ8個では、このドーナツは作れません。",
+        "solve_progress": "計算中… {elapsed:.1f}秒",
+        "solve_nodes": "{nodes:,}個の分岐を探索",
+        "solve_cancel": "キャンセル",
+        "solve_cancelled": "レシピが見つかる前にキャンセルされました。",
+        "solve_timeout": "制限時間内にレシピが見つかりませんでした。ドーナツが作れないという意味ではありません。",
+        "solve_incumbent": "現時点での最良",
+        "solve_incumbent_desc": "最良のレシピであることを証明する前に探索が終了しました。",
+        "solve_gap": "最良のレシピとの差は{gap:.0%}以内です。",
+        "col_name": "きのみ",
+        "col_inv": "✏️ 所持数",
+        "col_inv_help": "バッグに入っている数を入力。",
+        "col_sweet": "🔒 甘さ",
+        "col_spicy": "🔒 辛さ",
+        "col_sour": "🔒 酸っぱさ",
+        "col_bitter": "🔒 苦さ",
+        "col_fresh": "🔒 渋さ",
+        "col_boost": "🔒 Lv.UP",
+        "col_cal": "🔒 Cal"
+    },
+    "Mandarin 🇨🇳": {
+        "title": "🍩 宝可梦传说 Z-A 甜甜圈计算器",
+        "intro": "检查你是否有足够的树果来制作传说宝可梦的甜甜圈。",
+        "hope": "希望能帮到你！",
+        "instructions_header": "使用说明：",
+        "step1": "1. 在下表中输入你的**库存**数量（**✏️** 列）。",
+        "step2": "2. 选择你要制作的**甜甜圈**。",
+        "step3": "3. 点击**计算**。",
+        "select_label": "选择甜甜圈：",
+        "examples_label": "💡 查看标准配方 (示例)",
+        "examples_col_name": "配方名称",
+        "examples_col_ing": "配料",
+        "examples_col_ok": "满足要求",
+        "curated_title": "标准配方",
+        "curated_desc": "*你的背包已经可以制作的标准配方。*",
+        "inventory_header": "你的库存",
+        "toggle_stats": "显示详细数值",
+        "toggle_help": "查看口味和卡路里详情。",
+        "calc_button": "计算配方",
+        "eco_title": "经济配方",
+        "eco_desc": "*使用常见树果。*",
+        "lux_title": "豪华配方",
+        "lux_desc": "*使用稀有树果。*",
+        "stats_expand": "查看所需数值",
+        "error_msg": "当前库存无法制作。",
+        "slots": "槽位",
+        "cal": "卡路里",
+        "boost": "等级提升",
+        "all_toggle": "一次评估所有甜甜圈",
+        "all_help": "一次性计算所有甜甜圈的经济和豪华配方。",
+        "all_col_donut": "甜甜圈",
+        "all_col_possible": "可制作",
+        "plan_header": "生产计划（所有甜甜圈，共享库存）",
+        "plan_target": "目标数量",
+        "plan_target_help": "留空则尽可能多地制作。",
+        "plan_button": "规划生产",
+        "plan_times": "次数",
+        "plan_total": "可制作甜甜圈",
+        "plan_none": "当前库存无法制作任何甜甜圈。",
+        "sched_header": "多日计划（每日树果收入）",
+        "sched_income": "每天收集",
+        "sched_days": "计划天数",
+        "sched_goal": "目标",
+        "sched_count": "尽量多的甜甜圈",
+        "sched_rarity": "尽量少用稀有树果（制作上方的需求数量）",
+        "sched_button": "制定日程",
+        "sched_day": "天",
+        "sched_none": "这段时间内无法制作任何东西。",
+        "plan_unproven": "在搜索限制内找到的最佳计划，可能不是最优。",
+        "index_missing": "需要当前数据集的配方索引。请运行 `python recipe_index.py` 生成。",
+        "alt_header": "备选配方",
+        "alt_mode": "排序方式",
+        "alt_k": "配方数量",
+        "alt_exclude": "不使用这些树果",
+        "alt_limit": "限制这些树果",
+        "alt_limit_n": "每种受限树果最多使用数量",
+        "alt_button": "显示备选配方",
+        "alt_rank": "#",
+        "alt_recipe": "配方",
+        "alt_none": "没有符合这些条件的配方。",
+        "pareto_header": "权衡（稀有度 vs. 等级加成 vs. 卡路里）",
+        "pareto_help": "这里的每个配方都无法被超越：没有其他配方能用更不稀有的树果，同时提供至少相同的等级加成和卡路里。",
+        "pareto_button": "查找权衡方案",
+        "pareto_rarity": "稀有度",
+        "pareto_pick": "选择配方",
+        "short_header": "无法制作的原因",
+        "short_flavor": "口味",
+        "short_needed": "需要",
+        "short_best": "现有树果最多可达",
+        "short_missing": "缺少",
+        "short_total": "所有口味合计",
+        "short_joint": "每种口味单独都能达到，但无法用同样的 8 个树果同时满足。",
+        "farm_header": "接下来收集什么",
+        "farm_all": "所有甜甜圈",
+        "farm_button": "分析",
+        "farm_ready": "你已经可以制作这个甜甜圈。",
+        "farm_collect": "需要收集",
+        "farm_then": "之后可以制作",
+        "farm_rank": "最有帮助的树果（单种最多多收集 3 个）",
+        "farm_extra": "增加",
+        "farm_after": "之后的稀有度（经济）",
+        "farm_gain": "改善",
+        "farm_unlocks": "变为可制作",
+        "farm_no_effect": "无效果",
+        "farm_impossible": "本数据集中任意 8 个树果都无法制作这个甜甜圈。",
+        "solve_progress": "计算中… {elapsed:.1f} 秒",
+        "solve_nodes": "已搜索 {nodes:,} 个分支",
+        "solve_cancel": "取消",
+        "solve_cancelled": "在找到配方之前已取消。",
+        "solve_timeout": "在时间限制内未找到配方。这并不意味着无法制作该甜甜圈。",
+        "solve_incumbent": "目前找到的最佳",
+        "solve_incumbent_desc": "搜索在证明这是最佳配方之前就停止了。",
+        "solve_gap": "与最佳配方相差不超过 {gap:.0%}。",
+        "col_name": "树果名称",
+        "col_inv": "✏️ 数量",
+        "col_inv_help": "输入背包中的数量。",
+        "col_sweet": "🔒 甜",
+        "col_spicy": "🔒 辣",
+        "col_sour": "🔒 酸",
+        "col_bitter": "🔒 苦",
+        "col_fresh": "🔒 涩",
+        "col_boost": "🔒 Lv.+",
+        "col_cal": "🔒 Cal"
+    }
+}